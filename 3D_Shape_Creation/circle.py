@@ -1,30 +1,40 @@
 import matplotlib.pyplot as plt
-import numpy as np
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
+import os
+import sys
 
-def calculate_3d_sphere_surface(center_x, center_y, center_z, radius, num_points=50):
-    phi = np.linspace(0, 2 * np.pi, num_points)  # Azimuthal angle (0 to 2*pi)
-    theta = np.linspace(0, np.pi, num_points)    # Polar angle (0 to pi)
-    phi, theta = np.meshgrid(phi, theta)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rendering.sphere_mesh import select_lod, sphere_mesh, uv_lods, uv_sphere_edges
 
-    x = center_x + radius * np.sin(theta) * np.cos(phi)
-    y = center_y + radius * np.sin(theta) * np.sin(phi)
-    z = center_z + radius * np.cos(theta)
-    
-    return x, y, z
+#about how many pixels the sphere's radius covers in the plot and the longest wireframe edge wanted
+screen_radius = 300
+max_edge_pixels = 60
+
+def calculate_3d_sphere_surface(center_x, center_y, center_z, radius):
+    # Cached unit UV sphere at the level of detail the plot needs, scaled and moved into place,
+    # and its ring and meridian edges
+    lod = select_lod(screen_radius, max_edge_pixels=max_edge_pixels)
+    vertices, _ = sphere_mesh((center_x, center_y, center_z), radius, lod)
+    return vertices, uv_sphere_edges(uv_lods[lod])
 
-def plot_3d_sphere_wireframe(x_coords, y_coords, z_coords):
+def plot_3d_sphere_wireframe(vertices, edges):
    
     fig = plt.figure(figsize=(10, 10))
     ax = fig.add_subplot(111, projection='3d')
 
-    ax.plot_wireframe(x_coords, y_coords, z_coords, color='blue') # Changed to plot_wireframe
+    # Rings and meridians like plot_wireframe, every edge drawn once
+    ax.add_collection3d(Line3DCollection(vertices[edges], colors='blue', linewidths=1))
     
     ax.set_title("3D Wireframe Sphere Plot")
     ax.set_xlabel("X-axis")
     ax.set_ylabel("Y-axis")
     ax.set_zlabel("Z-axis")
 
-    ax.set_box_aspect([np.ptp(x_coords), np.ptp(y_coords), np.ptp(z_coords)])
+    min_coords, max_coords = vertices.min(axis=0), vertices.max(axis=0)
+    ax.set_xlim(min_coords[0], max_coords[0])
+    ax.set_ylim(min_coords[1], max_coords[1])
+    ax.set_zlim(min_coords[2], max_coords[2])
+    ax.set_box_aspect(max_coords - min_coords)
     plt.show()
 
 
@@ -32,8 +42,8 @@ def plot_3d_sphere_wireframe(x_coords, y_coords, z_coords):
 center_x, center_y, center_z = map(float, input("Enter the coordinates of the center (x, y, z): ").split())
 radius = float(input("Enter the radius of the sphere: "))
        
-x, y, z = calculate_3d_sphere_surface(center_x, center_y, center_z, radius)
+vertices, edges = calculate_3d_sphere_surface(center_x, center_y, center_z, radius)
         
-plot_3d_sphere_wireframe(x, y, z)
+plot_3d_sphere_wireframe(vertices, edges)
         
     
\ No newline at end of file
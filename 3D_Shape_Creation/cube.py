@@ -2,6 +2,16 @@ import matplotlib.pyplot as plt
 import numpy as np
 from mpl_toolkits.mplot3d.art3d import Poly3DCollection
 from itertools import product
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rendering.transform3d import (apply_transform, rotation_matrix, scaling_matrix,
+                                   shearing_matrix, translation_matrix)
+from rendering.rasterizer import mesh_figure
+
+#"matplotlib" draws with Poly3DCollection, "raster" with the NumPy z-buffer rasterizer (--raster)
+renderer = "raster" if "--raster" in sys.argv else "matplotlib"
 
 def calculate_cube_vertices(center_x, center_y, center_z, side_length):
     half_side = side_length / 2.0
@@ -11,56 +21,19 @@ def calculate_cube_vertices(center_x, center_y, center_z, side_length):
     vertices = vertices_relative + center_offset
     return vertices
 
-#keep the center same only increase the sice of cube according to input
+#keep the center same only increase the sice of cube
 def translate_cube(vertices, tx, ty, tz):
-    translation_vector = np.array([tx, ty, tz])
-    translated_vertices = vertices + translation_vector
-    return translated_vertices
+    return apply_transform(translation_matrix(tx, ty, tz), vertices)
 
 #center will be same only increase the size of cube
 def scale_cube(vertices, center_x, center_y, center_z, scale_factor):
-    center = np.array([center_x, center_y, center_z])
-    scaled_vertices = center + (vertices - center) * scale_factor
-    return scaled_vertices
+    return apply_transform(scaling_matrix(scale_factor, center=(center_x, center_y, center_z)), vertices)
 
 def rotate_cube(vertices, center_x, center_y, center_z, axis, angle_degrees):
-    angle_radians = np.radians(angle_degrees)
-    center = np.array([center_x, center_y, center_z])
-    translated_vertices = vertices - center
-
-    if axis == 'x':
-        rotation_matrix = np.array([
-            [1, 0, 0],
-            [0, np.cos(angle_radians), -np.sin(angle_radians)],
-            [0, np.sin(angle_radians), np.cos(angle_radians)]
-        ])
-    elif axis == 'y':
-        rotation_matrix = np.array([
-            [np.cos(angle_radians), 0, np.sin(angle_radians)],
-            [0, 1, 0],
-            [-np.sin(angle_radians), 0, np.cos(angle_radians)]
-        ])
-    elif axis == 'z':
-        rotation_matrix = np.array([
-            [np.cos(angle_radians), -np.sin(angle_radians), 0],
-            [np.sin(angle_radians), np.cos(angle_radians), 0],
-            [0, 0, 1]
-        ])
-    else:
-        raise ValueError("Axis must be 'x', 'y', or 'z'.")
-
-    rotated_vertices = translated_vertices.dot(rotation_matrix.T)
-    final_vertices = rotated_vertices + center
-    return final_vertices
+    return apply_transform(rotation_matrix(axis, angle_degrees, center=(center_x, center_y, center_z)), vertices)
 
 def shearing_cube(vertices, shear_xy=0, shear_xz=0, shear_yx=0, shear_yz=0, shear_zx=0, shear_zy=0):
-    shearing_matrix = np.array([
-        [1, shear_xy, shear_xz],
-        [shear_yx, 1, shear_yz],
-        [shear_zx, shear_zy, 1]
-    ])
-    sheared_vertices = vertices.dot(shearing_matrix.T)
-    return sheared_vertices
+    return apply_transform(shearing_matrix(shear_xy, shear_xz, shear_yx, shear_yz, shear_zx, shear_zy), vertices)
 
 
 
@@ -74,6 +47,11 @@ def plot_cube(vertices):
         [0, 2, 6, 4],  # Left face
         [1, 3, 7, 5]   # Right face
     ]
+    if renderer == "raster":
+        mesh_figure([dict(vertices=vertices, faces=faces_indices, color='lightcoral', edge_color='black',
+                          point_color='blue')], "3D Cube Plot")
+        plt.show(block=False)
+        return
     cube_faces = [vertices[face_idx] for face_idx in faces_indices]
 
     fig = plt.figure(figsize=(10, 10))
@@ -111,6 +89,16 @@ def plot_two_cubes(original_vertices, updated_vertices):
         [1, 3, 7, 5]   # Right face
     ]
 
+    if renderer == "raster":
+        mesh_figure([dict(vertices=original_vertices, faces=faces_indices, color='lightblue', edge_color='blue',
+                          point_color='blue'),
+                     dict(vertices=updated_vertices, faces=faces_indices, color='lightcoral', edge_color='red',
+                          point_color='red')],
+                    "Original (blue) and Updated (red) Cubes")
+        plt.show(block=False)
+        plt.pause(0.001)
+        return
+
     fig = plt.figure(figsize=(10, 10))
     ax = fig.add_subplot(111, projection='3d')
 
@@ -148,53 +136,54 @@ def plot_two_cubes(original_vertices, updated_vertices):
     plt.pause(0.001)
 
 
-center_x, center_y, center_z = map(float, input("Enter cube center coordinates (x, y, z): ").split())
-side_length = float(input("Enter the side length of the cube: "))
-
-vertices = calculate_cube_vertices(center_x, center_y, center_z, side_length)
-plot_cube(vertices)
-
-original_vertices = calculate_cube_vertices(center_x, center_y, center_z, side_length)
-current_vertices = original_vertices.copy()
-
-
-print('1 :- Translation')
-print('2 :- Scaling')
-print('3 :- Rotation')
-print('4 :- Shearing')
-print('5 :- Exit')
-
-choice = int(input("Enter your choice: "))
-while choice != 5:
-    if choice == 1:
-        tx, ty, tz = map(float, input("Enter translation distances (tx, ty, tz): ").split())
-        translated_current_vertices = translate_cube(current_vertices, tx, ty, tz)
-        plot_two_cubes(original_vertices, translated_current_vertices)
-    elif choice == 2:
-        scale_factor = float(input("Enter scaling factor: "))
-        scaled_current_vertices = scale_cube(current_vertices, center_x, center_y, center_z, scale_factor)
-        plot_two_cubes(original_vertices, scaled_current_vertices)
-    elif choice == 3:
-        axis = input("Enter rotation axis (x, y, or z): ").lower()
-        angle_degrees = float(input("Enter rotation angle in degrees: "))
-        rotated_current_vertices = rotate_cube(current_vertices, center_x, center_y, center_z, axis, angle_degrees)
-        plot_two_cubes(original_vertices, rotated_current_vertices)
-    elif choice == 4:
-        shear_xy = float(input("Enter shear factor for XY plane: "))
-        shear_xz = float(input("Enter shear factor for XZ plane: "))
-        shear_yx = float(input("Enter shear factor for YX plane: "))
-        shear_yz = float(input("Enter shear factor for YZ plane: "))
-        shear_zx = float(input("Enter shear factor for ZX plane: "))
-        shear_zy = float(input("Enter shear factor for ZY plane: "))
-        sheared_current_vertices = shearing_cube(current_vertices, shear_xy, shear_xz, shear_yx, shear_yz, shear_zx, shear_zy)
-        plot_two_cubes(original_vertices, sheared_current_vertices)
-    else:
-        print("Invalid choice. Please try again.")
-    
+if __name__ == "__main__":
+    center_x, center_y, center_z = map(float, input("Enter cube center coordinates (x, y, z): ").split())
+    side_length = float(input("Enter the side length of the cube: "))
+
+    vertices = calculate_cube_vertices(center_x, center_y, center_z, side_length)
+    plot_cube(vertices)
+
+    original_vertices = calculate_cube_vertices(center_x, center_y, center_z, side_length)
+    current_vertices = original_vertices.copy()
+
+
     print('1 :- Translation')
     print('2 :- Scaling')
     print('3 :- Rotation')
-    print('4 :- Exit')
+    print('4 :- Shearing')
+    print('5 :- Exit')
+
     choice = int(input("Enter your choice: "))
+    while choice != 5:
+        if choice == 1:
+            tx, ty, tz = map(float, input("Enter translation distances (tx, ty, tz): ").split())
+            translated_current_vertices = translate_cube(current_vertices, tx, ty, tz)
+            plot_two_cubes(original_vertices, translated_current_vertices)
+        elif choice == 2:
+            scale_factor = float(input("Enter scaling factor: "))
+            scaled_current_vertices = scale_cube(current_vertices, center_x, center_y, center_z, scale_factor)
+            plot_two_cubes(original_vertices, scaled_current_vertices)
+        elif choice == 3:
+            axis = input("Enter rotation axis (x, y, or z): ").lower()
+            angle_degrees = float(input("Enter rotation angle in degrees: "))
+            rotated_current_vertices = rotate_cube(current_vertices, center_x, center_y, center_z, axis, angle_degrees)
+            plot_two_cubes(original_vertices, rotated_current_vertices)
+        elif choice == 4:
+            shear_xy = float(input("Enter shear factor for XY plane: "))
+            shear_xz = float(input("Enter shear factor for XZ plane: "))
+            shear_yx = float(input("Enter shear factor for YX plane: "))
+            shear_yz = float(input("Enter shear factor for YZ plane: "))
+            shear_zx = float(input("Enter shear factor for ZX plane: "))
+            shear_zy = float(input("Enter shear factor for ZY plane: "))
+            sheared_current_vertices = shearing_cube(current_vertices, shear_xy, shear_xz, shear_yx, shear_yz, shear_zx, shear_zy)
+            plot_two_cubes(original_vertices, sheared_current_vertices)
+        else:
+            print("Invalid choice. Please try again.")
+    
+        print('1 :- Translation')
+        print('2 :- Scaling')
+        print('3 :- Rotation')
+        print('4 :- Exit')
+        choice = int(input("Enter your choice: "))
 
-plt.show()  # Hold final plot window open
\ No newline at end of file
+    plt.show()  # Hold final plot window open
\ No newline at end of file
@@ -1,5 +1,10 @@
 import matplotlib.pyplot as plt
-import numpy as np
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rendering.sphere_mesh import select_lod, sphere_mesh, uv_lods, uv_sphere_edges
 
 def plot_3d_sphere(ax, center, radius):
     """
@@ -10,15 +15,15 @@ def plot_3d_sphere(ax, center, radius):
         center (tuple): The (x, y, z) coordinates of the sphere's center.
         radius (float): The radius of the sphere.
     """
-    # Create the mesh for the sphere surface
-    u = np.linspace(0, 2 * np.pi, 50)
-    v = np.linspace(0, np.pi, 50)
-    x = radius * np.outer(np.cos(u), np.sin(v)) + center[0]
-    y = radius * np.outer(np.sin(u), np.sin(v)) + center[1]
-    z = radius * np.outer(np.ones(np.size(u)), np.cos(v)) + center[2]
+    # Create the mesh for the sphere surface, detailed enough for its size on screen
+    # (the sphere spans about 60% of the axes)
+    screen_radius = 0.3 * min(ax.bbox.width, ax.bbox.height)
+    lod = select_lod(screen_radius, max_edge_pixels=60)
+    vertices, _ = sphere_mesh(center, radius, lod)
 
-    # Plot the sphere wireframe
-    ax.plot_wireframe(x, y, z, color='b', alpha=0.5)
+    # Plot the sphere wireframe, its rings and meridians once each
+    ax.add_collection3d(Line3DCollection(vertices[uv_sphere_edges(uv_lods[lod])], colors='b', alpha=0.5))
+    ax.auto_scale_xyz(vertices[:, 0], vertices[:, 1], vertices[:, 2])
 
 def main():
     # Setup the figure and 3D axes
@@ -1,6 +1,14 @@
 import matplotlib.pyplot as plt
 import numpy as np
 from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rendering.rasterizer import mesh_figure
+
+#"matplotlib" draws with Poly3DCollection, "raster" with the NumPy z-buffer rasterizer (--raster)
+renderer = "raster" if "--raster" in sys.argv else "matplotlib"
 
 def plot_3d_pyramid(base_center_x, base_center_y, base_z, base_side_length, apex_z):
     """
@@ -37,6 +45,13 @@ def plot_3d_pyramid(base_center_x, base_center_y, base_z, base_side_length, apex
         [vertices[0], vertices[1], vertices[2], vertices[3]] # Base (v1, v2, v3, v4)
     ]
 
+    if renderer == "raster":
+        faces_indices = [[0, 1, 4], [1, 2, 4], [2, 3, 4], [3, 0, 4], [0, 1, 2, 3]]
+        mesh_figure([dict(vertices=vertices, faces=faces_indices, color='purple', edge_color='black',
+                          point_color='blue')], "3D Pyramid Plot")
+        plt.show()
+        return
+
     # Create the figure and a 3D axes object
     fig = plt.figure(figsize=(10, 10))
     ax = fig.add_subplot(111, projection='3d')
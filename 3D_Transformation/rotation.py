@@ -4,6 +4,15 @@ import matplotlib.pyplot as plt
 import numpy as np
 from mpl_toolkits.mplot3d import Axes3D
 from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rendering.transform3d import apply_transform, rotation_matrix
+from rendering.rasterizer import mesh_figure
+
+#"matplotlib" draws with Poly3DCollection, "raster" with the NumPy z-buffer rasterizer (--raster)
+renderer = "raster" if "--raster" in sys.argv else "matplotlib"
 
 def create_square_vertices(center_x, center_y, center_z, side_length):
     """
@@ -51,41 +60,9 @@ def rotate_cube(vertices, center_x, center_y, center_z, axis, angle_degrees):
     Returns:
         numpy.ndarray: Rotated vertices.
     """
-    angle_radians = np.radians(angle_degrees)
-    center = np.array([center_x, center_y, center_z])
-    
-    # Translate vertices to origin (center becomes 0,0,0)
-    translated_vertices = vertices - center
-    
-    # Create rotation matrix based on axis
-    if axis.lower() == 'x':
-        rotation_matrix = np.array([
-            [1, 0, 0],
-            [0, np.cos(angle_radians), -np.sin(angle_radians)],
-            [0, np.sin(angle_radians), np.cos(angle_radians)]
-        ])
-    elif axis.lower() == 'y':
-        rotation_matrix = np.array([
-            [np.cos(angle_radians), 0, np.sin(angle_radians)],
-            [0, 1, 0],
-            [-np.sin(angle_radians), 0, np.cos(angle_radians)]
-        ])
-    elif axis.lower() == 'z':
-        rotation_matrix = np.array([
-            [np.cos(angle_radians), -np.sin(angle_radians), 0],
-            [np.sin(angle_radians), np.cos(angle_radians), 0],
-            [0, 0, 1]
-        ])
-    else:
-        raise ValueError("Axis must be 'x', 'y', or 'z'.")
-    
-    # Apply rotation
-    rotated_vertices = translated_vertices.dot(rotation_matrix.T)
-    
-    # Translate back to original center
-    final_vertices = rotated_vertices + center
-    
-    return final_vertices
+    # Rotate about the center as one homogeneous transform
+    matrix = rotation_matrix(axis, angle_degrees, center=(center_x, center_y, center_z))
+    return apply_transform(matrix, vertices)
 
 def plot_cube(vertices, color='lightblue', alpha=0.6, edge_color='blue', title="3D Cube"):
     """
@@ -98,9 +75,6 @@ def plot_cube(vertices, color='lightblue', alpha=0.6, edge_color='blue', title="
         edge_color (str): Color of the edges.
         title (str): Title for the plot.
     """
-    fig = plt.figure(figsize=(10, 8))
-    ax = fig.add_subplot(111, projection='3d')
-    
     # Define the 6 faces of the cube using vertex indices
     faces_indices = [
         [0, 1, 2, 3],  # Bottom face
@@ -110,6 +84,16 @@ def plot_cube(vertices, color='lightblue', alpha=0.6, edge_color='blue', title="
         [0, 3, 7, 4],  # Left face
         [1, 2, 6, 5]   # Right face
     ]
+
+    if renderer == "raster":
+        mesh_figure([dict(vertices=vertices, faces=faces_indices, color=color, edge_color=edge_color,
+                          point_color='red')], title)
+        plt.show(block=False)
+        plt.pause(0.001)
+        return
+
+    fig = plt.figure(figsize=(10, 8))
+    ax = fig.add_subplot(111, projection='3d')
     
     # Create cube faces using the vertices
     cube_faces = [vertices[face_idx] for face_idx in faces_indices]
@@ -153,9 +137,6 @@ def plot_comparison(original_vertices, rotated_vertices):
         original_vertices (numpy.ndarray): Original cube vertices.
         rotated_vertices (numpy.ndarray): Rotated cube vertices.
     """
-    fig = plt.figure(figsize=(12, 10))
-    ax = fig.add_subplot(111, projection='3d')
-    
     # Define the 6 faces of the cube using vertex indices
     faces_indices = [
         [0, 1, 2, 3],  # Bottom face
@@ -165,6 +146,19 @@ def plot_comparison(original_vertices, rotated_vertices):
         [0, 3, 7, 4],  # Left face
         [1, 2, 6, 5]   # Right face
     ]
+
+    if renderer == "raster":
+        mesh_figure([dict(vertices=original_vertices, faces=faces_indices, color='lightblue', edge_color='blue',
+                          point_color='blue'),
+                     dict(vertices=rotated_vertices, faces=faces_indices, color='lightcoral', edge_color='red',
+                          point_color='red')],
+                    '3D Rotation Comparison: Original (Blue) vs Rotated (Red)')
+        plt.show(block=False)
+        plt.pause(0.001)
+        return
+
+    fig = plt.figure(figsize=(12, 10))
+    ax = fig.add_subplot(111, projection='3d')
     
     # Original cube (lighter/transparent)
     original_faces = [original_vertices[face_idx] for face_idx in faces_indices]
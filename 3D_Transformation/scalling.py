@@ -4,6 +4,15 @@ import matplotlib.pyplot as plt
 import numpy as np
 from mpl_toolkits.mplot3d import Axes3D
 from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rendering.transform3d import apply_transform, scaling_matrix
+from rendering.rasterizer import mesh_figure
+
+#"matplotlib" draws with Poly3DCollection, "raster" with the NumPy z-buffer rasterizer (--raster)
+renderer = "raster" if "--raster" in sys.argv else "matplotlib"
 
 def create_square_vertices(center_x, center_y, center_z, side_length):
     """
@@ -50,12 +59,9 @@ def scale_cube_uniform(vertices, center_x, center_y, center_z, scale_factor):
     Returns:
         numpy.ndarray: Scaled vertices.
     """
-    center = np.array([center_x, center_y, center_z])
-    
-    # Translate to origin, scale, then translate back
-    scaled_vertices = center + (vertices - center) * scale_factor
-    
-    return scaled_vertices
+    # Scale about the center as one homogeneous transform
+    matrix = scaling_matrix(scale_factor, center=(center_x, center_y, center_z))
+    return apply_transform(matrix, vertices)
 
 def scale_cube_non_uniform(vertices, center_x, center_y, center_z, sx, sy, sz):
     """
@@ -73,19 +79,9 @@ def scale_cube_non_uniform(vertices, center_x, center_y, center_z, sx, sy, sz):
     Returns:
         numpy.ndarray: Scaled vertices.
     """
-    center = np.array([center_x, center_y, center_z])
-    scale_factors = np.array([sx, sy, sz])
-    
-    # Translate to origin
-    translated_vertices = vertices - center
-    
-    # Apply non-uniform scaling
-    scaled_vertices = translated_vertices * scale_factors
-    
-    # Translate back to original center
-    final_vertices = scaled_vertices + center
-    
-    return final_vertices
+    # Scale about the center as one homogeneous transform
+    matrix = scaling_matrix(sx, sy, sz, center=(center_x, center_y, center_z))
+    return apply_transform(matrix, vertices)
 
 def plot_cube(vertices, color='lightblue', alpha=0.6, edge_color='blue', title="3D Cube"):
     """
@@ -98,9 +94,6 @@ def plot_cube(vertices, color='lightblue', alpha=0.6, edge_color='blue', title="
         edge_color (str): Color of the edges.
         title (str): Title for the plot.
     """
-    fig = plt.figure(figsize=(10, 8))
-    ax = fig.add_subplot(111, projection='3d')
-    
     # Define the 6 faces of the cube using vertex indices
     faces_indices = [
         [0, 1, 2, 3],  # Bottom face
@@ -110,6 +103,16 @@ def plot_cube(vertices, color='lightblue', alpha=0.6, edge_color='blue', title="
         [0, 3, 7, 4],  # Left face
         [1, 2, 6, 5]   # Right face
     ]
+
+    if renderer == "raster":
+        mesh_figure([dict(vertices=vertices, faces=faces_indices, color=color, edge_color=edge_color,
+                          point_color='red')], title)
+        plt.show(block=False)
+        plt.pause(0.001)
+        return
+
+    fig = plt.figure(figsize=(10, 8))
+    ax = fig.add_subplot(111, projection='3d')
     
     # Create cube faces using the vertices
     cube_faces = [vertices[face_idx] for face_idx in faces_indices]
@@ -154,9 +157,6 @@ def plot_comparison(original_vertices, scaled_vertices, scaling_type="Scaled"):
         scaled_vertices (numpy.ndarray): Scaled cube vertices.
         scaling_type (str): Type of scaling performed for title.
     """
-    fig = plt.figure(figsize=(12, 10))
-    ax = fig.add_subplot(111, projection='3d')
-    
     # Define the 6 faces of the cube using vertex indices
     faces_indices = [
         [0, 1, 2, 3],  # Bottom face
@@ -166,6 +166,19 @@ def plot_comparison(original_vertices, scaled_vertices, scaling_type="Scaled"):
         [0, 3, 7, 4],  # Left face
         [1, 2, 6, 5]   # Right face
     ]
+
+    if renderer == "raster":
+        mesh_figure([dict(vertices=original_vertices, faces=faces_indices, color='lightblue', edge_color='blue',
+                          point_color='blue'),
+                     dict(vertices=scaled_vertices, faces=faces_indices, color='lightgreen', edge_color='green',
+                          point_color='red')],
+                    f'3D Scaling Comparison: Original (Blue) vs {scaling_type} (Green)')
+        plt.show(block=False)
+        plt.pause(0.001)
+        return
+
+    fig = plt.figure(figsize=(12, 10))
+    ax = fig.add_subplot(111, projection='3d')
     
     # Original cube (lighter/transparent)
     original_faces = [original_vertices[face_idx] for face_idx in faces_indices]
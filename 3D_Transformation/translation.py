@@ -4,6 +4,15 @@ import matplotlib.pyplot as plt
 import numpy as np
 from mpl_toolkits.mplot3d import Axes3D
 from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rendering.transform3d import apply_transform, translation_matrix
+from rendering.rasterizer import mesh_figure
+
+#"matplotlib" draws with Poly3DCollection, "raster" with the NumPy z-buffer rasterizer (--raster)
+renderer = "raster" if "--raster" in sys.argv else "matplotlib"
 
 def create_square_vertices(center_x, center_y, center_z, side_length):
     """
@@ -49,9 +58,7 @@ def translate_square(vertices, tx, ty, tz):
     Returns:
         numpy.ndarray: Translated vertices.
     """
-    translation_vector = np.array([tx, ty, tz])
-    translated_vertices = vertices + translation_vector
-    return translated_vertices
+    return apply_transform(translation_matrix(tx, ty, tz), vertices)
 
 def plot_square(vertices, color='lightblue', alpha=0.6, edge_color='blue', title="3D Cube"):
     """
@@ -64,9 +71,6 @@ def plot_square(vertices, color='lightblue', alpha=0.6, edge_color='blue', title
         edge_color (str): Color of the edges.
         title (str): Title for the plot.
     """
-    fig = plt.figure(figsize=(10, 8))
-    ax = fig.add_subplot(111, projection='3d')
-    
     # Define the 6 faces of the cube using vertex indices
     faces_indices = [
         [0, 1, 2, 3],  # Bottom face
@@ -76,6 +80,16 @@ def plot_square(vertices, color='lightblue', alpha=0.6, edge_color='blue', title
         [0, 3, 7, 4],  # Left face
         [1, 2, 6, 5]   # Right face
     ]
+
+    if renderer == "raster":
+        mesh_figure([dict(vertices=vertices, faces=faces_indices, color=color, edge_color=edge_color,
+                          point_color='red')], title)
+        plt.show(block=False)
+        plt.pause(0.001)
+        return
+
+    fig = plt.figure(figsize=(10, 8))
+    ax = fig.add_subplot(111, projection='3d')
     
     # Create cube faces using the vertices
     cube_faces = [vertices[face_idx] for face_idx in faces_indices]
@@ -119,9 +133,6 @@ def plot_comparison(original_vertices, translated_vertices):
         original_vertices (numpy.ndarray): Original cube vertices.
         translated_vertices (numpy.ndarray): Translated cube vertices.
     """
-    fig = plt.figure(figsize=(12, 10))
-    ax = fig.add_subplot(111, projection='3d')
-    
     # Define the 6 faces of the cube using vertex indices
     faces_indices = [
         [0, 1, 2, 3],  # Bottom face
@@ -131,6 +142,19 @@ def plot_comparison(original_vertices, translated_vertices):
         [0, 3, 7, 4],  # Left face
         [1, 2, 6, 5]   # Right face
     ]
+
+    if renderer == "raster":
+        mesh_figure([dict(vertices=original_vertices, faces=faces_indices, color='lightblue', edge_color='blue',
+                          point_color='blue'),
+                     dict(vertices=translated_vertices, faces=faces_indices, color='lightcoral', edge_color='red',
+                          point_color='red')],
+                    '3D Translation Comparison: Original (Blue) vs Translated (Red)')
+        plt.show(block=False)
+        plt.pause(0.001)
+        return
+
+    fig = plt.figure(figsize=(12, 10))
+    ax = fig.add_subplot(111, projection='3d')
     
     # Original cube (lighter/transparent)
     original_faces = [original_vertices[face_idx] for face_idx in faces_indices]
@@ -1,4 +1,5 @@
 import matplotlib.pyplot as plot
+import numpy as np
 
 def dda_line(x1, y1, x2, y2):
     dx = x2 - x1
@@ -18,23 +19,87 @@ def dda_line(x1, y1, x2, y2):
     
     return points
 
-x1, y1, x2, y2 = input("Enter the coordinates (x1, y1, x2, y2): ").split()
-x1, y1, x2, y2 = map(int, (x1, y1, x2, y2))
+#rounding rules for the vectorized DDA, half_even matches python's round()
+rounding_rules = {
+    "half_even": np.rint,
+    "half_up": lambda v: np.floor(v + 0.5),
+    "half_away": lambda v: np.sign(v) * np.floor(np.abs(v) + 0.5),
+    "floor": np.floor,
+}
 
-dda_points = dda_line(x1, y1, x2, y2)
+def _round_points(values, rounding):
+    if rounding not in rounding_rules:
+        raise ValueError(f"Rounding must be one of {', '.join(rounding_rules)}.")
+    return rounding_rules[rounding](values).astype(np.int64)
 
-for point in dda_points:
-    plot.plot(point[0], point[1], 'ro')
+def dda_line_vectorized(x1, y1, x2, y2, rounding="half_even"):
+    """
+    Closed-form DDA: point i is (x1 + i*x_inc, y1 + i*y_inc), computed for all
+    steps + 1 points at once so no error accumulates along the line.
+    Returns an (steps + 1, 2) integer array.
+    """
+    dx = x2 - x1
+    dy = y2 - y1
+    steps = int(max(abs(dx), abs(dy)))
+
+    i = np.arange(steps + 1, dtype=np.float64)
+    points = np.empty((steps + 1, 2))
+    if steps == 0:
+        points[:] = (x1, y1)
+    else:
+        points[:, 0] = x1 + i * (dx / steps)
+        points[:, 1] = y1 + i * (dy / steps)
+
+    return _round_points(points, rounding)
+
+def dda_lines_batch(lines, rounding="half_even"):
+    """
+    Vectorized DDA for an (N, 4) array of lines (x1, y1, x2, y2).
+    Returns (points, offsets) where the points of line i are points[offsets[i]:offsets[i + 1]].
+    """
+    lines = np.asarray(lines, dtype=np.float64).reshape(-1, 4)
+    x1, y1, x2, y2 = lines.T
+    dx = x2 - x1
+    dy = y2 - y1
+    steps = np.maximum(np.abs(dx), np.abs(dy)).astype(np.int64)
+
+    counts = steps + 1
+    offsets = np.zeros(len(lines) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    total = int(offsets[-1])
+
+    # Step index within each line, restarting from 0 at every line start
+    i = np.ones(total, dtype=np.int64)
+    if total:
+        i[0] = 0
+        i[offsets[1:-1]] = -steps[:-1]
+    np.cumsum(i, out=i)
+
+    divisor = np.maximum(steps, 1)
+    points = np.empty((total, 2))
+    points[:, 0] = np.repeat(x1, counts) + i * np.repeat(dx / divisor, counts)
+    points[:, 1] = np.repeat(y1, counts) + i * np.repeat(dy / divisor, counts)
+
+    return _round_points(points, rounding), offsets
+
+if __name__ == "__main__":
+    x1, y1, x2, y2 = input("Enter the coordinates (x1, y1, x2, y2): ").split()
+    x1, y1, x2, y2 = map(int, (x1, y1, x2, y2))
+
+    dda_points = dda_line(x1, y1, x2, y2)
+
+    for point in dda_points:
+        plot.plot(point[0], point[1], 'ro')
 
-plot.xlim(min(x1, x2) - 1, max(x1, x2) + 1)
-plot.ylim(min(y1, y2) - 1, max(y1, y2) + 1)
-plot.axhline(0, color='black',linewidth=0.5, ls='--')
-plot.axvline(0, color='black',linewidth=0.5, ls='--')
-plot.grid(color = 'gray', linestyle = '--', linewidth = 0.5)
-plot.plot(*zip(*dda_points), marker='o', color='b', markersize=3, linewidth=1)
+    plot.xlim(min(x1, x2) - 1, max(x1, x2) + 1)
+    plot.ylim(min(y1, y2) - 1, max(y1, y2) + 1)
+    plot.axhline(0, color='black',linewidth=0.5, ls='--')
+    plot.axvline(0, color='black',linewidth=0.5, ls='--')
+    plot.grid(color = 'gray', linestyle = '--', linewidth = 0.5)
+    plot.plot(*zip(*dda_points), marker='o', color='b', markersize=3, linewidth=1)
 
-plot.title("DDA Line Drawing Algorithm")
-plot.xlabel("X-axis")
-plot.ylabel("Y-axis")
-plot.grid()
-plot.show()
\ No newline at end of file
+    plot.title("DDA Line Drawing Algorithm")
+    plot.xlabel("X-axis")
+    plot.ylabel("Y-axis")
+    plot.grid()
+    plot.show()
\ No newline at end of file
@@ -1,35 +1,21 @@
 import matplotlib.pyplot as plt
 import numpy as np
 import turtle
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rendering.circle_engine import circle_points
+from rendering.framebuffer import Framebuffer
+from rendering.scanline_fill import fill_polygon
 
 
 
 
 def Besherman_circle(x_center, y_center, radius):
-    points = []
-    x = 0
-    y = radius 
-    d = 3 - (2 * radius) 
-
-    while x <= y: 
-       
-        points.append((x_center + x, y_center + y))
-        points.append((x_center - x, y_center + y))
-        points.append((x_center + x, y_center - y))
-        points.append((x_center - x, y_center - y))
-        points.append((x_center + y, y_center + x))
-        points.append((x_center - y, y_center + x))
-        points.append((x_center + y, y_center - x))
-        points.append((x_center - y, y_center - x))
-        
-        if d < 0: 
-            d = d + (4 * x) + 6
-        else:
-            y -= 1 
-            d = d + (4 * (x - y)) + 10     
-        x += 1
-        
-    return list(set(points)) 
+    # Bresenham decision (d = 3 - 2r) for one octant, mirrored into a closed contour
+    points = circle_points(x_center, y_center, radius, rule="bresenham")
+    return [tuple(point) for point in points.tolist()]
 
 
 
@@ -53,13 +39,26 @@ def draw_circle(points):
     turtle.done()
 
 
+def draw_circle_headless(points, framebuffer):
+    fill_polygon(framebuffer, points, 'yellow')
+    framebuffer.scatter(points, 'blue')
+    framebuffer.plot(points[0][0], points[0][1], 'green')
+
+
 
 
 
 
-x1,y1 = map(float, input("Enter the coordinates of the center (x1, y1): ").split())
+if __name__ == "__main__":
+    x1,y1 = map(float, input("Enter the coordinates of the center (x1, y1): ").split())
 
-radius = float(input("Enter the radius of the circle: "))
+    radius = float(input("Enter the radius of the circle: "))
 
-points = Besherman_circle(x1, y1, radius)
-draw_circle(points)
+    points = Besherman_circle(x1, y1, radius)
+    if "--headless" in sys.argv:
+        framebuffer = Framebuffer(800, 600)
+        draw_circle_headless(points, framebuffer)
+        framebuffer.save("circle.png")
+        print("Saved circle.png")
+    else:
+        draw_circle(points)
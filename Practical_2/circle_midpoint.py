@@ -1,33 +1,17 @@
 import turtle
 import math
+import os
+import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rendering.circle_engine import circle_points
 
 
-def Mid_point_Circle(x_center, y_center, radius):
-    points = []
-
-    x = 0
-    y = radius
-
-    d = 1 - radius 
 
-    while x <= y:
-        points.append((x_center + x, y_center + y))
-        points.append((x_center - x, y_center + y))
-        points.append((x_center + x, y_center - y))
-        points.append((x_center - x, y_center - y))
-        points.append((x_center + y, y_center + x)) 
-        points.append((x_center - y, y_center + x)) 
-        points.append((x_center + y, y_center - x)) 
-        points.append((x_center - y, y_center - x)) 
-
-        if d < 0:
-            d += 2 * x + 3
-        else:
-            d += 2 * (x - y) + 5
-            y -= 1  
-        x += 1  
-    return points
+def Mid_point_Circle(x_center, y_center, radius):
+    # Midpoint decision (d = 1 - r) for one octant, mirrored into a closed contour
+    points = circle_points(x_center, y_center, radius, rule="midpoint")
+    return [tuple(point) for point in points.tolist()]
 
 
 
@@ -50,8 +34,9 @@ def draw_circle(points):
 
 
 
-x1,y1 = map(float, input("Enter the coordinates of the center (x1, y1): ").split())
+if __name__ == "__main__":
+    x1,y1 = map(float, input("Enter the coordinates of the center (x1, y1): ").split())
 
-radius = float(input("Enter the radius of the circle: "))
-points = Mid_point_Circle(x1, y1, radius)
-draw_circle(points)
\ No newline at end of file
+    radius = float(input("Enter the radius of the circle: "))
+    points = Mid_point_Circle(x1, y1, radius)
+    draw_circle(points)
\ No newline at end of file
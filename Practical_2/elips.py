@@ -1,48 +1,16 @@
 import turtle
+import os
+import sys
 
-def midpoint_ellipse(x_center, y_center, rx, ry):
-	points = []
-	x = 0
-	y = ry
-	rx2 = rx * rx
-	ry2 = ry * ry
-	tworx2 = 2 * rx2
-	twory2 = 2 * ry2
-	px = 0
-	py = tworx2 * y
-
-	# Region 1
-	d1 = ry2 - (rx2 * ry) + (0.25 * rx2)
-	while px < py:
-		points.append((x_center + x, y_center + y))
-		points.append((x_center - x, y_center + y))
-		points.append((x_center + x, y_center - y))
-		points.append((x_center - x, y_center - y))
-		x += 1
-		px += twory2
-		if d1 < 0:
-			d1 += ry2 + px
-		else:
-			y -= 1
-			py -= tworx2
-			d1 += ry2 + px - py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rendering.ellipse_engine import ellipse_points
+from rendering.framebuffer import Framebuffer
+from rendering.scanline_fill import fill_polygon
 
-	# Region 2
-	d2 = (ry2) * ((x + 0.5) ** 2) + (rx2) * ((y - 1) ** 2) - (rx2 * ry2)
-	while y >= 0:
-		points.append((x_center + x, y_center + y))
-		points.append((x_center - x, y_center + y))
-		points.append((x_center + x, y_center - y))
-		points.append((x_center - x, y_center - y))
-		y -= 1
-		py -= tworx2
-		if d2 > 0:
-			d2 += rx2 - py
-		else:
-			x += 1
-			px += twory2
-			d2 += rx2 - py + px
-	return list(set(points))
+def midpoint_ellipse(x_center, y_center, rx, ry):
+	# Two-region midpoint decision for one quadrant, mirrored into a closed contour
+	points = ellipse_points(x_center, y_center, rx, ry)
+	return [tuple(point) for point in points.tolist()]
 
 def draw_ellipse(points):
 	ellipse = turtle.Turtle()
@@ -60,12 +28,21 @@ def draw_ellipse(points):
 	ellipse.end_fill()
 	turtle.done()
 
-
-x1, y1 = map(float, input("Enter the coordinates of the center (x1, y1): ").split())
-rx = float(input("Enter the x-radius (rx) of the ellipse: "))
-ry = float(input("Enter the y-radius (ry) of the ellipse: "))
-points = midpoint_ellipse(x1, y1, rx, ry)
-draw_ellipse(points)
-
-
-
+def draw_ellipse_headless(points, framebuffer):
+	fill_polygon(framebuffer, points, 'yellow')
+	framebuffer.scatter(points, 'blue')
+	framebuffer.plot(points[0][0], points[0][1], 'green')
+
+
+if __name__ == "__main__":
+	x1, y1 = map(float, input("Enter the coordinates of the center (x1, y1): ").split())
+	rx = float(input("Enter the x-radius (rx) of the ellipse: "))
+	ry = float(input("Enter the y-radius (ry) of the ellipse: "))
+	points = midpoint_ellipse(x1, y1, rx, ry)
+	if "--headless" in sys.argv:
+		framebuffer = Framebuffer(800, 600)
+		draw_ellipse_headless(points, framebuffer)
+		framebuffer.save("ellipse.png")
+		print("Saved ellipse.png")
+	else:
+		draw_ellipse(points)
@@ -1,8 +1,16 @@
 #bashermen line drawning algorithm
 
+import os
+import sys
+import time
+
 import matplotlib.pyplot as plt
+import numpy as np
 import turtle
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rendering.framebuffer import Framebuffer
+
 def Bashermen_Line(x1,y1,x2,y2):
     dx = x2-x1
     dy = y2-y1
@@ -26,6 +34,102 @@ def Bashermen_Line(x1,y1,x2,y2):
     return points
 
 
+def _rasterize(lines, out):
+    # Step along the major axis one pixel at a time; after `step` steps the Bresenham
+    # decision rule has advanced the minor axis floor((2*step*minor + major) / (2*major)) pixels
+    x1, y1, x2, y2 = lines.T
+    dx = x2 - x1
+    dy = y2 - y1
+    sx = np.sign(dx)
+    sy = np.sign(dy)
+    steep = np.abs(dy) > np.abs(dx)
+    major = np.maximum(np.abs(dx), np.abs(dy))
+    minor = np.minimum(np.abs(dx), np.abs(dy))
+
+    counts = major + 1
+    offsets = np.zeros(len(lines) + 1, dtype=np.int64)
+    np.cumsum(counts, out=offsets[1:])
+    total = int(offsets[-1])
+
+    if out is None:
+        out = np.empty((total, 2), dtype=np.int32)
+    elif out.shape[0] < total or out.shape[1:] != (2,):
+        raise ValueError(f"Output buffer needs shape ({total}, 2) or more rows.")
+    out = out[:total]
+    if total == 0:
+        return out, offsets
+
+    # Step index within each line, restarting from 0 at every line start
+    step = np.ones(total, dtype=np.int64)
+    step[0] = 0
+    step[offsets[1:-1]] = -major[:-1]
+    np.cumsum(step, out=step)
+
+    def per_pixel(values):
+        return np.repeat(values, counts)
+
+    advance = (2 * step * per_pixel(minor) + per_pixel(major)) // per_pixel(np.maximum(2 * major, 1))
+    out[:, 0] = per_pixel(x1) + step * per_pixel(np.where(steep, 0, sx)) + advance * per_pixel(np.where(steep, sx, 0))
+    out[:, 1] = per_pixel(y1) + step * per_pixel(np.where(steep, sy, 0)) + advance * per_pixel(np.where(steep, 0, sy))
+    return out, offsets
+
+
+def Bresenham_Line_array(x1, y1, x2, y2, out=None):
+    """
+    Integer Bresenham line for all eight octants.
+    Writes the pixels from (x1, y1) to (x2, y2) into an (n, 2) int32 array and returns it,
+    using `out` as the buffer when given (it must have at least n rows).
+    """
+    line = np.rint(np.array([[x1, y1, x2, y2]], dtype=np.float64)).astype(np.int64)
+    pixels, _ = _rasterize(line, out)
+    return pixels
+
+
+def Bresenham_Lines_batch(lines, out=None):
+    """
+    Rasterize an (N, 4) array of lines (x1, y1, x2, y2) into one concatenated int32 buffer.
+    Returns (pixels, offsets) where the pixels of line i are pixels[offsets[i]:offsets[i + 1]].
+    """
+    lines = np.rint(np.asarray(lines, dtype=np.float64)).astype(np.int64).reshape(-1, 4)
+    return _rasterize(lines, out)
+
+
+def benchmark_line_rasterizers(lengths=(100, 1000, 10000, 100000), batch_lines=10000, repeat=3):
+    """Compare the per-point append loop of Bashermen_Line with the array rasterizers"""
+    print("=== Bresenham Line Benchmark ===")
+    print(f"{'length':>8} {'append (s)':>12} {'array (s)':>12} {'speedup':>10}")
+    for length in lengths:
+        # Bashermen_Line only handles the first octant, so compare on a shallow line
+        append_time = array_time = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            Bashermen_Line(0, 0, length, length // 3)
+            append_time = min(append_time, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            Bresenham_Line_array(0, 0, length, length // 3)
+            array_time = min(array_time, time.perf_counter() - start)
+        print(f"{length:>8} {append_time:>12.5f} {array_time:>12.5f} {append_time / array_time:>9.1f}x")
+
+    rng = np.random.default_rng(0)
+    lines = rng.integers(-500, 500, size=(batch_lines, 4))
+
+    single_time = batch_time = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for x1, y1, x2, y2 in lines.tolist():
+            Bresenham_Line_array(x1, y1, x2, y2)
+        single_time = min(single_time, time.perf_counter() - start)
+
+        start = time.perf_counter()
+        pixels, offsets = Bresenham_Lines_batch(lines)
+        batch_time = min(batch_time, time.perf_counter() - start)
+
+    print(f"\n{batch_lines} random lines, {len(pixels)} pixels")
+    print(f"  one call per line: {single_time:.4f} s")
+    print(f"  batch:             {batch_time:.4f} s ({len(pixels) / batch_time / 1e6:.1f} Mpixels/s)")
+
+
 def draw_line(points):
     x_coords, y_coords = zip(*points)
     plt.plot(x_coords, y_coords, marker='o')
@@ -53,9 +157,21 @@ def draw_line_with_turtle(points):
     line.dot(8, 'red')    # End point
     turtle.done()
 
-#take cordinateds as a input from user
-x1,y1 = map(float, input("Enter the coordinates of the center (x1, y1): ").split())
-x2,y2 = map(float, input("Enter the coordinates of the end point (x2, y2): ").split())
+def draw_line_headless(points, framebuffer):
+    framebuffer.scatter(points, 'blue')
+    framebuffer.plot(points[0][0], points[0][1], 'green')  # Start point
+    framebuffer.plot(points[-1][0], points[-1][1], 'red')  # End point
+
+if __name__ == "__main__":
+    #take cordinateds as a input from user
+    x1,y1 = map(float, input("Enter the coordinates of the center (x1, y1): ").split())
+    x2,y2 = map(float, input("Enter the coordinates of the end point (x2, y2): ").split())
 
-points = Bashermen_Line(x1, y1, x2, y2)
-draw_line_with_turtle(points)
\ No newline at end of file
+    points = Bashermen_Line(x1, y1, x2, y2)
+    if "--headless" in sys.argv:
+        framebuffer = Framebuffer(800, 600)
+        draw_line_headless(points, framebuffer)
+        framebuffer.save("line.png")
+        print("Saved line.png")
+    else:
+        draw_line_with_turtle(points)
\ No newline at end of file
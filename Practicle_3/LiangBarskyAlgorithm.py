@@ -1,6 +1,9 @@
 # Liang-Barsky line clipping algorithm with turtle graphics
 import turtle
 import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
 
 def liang_barsky_clip(x1, y1, x2, y2, xmin, ymin, xmax, ymax):
     """
@@ -39,6 +42,198 @@ def liang_barsky_clip(x1, y1, x2, y2, xmin, ymin, xmax, ymax):
 
     return (clipped_x1, clipped_y1, clipped_x2, clipped_y2)
 
+def _liang_barsky_parameters(x1, y1, dx, dy, xmin, ymin, xmax, ymax):
+    """
+    Vectorized Liang-Barsky test with the same edges in the same order as liang_barsky_clip
+    The segment arrays and the window bounds broadcast against each other, e.g. (N,) segments
+    against one window or (1, N) segments against (W, 1) windows
+    Returns the entry parameters t0, the exit parameters t1 and the accept mask
+    """
+    shape = np.broadcast_shapes(np.shape(x1), np.shape(xmin))
+    t0 = np.zeros(shape)
+    t1 = np.ones(shape)
+    accept = np.ones(shape, dtype=bool)
+
+    edges = ((-dx, x1 - xmin), (dx, xmax - x1), (-dy, y1 - ymin), (dy, ymax - y1))
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for p, q in edges:
+            # Line is parallel and outside the clipping window
+            accept &= (p != 0) | (q >= 0)
+
+            r = q / p
+            np.maximum(t0, np.where(p < 0, r, 0.0), out=t0)  # Update t0
+            np.minimum(t1, np.where(p > 0, r, 1.0), out=t1)  # Update t1
+
+    accept &= t0 <= t1
+    return t0, t1, accept
+
+def _clipped_segments(x1, y1, dx, dy, t0, t1):
+    # (..., 4) segments between the parameters t0 and t1, computed as in liang_barsky_clip
+    clipped = np.empty(np.broadcast_shapes(np.shape(x1), np.shape(t0)) + (4,), dtype=np.float64)
+    clipped[..., 0] = x1 + t0 * dx
+    clipped[..., 1] = y1 + t0 * dy
+    clipped[..., 2] = x1 + t1 * dx
+    clipped[..., 3] = y1 + t1 * dy
+    return clipped
+
+def liang_barsky_clip_batch(segments, xmin, ymin, xmax, ymax):
+    """
+    Vectorized Liang-Barsky clipping for an (N, 4) array of segments (x1, y1, x2, y2)
+    Returns the (M, 4) array of clipped segments and the length-N accept mask
+    Results are bit-identical to calling liang_barsky_clip on every row
+    """
+    segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+    x1, y1, x2, y2 = np.ascontiguousarray(segments.T)
+
+    dx = x2 - x1
+    dy = y2 - y1
+
+    t0, t1, accept = _liang_barsky_parameters(x1, y1, dx, dy, xmin, ymin, xmax, ymax)
+
+    clipped = _clipped_segments(x1[accept], y1[accept], dx[accept], dy[accept], t0[accept], t1[accept])
+    return clipped, accept
+
+def _clip_window_range(segments, windows, sparse, block):
+    """
+    Clips all segments against a range of windows, block windows at a time, broadcasting
+    every block to (windows, segments) pairs
+    """
+    x1, y1, x2, y2 = (c[None, :] for c in np.ascontiguousarray(segments.T))
+    dx = x2 - x1
+    dy = y2 - y1
+    results = []
+
+    for first in range(0, max(len(windows), 1), block):
+        bounds = (c[:, None] for c in np.ascontiguousarray(windows[first:first + block].T))
+        t0, t1, accept = _liang_barsky_parameters(x1, y1, dx, dy, *bounds)
+
+        if sparse:
+            window, segment = np.nonzero(accept)
+            clipped = _clipped_segments(x1[0, segment], y1[0, segment], dx[0, segment], dy[0, segment],
+                                        t0[accept], t1[accept])
+            results.append((window + first, segment, clipped))
+        else:
+            # NaN parameters give NaN coordinates for the rejected pairs
+            rejected = ~accept
+            t0[rejected] = np.nan
+            t1[rejected] = np.nan
+            results.append((_clipped_segments(x1, y1, dx, dy, t0, t1), accept))
+
+    return [np.concatenate(parts) for parts in zip(*results)]
+
+def liang_barsky_clip_windows(segments, windows, sparse=False, chunk_size=2**18, workers=1):
+    """
+    Vectorized Liang-Barsky clipping of an (N, 4) array of segments against every window of a
+    (W, 4) array (xmin, ymin, xmax, ymax), e.g. the tiles of a tile-based renderer
+    Returns the (W, N, 4) clipped segments (NaN where rejected) and the (W, N) accept mask,
+    or with sparse=True only the hits: window indices, segment indices and the (M, 4) clipped
+    segments, ordered by window and then by segment
+    Windows are clipped in blocks of about chunk_size (window, segment) pairs (at least one
+    window) to bound the temporary memory
+    workers > 1 splits the windows into that many contiguous ranges clipped by a process pool
+    Results are bit-identical to liang_barsky_clip_batch for every window
+    """
+    segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+    windows = np.asarray(windows, dtype=np.float64).reshape(-1, 4)
+    block = max(1, chunk_size // max(len(segments), 1))
+
+    ranges = [part for part in np.array_split(windows, max(workers, 1)) if len(part)] or [windows]
+    jobs = [(segments, part, sparse, block) for part in ranges]
+    if workers > 1 and len(jobs) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(_clip_window_range, *zip(*jobs)))
+    else:
+        results = [_clip_window_range(*job) for job in jobs]
+
+    if sparse:
+        # Window indices restart at 0 in every range
+        starts = np.cumsum([0] + [len(part) for part in ranges[:-1]])
+        results = [(window + start, segment, clipped) for (window, segment, clipped), start in zip(results, starts)]
+    return tuple(np.concatenate(parts) for parts in zip(*results))
+
+def benchmark_batch_clip(sizes=(10**3, 10**4, 10**5, 10**6, 10**7), scalar_limit=10**5, repeat=3, seed=0):
+    """
+    Compare liang_barsky_clip against liang_barsky_clip_batch on random segments
+    The batch version reports the best of `repeat` runs
+    The scalar version is only timed up to scalar_limit segments and extrapolated beyond that
+    """
+    xmin, ymin, xmax, ymax = -100.0, -100.0, 100.0, 100.0
+    rng = np.random.default_rng(seed)
+
+    print("=== Liang-Barsky Batch Benchmark ===")
+    print(f"{'segments':>10} {'scalar (s)':>12} {'batch (s)':>12} {'speedup':>10}")
+
+    for n in sizes:
+        segments = rng.uniform(-300, 300, size=(n, 4))
+
+        batch_time = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            clipped, accept = liang_barsky_clip_batch(segments, xmin, ymin, xmax, ymax)
+            batch_time = min(batch_time, time.perf_counter() - start)
+
+        m = min(n, scalar_limit)
+        start = time.perf_counter()
+        scalar_results = [liang_barsky_clip(*seg, xmin, ymin, xmax, ymax) for seg in segments[:m].tolist()]
+        scalar_time = (time.perf_counter() - start) * n / m
+
+        # Verify the batch output against the scalar function on the timed prefix
+        scalar_accept = np.array([res is not None for res in scalar_results])
+        if not np.array_equal(scalar_accept, accept[:m]):
+            raise ValueError("Batch accept mask differs from scalar clipper")
+        scalar_clipped = np.array([res for res in scalar_results if res is not None]).reshape(-1, 4)
+        if not np.array_equal(scalar_clipped, clipped[:scalar_clipped.shape[0]]):
+            raise ValueError("Batch clipped segments differ from scalar clipper")
+
+        note = "" if m == n else " (scalar extrapolated)"
+        print(f"{n:>10} {scalar_time:>12.4f} {batch_time:>12.4f} {scalar_time / batch_time:>9.1f}x{note}")
+
+def benchmark_tile_clip(segment_counts=(10**3, 10**4, 10**5), tiles=(8, 8), workers=2, repeat=3, seed=0):
+    """
+    Clip random segments against the tiles of a tiles[0] x tiles[1] grid over [-300, 300]^2,
+    once with liang_barsky_clip_batch per tile and once with liang_barsky_clip_windows in
+    dense form, sparse form and sparse form split across `workers` processes
+    Every variant reports the best of `repeat` runs and is checked against the per-tile loop
+    """
+    rng = np.random.default_rng(seed)
+    xs = np.linspace(-300, 300, tiles[0] + 1)
+    ys = np.linspace(-300, 300, tiles[1] + 1)
+    windows = np.array([(xs[i], ys[j], xs[i + 1], ys[j + 1]) for j in range(tiles[1]) for i in range(tiles[0])])
+
+    def best(function):
+        elapsed = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            result = function()
+            elapsed = min(elapsed, time.perf_counter() - start)
+        return result, elapsed
+
+    print("=== Liang-Barsky Tile Benchmark ===")
+    print(f"{len(windows)} tiles, {workers} worker(s) for the pool column")
+    print(f"{'segments':>10} {'per tile (s)':>13} {'dense (s)':>10} {'sparse (s)':>11} {'pool (s)':>10} {'hits':>9}")
+
+    for n in segment_counts:
+        # Segments up to about a tile long, so that most of them touch one or two tiles
+        starts = rng.uniform(-300, 300, size=(n, 2))
+        segments = np.column_stack((starts, starts + rng.uniform(-75, 75, size=(n, 2))))
+
+        loop, loop_time = best(lambda: [liang_barsky_clip_batch(segments, *window) for window in windows])
+        (clipped, accept), dense_time = best(lambda: liang_barsky_clip_windows(segments, windows))
+        (window, segment, sparse_clipped), sparse_time = best(
+            lambda: liang_barsky_clip_windows(segments, windows, sparse=True))
+        pooled, pool_time = best(lambda: liang_barsky_clip_windows(segments, windows, sparse=True, workers=workers))
+
+        if not np.array_equal(np.stack([tile_accept for _, tile_accept in loop]), accept):
+            raise ValueError("Dense accept mask differs from clipping every tile")
+        loop_clipped = np.concatenate([tile_clipped for tile_clipped, _ in loop])
+        if not (np.array_equal(clipped[accept], loop_clipped) and np.array_equal(sparse_clipped, loop_clipped)):
+            raise ValueError("Multi-window clipped segments differ from clipping every tile")
+        if not all(np.array_equal(a, b) for a, b in zip(pooled, (window, segment, sparse_clipped))):
+            raise ValueError("Process pool results differ from a single process")
+
+        print(f"{n:>10} {loop_time:>13.4f} {dense_time:>10.4f} {sparse_time:>11.4f} {pool_time:>10.4f} {len(window):>9}")
+
 def draw_clipping_window(turtle_obj, xmin, ymin, xmax, ymax):
     """Draw the clipping window rectangle"""
     turtle_obj.penup()
@@ -251,6 +446,16 @@ def run_test_cases():
             cx1, cy1, cx2, cy2 = result
             print(f"  Clipped: ({cx1:.2f}, {cy1:.2f}) to ({cx2:.2f}, {cy2:.2f})")
 
+    # All lines against the four quadrant tiles of the window in one pass
+    print("\nAll lines against the 2x2 tiles of the window:")
+    tiles = [(-100, -100, 0, 0), (0, -100, 100, 0), (-100, 0, 0, 100), (0, 0, 100, 100)]
+    lines = [case["line"] for case in test_cases]
+    for tile, line, clipped in zip(*liang_barsky_clip_windows(lines, tiles, sparse=True)):
+        xmin, ymin, xmax, ymax = tiles[tile]
+        cx1, cy1, cx2, cy2 = clipped
+        print(f"  Tile ({xmin}, {ymin}) to ({xmax}, {ymax}), line {line + 1}: "
+              f"({cx1:.2f}, {cy1:.2f}) to ({cx2:.2f}, {cy2:.2f})")
+
 def clear_screen(artist):
     """Clear the screen for next drawing"""
     artist.clear()
@@ -435,8 +640,10 @@ if __name__ == "__main__":
     print("1. Interactive demonstration (Enter your own coordinates)")
     print("2. Run console test cases (Text output only)")
     print("3. Static cases demonstration (8 predefined visual cases)")
+    print("4. Benchmark batch clipping (Text output only)")
+    print("5. Benchmark clipping against many tiles (Text output only)")
     
-    choice = input("Enter your choice (1, 2, or 3): ")
+    choice = input("Enter your choice (1, 2, 3, 4, or 5): ")
     
     if choice == "1":
         demonstrate_clipping()
@@ -447,6 +654,10 @@ if __name__ == "__main__":
             demonstrate_clipping()
     elif choice == "3":
         demonstrate_static_cases()
+    elif choice == "4":
+        benchmark_batch_clip()
+    elif choice == "5":
+        benchmark_tile_clip()
     else:
         print("Invalid choice. Running interactive demonstration...")
         demonstrate_clipping()
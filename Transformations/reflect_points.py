@@ -1,48 +1,16 @@
 import turtle
+import os
+import sys
 
-def midpoint_ellipse(x_center, y_center, rx, ry):
-	points = []
-	x = 0
-	y = ry
-	rx2 = rx * rx
-	ry2 = ry * ry
-	tworx2 = 2 * rx2
-	twory2 = 2 * ry2
-	px = 0
-	py = tworx2 * y
-
-	# Region 1
-	d1 = ry2 - (rx2 * ry) + (0.25 * rx2)
-	while px < py:
-		points.append((x_center + x, y_center + y))
-		points.append((x_center - x, y_center + y))
-		points.append((x_center + x, y_center - y))
-		points.append((x_center - x, y_center - y))
-		x += 1
-		px += twory2
-		if d1 < 0:
-			d1 += ry2 + px
-		else:
-			y -= 1
-			py -= tworx2
-			d1 += ry2 + px - py
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rendering.ellipse_engine import ellipse_points
+from rendering.framebuffer import Framebuffer
+from rendering.scanline_fill import fill_polygon
 
-	# Region 2
-	d2 = (ry2) * ((x + 0.5) ** 2) + (rx2) * ((y - 1) ** 2) - (rx2 * ry2)
-	while y >= 0:
-		points.append((x_center + x, y_center + y))
-		points.append((x_center - x, y_center + y))
-		points.append((x_center + x, y_center - y))
-		points.append((x_center - x, y_center - y))
-		y -= 1
-		py -= tworx2
-		if d2 > 0:
-			d2 += rx2 - py
-		else:
-			x += 1
-			px += twory2
-			d2 += rx2 - py + px
-	return list(set(points))
+def midpoint_ellipse(x_center, y_center, rx, ry):
+	# Two-region midpoint decision for one quadrant, mirrored into a closed contour
+	points = ellipse_points(x_center, y_center, rx, ry)
+	return [tuple(point) for point in points.tolist()]
 
 
 def mirror_points(points,axis):
@@ -70,21 +38,33 @@ def draw_ellipse(points,ellipse):
 	ellipse.begin_fill()
 	ellipse.end_fill()
 
+def draw_ellipse_headless(points, framebuffer, color):
+	fill_polygon(framebuffer, points, 'yellow')
+	framebuffer.scatter(points, color)
+	framebuffer.plot(points[0][0], points[0][1], 'green')
 
 
-ellipse = turtle.Turtle()
-x1, y1 = map(float, input("Enter the coordinates of the center (x1, y1): ").split())
-rx = float(input("Enter the x-radius (rx) of the ellipse: "))
-ry = float(input("Enter the y-radius (ry) of the ellipse: "))
 
-axis = input("Enter the axis of reflection (x, y, xy): ")
+if __name__ == "__main__":
+	x1, y1 = map(float, input("Enter the coordinates of the center (x1, y1): ").split())
+	rx = float(input("Enter the x-radius (rx) of the ellipse: "))
+	ry = float(input("Enter the y-radius (ry) of the ellipse: "))
 
+	axis = input("Enter the axis of reflection (x, y, xy): ")
 
-points = midpoint_ellipse(x1, y1, rx, ry)
-draw_ellipse(points, ellipse)
 
-mirrored_points = mirror_points(points, axis)
-draw_ellipse(mirrored_points, ellipse)
+	points = midpoint_ellipse(x1, y1, rx, ry)
+	mirrored_points = mirror_points(points, axis)
 
-turtle.done()
+	if "--headless" in sys.argv:
+		framebuffer = Framebuffer(800, 600)
+		draw_ellipse_headless(points, framebuffer, 'blue')
+		draw_ellipse_headless(mirrored_points, framebuffer, 'red')
+		framebuffer.save("reflect_points.png")
+		print("Saved reflect_points.png")
+	else:
+		ellipse = turtle.Turtle()
+		draw_ellipse(points, ellipse)
+		draw_ellipse(mirrored_points, ellipse)
 
+		turtle.done()
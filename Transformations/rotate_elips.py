@@ -1,70 +1,26 @@
 import turtle
-import math
-
-def midpoint_ellipse(x_center, y_center, rx, ry):
-	points = []
-	x = 0
-	y = ry
-	rx2 = rx * rx
-	ry2 = ry * ry
-	tworx2 = 2 * rx2
-	twory2 = 2 * ry2
-	px = 0
-	py = tworx2 * y
-
-	# Region 1
-	d1 = ry2 - (rx2 * ry) + (0.25 * rx2)
-	while px < py:
-		points.append((x_center + x, y_center + y))
-		points.append((x_center - x, y_center + y))
-		points.append((x_center + x, y_center - y))
-		points.append((x_center - x, y_center - y))
-		x += 1
-		px += twory2
-		if d1 < 0:
-			d1 += ry2 + px
-		else:
-			y -= 1
-			py -= tworx2
-			d1 += ry2 + px - py
-
-	# Region 2
-	d2 = (ry2) * ((x + 0.5) ** 2) + (rx2) * ((y - 1) ** 2) - (rx2 * ry2)
-	while y >= 0:
-		points.append((x_center + x, y_center + y))
-		points.append((x_center - x, y_center + y))
-		points.append((x_center + x, y_center - y))
-		points.append((x_center - x, y_center - y))
-		y -= 1
-		py -= tworx2
-		if d2 > 0:
-			d2 += rx2 - py
-		else:
-			x += 1
-			px += twory2
-			d2 += rx2 - py + px
-	return list(set(points))
+import os
+import sys
 
+import numpy as np
 
-def rotate_points(points,x_center,y_center,angle):
-	rotated_points = []
-	radians = math.radians(angle)
-	sin_value = math.sin(radians)
-	cos_value = math.cos(radians)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rendering.ellipse_engine import ellipse_points
+from rendering.framebuffer import Framebuffer
+from rendering.rotation_cache import rotation_cache
+from rendering.scanline_fill import fill_polygon
 
-	for x, y in points:
-		'''
-		x_shifted = x - x_center
-		y_shifted = y - y_center
+def midpoint_ellipse(x_center, y_center, rx, ry):
+	# Two-region midpoint decision for one quadrant, mirrored into a closed contour
+	points = ellipse_points(x_center, y_center, rx, ry)
+	return [tuple(point) for point in points.tolist()]
 
-		x_rotated = (x_shifted * cos_value) - (y_shifted * sin_value) + x_center
-		y_rotated = (x_shifted * sin_value) + (y_shifted * cos_value) + y_center
-		'''
-		x_rotated = (x* cos_value) - (y * sin_value) 
-		y_rotated = (x * sin_value) + (y * cos_value) 
 
-		rotated_points.append((x_rotated, y_rotated))
-	return rotated_points
+def rotate_points(points,x_center,y_center,angle):
+	# Rotation about the origin with the matrix from the shared rotation cache
+	rotation = rotation_cache.matrix_2d(angle)
+	rotated = np.asarray(points, dtype=np.float64) @ rotation.T
+	return [tuple(point) for point in rotated.tolist()]
 
 
 
@@ -82,22 +38,35 @@ def draw_ellipse(points, ellipse):
 	ellipse.fillcolor('yellow')
 	ellipse.begin_fill()
 	ellipse.end_fill()
+
+def draw_ellipse_headless(points, framebuffer, color):
+	fill_polygon(framebuffer, points, 'yellow')
+	framebuffer.scatter(points, color)
+	framebuffer.plot(points[0][0], points[0][1], 'green')
 	
 
 
 
-turtle_pen  = turtle.Turtle()
-x1, y1 = map(float, input("Enter the coordinates of the center (x1, y1): ").split())
-rx = float(input("Enter the x-radius (rx) of the ellipse: "))
-ry = float(input("Enter the y-radius (ry) of the ellipse: "))
+if __name__ == "__main__":
+	x1, y1 = map(float, input("Enter the coordinates of the center (x1, y1): ").split())
+	rx = float(input("Enter the x-radius (rx) of the ellipse: "))
+	ry = float(input("Enter the y-radius (ry) of the ellipse: "))
 
-rotation_degree = float(input("Enter the rotation degree of the ellipse: "))
+	rotation_degree = float(input("Enter the rotation degree of the ellipse: "))
 
 
-points = midpoint_ellipse(x1, y1, rx, ry)
-draw_ellipse(points, turtle_pen)
+	points = midpoint_ellipse(x1, y1, rx, ry)
+	new_points = rotate_points(points, x1, y1, rotation_degree)
 
-new_points = rotate_points(points, x1, y1, rotation_degree)
-draw_ellipse(new_points, turtle_pen)
+	if "--headless" in sys.argv:
+		framebuffer = Framebuffer(800, 600)
+		draw_ellipse_headless(points, framebuffer, 'blue')
+		draw_ellipse_headless(new_points, framebuffer, 'red')
+		framebuffer.save("rotate_ellipse.png")
+		print("Saved rotate_ellipse.png")
+	else:
+		turtle_pen  = turtle.Turtle()
+		draw_ellipse(points, turtle_pen)
+		draw_ellipse(new_points, turtle_pen)
 
-turtle.done()
+		turtle.done()
@@ -1,35 +1,21 @@
 import matplotlib.pyplot as plt
 import numpy as np
 import turtle
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rendering.circle_engine import circle_points
+from rendering.framebuffer import Framebuffer
+from rendering.scanline_fill import fill_polygon
 
 
 
 
 def Besherman_circle(x_center, y_center, radius):
-    points = []
-    x = 0
-    y = radius 
-    d = 3 - (2 * radius) 
-
-    while x <= y: 
-       
-        points.append((x_center + x, y_center + y))
-        points.append((x_center - x, y_center + y))
-        points.append((x_center + x, y_center - y))
-        points.append((x_center - x, y_center - y))
-        points.append((x_center + y, y_center + x))
-        points.append((x_center - y, y_center + x))
-        points.append((x_center + y, y_center - x))
-        points.append((x_center - y, y_center - x))
-        
-        if d < 0: 
-            d = d + (4 * x) + 6
-        else:
-            y -= 1 
-            d = d + (4 * (x - y)) + 10     
-        x += 1
-        
-    return list(set(points)) 
+    # Bresenham decision (d = 3 - 2r) for one octant, mirrored into a closed contour
+    points = circle_points(x_center, y_center, radius, rule="bresenham")
+    return [tuple(point) for point in points.tolist()]
 
 
 def calculate_translation(points, x_translation, y_translation):
@@ -57,22 +43,32 @@ def draw_circle(points,circle):
     circle.end_fill()  
 
 
+def draw_circle_headless(points, framebuffer, color):
+    fill_polygon(framebuffer, points, 'yellow')
+    framebuffer.scatter(points, color)
+    framebuffer.plot(points[0][0], points[0][1], 'green')
 
 
-turtle_obj  = turtle.Turtle()
-
-x1,y1 = map(float, input("Enter the coordinates of the center (x1, y1): ").split())
-
-radius = float(input("Enter the radius of the circle: "))
 
-x_translation, y_translation = map(float, input("Enter the coordinates of the translation (x1, y1): ").split())
 
-points = Besherman_circle(x1, y1, radius)
+if __name__ == "__main__":
+    x1,y1 = map(float, input("Enter the coordinates of the center (x1, y1): ").split())
 
+    radius = float(input("Enter the radius of the circle: "))
 
+    x_translation, y_translation = map(float, input("Enter the coordinates of the translation (x1, y1): ").split())
 
+    points = Besherman_circle(x1, y1, radius)
+    new_points = calculate_translation(points, x_translation, y_translation)
 
-draw_circle(points,turtle_obj)
-translated_points = calculate_translation(points, x_translation, y_translation)
-draw_circle(translated_points,turtle_obj)
-turtle.done()
\ No newline at end of file
+    if "--headless" in sys.argv:
+        framebuffer = Framebuffer(800, 600)
+        draw_circle_headless(points, framebuffer, 'blue')
+        draw_circle_headless(new_points, framebuffer, 'red')
+        framebuffer.save("shift_and_scale.png")
+        print("Saved shift_and_scale.png")
+    else:
+        turtle_obj  = turtle.Turtle()
+        draw_circle(points,turtle_obj)
+        draw_circle(new_points,turtle_obj)
+        turtle.done()
@@ -93,6 +93,50 @@ def rotate_point(x, y, center_x, center_y, angle):
     
     return new_x, new_y
 
+def create_revolving_frames(center_x, center_y, circle_radius, arrow_length, arrow_width,
+                            revolution_radius, total_frames=200):
+    """
+    Precomputes the closed circle and arrow outlines of every animation frame.
+    The templates are built once around the origin and each frame's rotation and
+    translation is applied to all frames in one batched einsum.
+
+    Args:
+        center_x, center_y (float): Center of the revolution.
+        circle_radius (float): Radius of the circle.
+        arrow_length (float): Length of the arrow.
+        arrow_width (float): Width of the arrow shaft.
+        revolution_radius (float): Distance of the circle+arrow system from the center.
+        total_frames (int): Number of frames in one revolution.
+
+    Returns:
+        tuple: (frames, 101, 2) circle outlines, (frames, 8, 2) arrow outlines,
+               (frames, 2) circle centers and (frames,) revolution angles.
+    """
+    # Closed templates around the origin (first point repeated at the end)
+    circle_template = np.column_stack(create_circle_points(0, 0, circle_radius))
+    circle_template = np.concatenate((circle_template, circle_template[:1]))
+    arrow_template = np.column_stack(create_arrow_points(0, 0, arrow_length, arrow_width))
+    arrow_template = np.concatenate((arrow_template, arrow_template[:1]))
+
+    angles = np.arange(total_frames) * (2 * np.pi / total_frames)
+    cos_a, sin_a = np.cos(angles), np.sin(angles)
+    centers = np.column_stack((center_x + revolution_radius * cos_a,
+                               center_y + revolution_radius * sin_a))
+
+    # The arrow rotates with the revolution so it points in the direction of motion
+    rotations = np.empty((total_frames, 2, 2))
+    rotations[:, 0, 0] = cos_a
+    rotations[:, 0, 1] = -sin_a
+    rotations[:, 1, 0] = sin_a
+    rotations[:, 1, 1] = cos_a
+
+    arrow_frames = np.empty((total_frames,) + arrow_template.shape)
+    np.einsum('fij,pj->fpi', rotations, arrow_template, out=arrow_frames)
+    arrow_frames += centers[:, None, :]
+    circle_frames = circle_template + centers[:, None, :]
+
+    return circle_frames, arrow_frames, centers, angles
+
 def create_revolving_arrow_animation():
     """
     Creates the main animation of arrow embedded in circle revolving around center.
@@ -110,7 +154,8 @@ def create_revolving_arrow_animation():
         
         # Animation parameters
         total_frames = 200
-        revolution_speed = 2 * np.pi / total_frames  # One complete revolution
+        circle_frames, arrow_frames, centers, angles = create_revolving_frames(
+            center_x, center_y, circle_radius, arrow_length, arrow_width, revolution_radius, total_frames)
         
         # Setup the plot
         fig, ax = plt.subplots(figsize=(10, 10))
@@ -152,37 +197,21 @@ def create_revolving_arrow_animation():
             Args:
                 frame (int): Current frame number.
             """
-            # Calculate revolution angle
-            revolution_angle = frame * revolution_speed
-            
-            # Calculate new center position for the circle+arrow system
-            current_center_x = center_x + revolution_radius * np.cos(revolution_angle)
-            current_center_y = center_y + revolution_radius * np.sin(revolution_angle)
-            
-            # Create circle at current position
-            circle_x, circle_y = create_circle_points(current_center_x, current_center_y, circle_radius)
-            
-            # Create arrow at current position (arrow also rotates as it revolves)
-            arrow_rotation = revolution_angle  # Arrow points in direction of motion
-            arrow_x, arrow_y = create_arrow_points(current_center_x, current_center_y, 
-                                                 arrow_length, arrow_width, arrow_rotation)
-            
-            # Close the shapes
-            circle_x = np.append(circle_x, circle_x[0])
-            circle_y = np.append(circle_y, circle_y[0])
-            arrow_x = np.append(arrow_x, arrow_x[0])
-            arrow_y = np.append(arrow_y, arrow_y[0])
+            # Every frame is precomputed; the artists get views into the frame buffers
+            circle_points = circle_frames[frame]
+            arrow_points = arrow_frames[frame]
+            current_center_x, current_center_y = centers[frame]
             
             # Update circle
-            circle_line.set_data(circle_x, circle_y)
-            circle_fill.set_xy(np.column_stack((circle_x, circle_y)))
+            circle_line.set_data(circle_points[:, 0], circle_points[:, 1])
+            circle_fill.set_xy(circle_points)
             
             # Update arrow
-            arrow_line.set_data(arrow_x, arrow_y)
-            arrow_fill.set_xy(np.column_stack((arrow_x, arrow_y)))
+            arrow_line.set_data(arrow_points[:, 0], arrow_points[:, 1])
+            arrow_fill.set_xy(arrow_points)
             
             # Update texts
-            angle_degrees = np.degrees(revolution_angle) % 360
+            angle_degrees = np.degrees(angles[frame]) % 360
             title_text.set_text(f"Arrow in Circle - Revolution Angle: {angle_degrees:.1f}°")
             info_text.set_text(f"Position: ({current_center_x:.1f}, {current_center_y:.1f})")
             
@@ -3,6 +3,14 @@ import matplotlib.pyplot as plt
 import matplotlib.animation as animation
 import numpy as np
 import time
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rendering.framebuffer import Framebuffer
+from rendering.scanline_fill import fill_polygon
 
 def create_triangle_points(center_x, center_y, radius, num_points=100):
     """
@@ -113,9 +121,67 @@ def create_square_points(center_x, center_y, side_length, num_points=100):
     
     return np.array(x_points), np.array(y_points)
 
+def resample_closed_shape(x, y, num_points):
+    """
+    Resamples a closed outline to points spaced evenly along its perimeter.
+
+    Args:
+        x, y: Outline coordinates (the last point connects back to the first).
+        num_points (int): Number of points to return.
+
+    Returns:
+        numpy.ndarray: (num_points, 2) array starting at the first input point.
+    """
+    points = np.column_stack((x, y)).astype(np.float64)
+    closed = np.concatenate((points, points[:1]))
+    distance = np.zeros(len(closed))
+    np.cumsum(np.hypot(*np.diff(closed, axis=0).T), out=distance[1:])
+    targets = np.linspace(0, distance[-1], num_points + 1)[:-1]
+    return np.column_stack((np.interp(targets, distance, closed[:, 0]),
+                            np.interp(targets, distance, closed[:, 1])))
+
+class ShapeMorph:
+    """
+    Morph between two fixed shapes. Shapes with different point counts are resampled
+    by arc length once, on construction; every frame afterwards is a single
+    multiply-add written into a reused output buffer.
+    """
+    def __init__(self, shape1_x, shape1_y, shape2_x, shape2_y):
+        num_points = max(len(shape1_x), len(shape2_x))
+        self.start = self._align(shape1_x, shape1_y, num_points)
+        self.end = self._align(shape2_x, shape2_y, num_points)
+        self.delta = self.end - self.start
+        self.buffer = np.empty_like(self.start)
+
+    @staticmethod
+    def _align(x, y, num_points):
+        if len(x) == num_points:
+            return np.column_stack((x, y)).astype(np.float64)
+        return resample_closed_shape(x, y, num_points)
+
+    def frame(self, t, out=None):
+        """
+        Shape at parameter t (0 to 1) as x and y views of out, which defaults to the
+        morph's own buffer and is therefore overwritten by the next call.
+        """
+        out = self.buffer if out is None else out
+        np.multiply(self.delta, t, out=out)
+        out += self.start
+        return out[:, 0], out[:, 1]
+
+    def frames(self, ts, out=None):
+        """(len(ts), points, 2) array with the shape at every parameter in ts"""
+        ts = np.asarray(ts, dtype=np.float64)[:, None, None]
+        if out is None:
+            out = np.empty((len(ts),) + self.start.shape)
+        np.multiply(self.delta, ts, out=out)
+        out += self.start
+        return out
+
 def interpolate_shapes(shape1_x, shape1_y, shape2_x, shape2_y, t):
     """
     Interpolates between two shapes using parameter t.
+    For more than one frame build a ShapeMorph once and call its frame method instead.
     
     Args:
         shape1_x, shape1_y: First shape coordinates.
@@ -125,25 +191,159 @@ def interpolate_shapes(shape1_x, shape1_y, shape2_x, shape2_y, t):
     Returns:
         tuple: Interpolated x and y coordinates.
     """
-    # Ensure both shapes have the same number of points by interpolation
-    num_points = max(len(shape1_x), len(shape2_x))
-    
-    # Resample shapes to have the same number of points
-    if len(shape1_x) != num_points:
-        indices = np.linspace(0, len(shape1_x)-1, num_points)
-        shape1_x = np.interp(indices, np.arange(len(shape1_x)), shape1_x)
-        shape1_y = np.interp(indices, np.arange(len(shape1_y)), shape1_y)
-    
-    if len(shape2_x) != num_points:
-        indices = np.linspace(0, len(shape2_x)-1, num_points)
-        shape2_x = np.interp(indices, np.arange(len(shape2_x)), shape2_x)
-        shape2_y = np.interp(indices, np.arange(len(shape2_y)), shape2_y)
-    
-    # Linear interpolation
-    x = (1 - t) * shape1_x + t * shape2_x
-    y = (1 - t) * shape1_y + t * shape2_y
-    
-    return x, y
+    return ShapeMorph(shape1_x, shape1_y, shape2_x, shape2_y).frame(t)
+
+def create_morph_keyframes(center_x, center_y, size, num_points=120):
+    """
+    Creates the keyframe shapes of the morphing animation.
+
+    Args:
+        center_x (float): X-coordinate of the center.
+        center_y (float): Y-coordinate of the center.
+        size (float): Size parameter (radius/side length).
+        num_points (int): Number of points per shape.
+
+    Returns:
+        numpy.ndarray: (4, num_points, 2) array holding triangle, circle, square, triangle.
+    """
+    triangle = np.column_stack(create_triangle_points(center_x, center_y, size, num_points))
+    circle = np.column_stack(create_circle_points(center_x, center_y, size, num_points))
+    square = np.column_stack(create_square_points(center_x, center_y, size * 1.4, num_points))  # Slightly larger for visual balance
+    return np.stack((triangle, circle, square, triangle))
+
+def create_morph_frames(keyframes, frames_per_transformation=60, pause_frames=30):
+    """
+    Precomputes every frame of the morphing animation in one vectorized interpolation.
+
+    Args:
+        keyframes (numpy.ndarray): (4, points, 2) keyframe shapes.
+        frames_per_transformation (int): Frames spent morphing between two shapes.
+        pause_frames (int): Frames spent resting on the circle and the square.
+
+    Returns:
+        tuple: (frames, points, 2) vertex tensor, phase index (0-2) and
+               interpolation parameter t of every frame.
+    """
+    period = frames_per_transformation + pause_frames
+    total_frames = 3 * frames_per_transformation + 2 * pause_frames
+    frame = np.arange(total_frames)
+    phase = np.minimum(frame // period, 2)
+    # t reaches 1 during the pauses, which gives back the target shape exactly
+    t = np.minimum((frame - phase * period) / frames_per_transformation, 1.0)
+
+    frames = np.empty((total_frames,) + keyframes[0].shape)
+    for index in range(3):
+        morph = ShapeMorph(*keyframes[index].T, *keyframes[index + 1].T)
+        in_phase = phase == index
+        frames[in_phase] = morph.frames(t[in_phase])
+    return frames, phase, t
+
+def _morph_to_pixels(frames, center_x, center_y, size, width, height):
+    # Same view as the interactive plot: center +- 2.5 * size, y pointing up
+    scale = min(width, height) / (5 * size)
+    pixels = np.empty_like(frames)
+    pixels[..., 0] = width / 2 + (frames[..., 0] - center_x) * scale
+    pixels[..., 1] = height / 2 - (frames[..., 1] - center_y) * scale
+    return pixels
+
+def _render_frame_range(pixel_frames, first_frame, width, height, pattern=None):
+    """
+    Rasterizes a run of frames into one reused framebuffer. Frames are written to
+    pattern.format(frame number) when a pattern is given and returned as an
+    (frames, height, width, 3) array otherwise.
+    """
+    framebuffer = Framebuffer(width, height, centered=False)
+    images = None if pattern else np.empty((len(pixel_frames), height, width, 3), dtype=np.uint8)
+
+    for i, points in enumerate(pixel_frames):
+        framebuffer.clear()
+        fill_polygon(framebuffer, points, '#add8e6')
+        framebuffer.polyline(points, 'blue', closed=True)
+        if pattern:
+            framebuffer.save(pattern.format(first_frame + i))
+        else:
+            images[i] = framebuffer.pixels[:, :, :3]
+    return len(pixel_frames) if pattern else images
+
+def _render_chunks(jobs, workers):
+    """
+    Yields the results of _render_frame_range for the jobs in order. With several workers,
+    at most `workers` chunks are rendering or waiting to be consumed at any time.
+    """
+    if workers <= 1 or len(jobs) <= 1:
+        for job in jobs:
+            yield _render_frame_range(*job)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for job in jobs:
+            pending.append(pool.submit(_render_frame_range, *job))
+            if len(pending) == workers:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def export_morphing_animation(output, center_x=0.0, center_y=0.0, size=100.0, width=500, height=500,
+                              frames_per_transformation=60, pause_frames=30, frame_range=None,
+                              workers=1, interval=100, chunk_frames=16):
+    """
+    Renders the morphing animation without a GUI event loop.
+
+    Args:
+        output (str): "name.gif" for an animated GIF (needs Pillow), or a PNG/PPM filename
+                      pattern with a frame number field such as "frames/morph_{:04d}.png".
+        center_x, center_y (float): Center of the shapes.
+        size (float): Size parameter (radius/side length).
+        width, height (int): Image size in pixels.
+        frames_per_transformation (int): Frames spent morphing between two shapes.
+        pause_frames (int): Frames spent resting on the circle and the square.
+        frame_range (tuple): Optional (start, stop) frame numbers to render.
+        workers (int): Number of worker processes rendering chunks of frames.
+        interval (int): Delay between GIF frames in milliseconds.
+        chunk_frames (int): Frames per chunk. Chunks are rendered ahead by at most `workers`
+                            and streamed to the output in order, so memory does not grow
+                            with the number of frames.
+
+    Returns:
+        dict: Number of frames rendered, elapsed seconds and frames per second.
+    """
+    is_gif = output.lower().endswith(".gif")
+    if not is_gif and "{" not in output:
+        raise ValueError("Output must end with .gif or be a filename pattern like 'morph_{:04d}.png'.")
+    if is_gif:
+        try:
+            from PIL import Image
+        except ImportError:
+            raise ValueError("GIF export needs Pillow; use a PNG filename pattern instead.")
+
+    start_time = time.perf_counter()
+    keyframes = create_morph_keyframes(center_x, center_y, size)
+    frames, _, _ = create_morph_frames(keyframes, frames_per_transformation, pause_frames)
+    start, stop = frame_range if frame_range else (0, len(frames))
+    pixel_frames = _morph_to_pixels(frames[start:stop], center_x, center_y, size, width, height)
+
+    pattern = None if is_gif else output
+    step = max(chunk_frames, 1)
+    jobs = [(pixel_frames[first:first + step], start + first, width, height, pattern)
+            for first in range(0, len(pixel_frames), step)]
+    results = _render_chunks(jobs, workers)
+
+    if is_gif:
+        # Pillow pulls the remaining frames from the generator while it encodes
+        images = (Image.fromarray(image) for result in results for image in result)
+        first_image = next(images, None)
+        if first_image is not None:
+            first_image.save(output, save_all=True, append_images=images, duration=interval, loop=0)
+    else:
+        for _ in results:
+            pass
+
+    elapsed = time.perf_counter() - start_time
+    rendered = len(pixel_frames)
+    fps = rendered / elapsed if elapsed > 0 else float("inf")
+    print(f"Rendered {rendered} frames in {elapsed:.2f} s ({fps:.1f} frames/s, {max(workers, 1)} worker(s))")
+    return {"frames": rendered, "seconds": elapsed, "fps": fps}
 
 def create_morphing_animation():
     """
@@ -162,11 +362,10 @@ def create_morphing_animation():
         pause_frames = 30
         total_frames = 3 * frames_per_transformation + 2 * pause_frames
         
-        # Create shapes with same number of points for smooth morphing
+        # Create shapes with same number of points for smooth morphing and precompute every frame
         num_morph_points = 120  # Divisible by 3 and 4 for clean triangle and square
-        triangle_x, triangle_y = create_triangle_points(center_x, center_y, size, num_morph_points)
-        circle_x, circle_y = create_circle_points(center_x, center_y, size, num_morph_points)
-        square_x, square_y = create_square_points(center_x, center_y, size * 1.4, num_morph_points)  # Slightly larger for visual balance
+        keyframes = create_morph_keyframes(center_x, center_y, size, num_morph_points)
+        morph_frames, _, _ = create_morph_frames(keyframes, frames_per_transformation, pause_frames)
         
         # Setup the plot
         fig, ax = plt.subplots(figsize=(10, 8))
@@ -201,33 +400,33 @@ def create_morphing_animation():
             if frame < frames_per_transformation:
                 # Triangle to Circle transformation
                 t = frame / frames_per_transformation
-                current_x, current_y = interpolate_shapes(triangle_x, triangle_y, circle_x, circle_y, t)
+                current_x, current_y = morph_frames[frame].T
                 current_title = f"Triangle → Circle (Progress: {t*100:.1f}%)"
                 progress = f"Phase 1/3: Triangle morphing to Circle"
                 
             elif frame < frames_per_transformation + pause_frames:
                 # Pause at circle
-                current_x, current_y = circle_x, circle_y
+                current_x, current_y = morph_frames[frame].T
                 current_title = "Circle (Pausing...)"
                 progress = f"Phase 1/3: Circle Complete"
                 
             elif frame < 2 * frames_per_transformation + pause_frames:
                 # Circle to Square transformation
                 t = (frame - frames_per_transformation - pause_frames) / frames_per_transformation
-                current_x, current_y = interpolate_shapes(circle_x, circle_y, square_x, square_y, t)
+                current_x, current_y = morph_frames[frame].T
                 current_title = f"Circle → Square (Progress: {t*100:.1f}%)"
                 progress = f"Phase 2/3: Circle morphing to Square"
                 
             elif frame < 2 * frames_per_transformation + 2 * pause_frames:
                 # Pause at square
-                current_x, current_y = square_x, square_y
+                current_x, current_y = morph_frames[frame].T
                 current_title = "Square (Pausing...)"
                 progress = f"Phase 2/3: Square Complete"
                 
             else:
                 # Square back to Triangle transformation
                 t = (frame - 2 * frames_per_transformation - 2 * pause_frames) / frames_per_transformation
-                current_x, current_y = interpolate_shapes(square_x, square_y, triangle_x, triangle_y, t)
+                current_x, current_y = morph_frames[frame].T
                 current_title = f"Square → Triangle (Progress: {t*100:.1f}%)"
                 progress = f"Phase 3/3: Square morphing back to Triangle"
             
@@ -335,10 +534,11 @@ def main():
         print("=== Menu ===")
         print("1. Run Morphing Animation")
         print("2. Show Static Shape Preview")
-        print("3. Exit")
+        print("3. Export Animation (GIF or PNG frames, no window)")
+        print("4. Exit")
         
         try:
-            choice = int(input("Enter your choice (1-3): "))
+            choice = int(input("Enter your choice (1-4): "))
             
             if choice == 1:
                 animation_obj = create_morphing_animation()
@@ -347,11 +547,18 @@ def main():
                 create_simple_static_demo()
                 
             elif choice == 3:
+                center_x, center_y = map(float, input("Enter center coordinates (x, y): ").split())
+                size = float(input("Enter size parameter (radius/side length): "))
+                output = input("Enter output (e.g. morph.gif or morph_{:04d}.png): ").strip()
+                workers = int(input("Enter number of worker processes: "))
+                export_morphing_animation(output, center_x, center_y, size, workers=workers)
+                
+            elif choice == 4:
                 print("Exiting program... Thank you!")
                 break
                 
             else:
-                print("Invalid choice! Please enter 1, 2, or 3.")
+                print("Invalid choice! Please enter 1, 2, 3, or 4.")
                 
         except ValueError:
             print("Invalid input! Please enter a valid number.")
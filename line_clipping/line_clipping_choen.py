@@ -2,6 +2,8 @@
 
 import turtle
 
+import numpy as np
+
 #regin codes
 inside = 0
 left = 1
@@ -111,6 +113,130 @@ def calculate_clip(x1,y1,x2,y2):
             
 
 
+#line classification codes returned by CohenSutherlandClipper.clip
+line_outside = 0
+line_inside = 1
+line_partial = 2
+
+class CohenSutherlandClipper:
+    '''
+    Cohen-Sutherland clipper bound to one window, clipping whole arrays of lines at once.
+    Region codes are computed for all endpoints together, trivial accept/reject is done with
+    bitwise array operations and only the remaining lines go through the clipping loop.
+    '''
+    def __init__(self, xmin, ymin, xmax, ymax):
+        if xmin > xmax or ymin > ymax:
+            raise ValueError("Window minimum must not exceed its maximum.")
+        self.xmin = xmin
+        self.ymin = ymin
+        self.xmax = xmax
+        self.ymax = ymax
+
+    def calculate_codes(self, x, y):
+        x = np.asarray(x)
+        y = np.asarray(y)
+        code = np.full(x.shape, inside, dtype=np.uint8)
+        code[x < self.xmin] |= left
+        code[x > self.xmax] |= right
+        code[y < self.ymin] |= bottom
+        code[y > self.ymax] |= top
+        return code
+
+    def clip(self, segments):
+        '''
+        segments is an (N, 4) array of lines (x1, y1, x2, y2). Returns a tuple of
+        classification: (N,) int8 array of line_outside / line_inside / line_partial
+        insidewindow: (N, 4) float array of the part inside the window, NaN for lines outside
+        outsidewindow: (K, 4) float array of the parts outside the window
+        outside_owner: (K,) index of the line each outside part belongs to
+        '''
+        segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+        n = segments.shape[0]
+
+        code1 = self.calculate_codes(segments[:, 0], segments[:, 1])
+        code2 = self.calculate_codes(segments[:, 2], segments[:, 3])
+
+        classification = np.full(n, line_outside, dtype=np.int8)
+        classification[(code1 | code2) == 0] = line_inside
+
+        insidewindow = np.full((n, 4), np.nan)
+        trivial = classification == line_inside
+        insidewindow[trivial] = segments[trivial]
+
+        # Only lines that are neither trivially accepted nor rejected need clipping
+        pending = np.flatnonzero(((code1 | code2) != 0) & ((code1 & code2) == 0))
+        clipped, accepted = self._clip_pending(segments[pending], code1[pending], code2[pending])
+        pending = pending[accepted]
+        classification[pending] = line_partial
+        insidewindow[pending] = clipped[accepted]
+
+        # Outside parts: whole rejected lines, plus the clipped-off ends of partial lines
+        rejected = np.flatnonzero(classification == line_outside)
+        start_cut = pending[code1[pending] != 0]
+        end_cut = pending[code2[pending] != 0]
+
+        outsidewindow = np.concatenate((
+            segments[rejected],
+            np.column_stack((segments[start_cut, 0:2], insidewindow[start_cut, 0:2])),
+            np.column_stack((insidewindow[end_cut, 2:4], segments[end_cut, 2:4])),
+        ))
+        outside_owner = np.concatenate((rejected, start_cut, end_cut))
+        order = np.argsort(outside_owner, kind="stable")
+
+        return classification, insidewindow, outsidewindow[order], outside_owner[order]
+
+    def _clip_pending(self, segments, code1, code2):
+        x1, y1, x2, y2 = (segments[:, i].copy() for i in range(4))
+        code1 = code1.copy()
+        code2 = code2.copy()
+        accepted = np.zeros(segments.shape[0], dtype=bool)
+        active = np.arange(segments.shape[0])
+
+        # Every pass moves one endpoint per line onto a window edge, so this runs at most four times
+        while active.size:
+            c1 = code1[active]
+            c2 = code2[active]
+
+            done_in = (c1 | c2) == 0
+            done_out = (c1 & c2) != 0
+            accepted[active[done_in]] = True
+            keep = ~(done_in | done_out)
+            active = active[keep]
+            c1 = c1[keep]
+            c2 = c2[keep]
+            if not active.size:
+                break
+
+            first = c1 != 0
+            code_out = np.where(first, c1, c2)
+            ax, ay = x1[active], y1[active]
+            bx, by = x2[active], y2[active]
+            x = np.empty(active.size)
+            y = np.empty(active.size)
+
+            with np.errstate(divide="ignore", invalid="ignore"):
+                is_top = (code_out & top) != 0
+                is_bottom = ~is_top & ((code_out & bottom) != 0)
+                is_right = ~is_top & ~is_bottom & ((code_out & right) != 0)
+                is_left = ~is_top & ~is_bottom & ~is_right
+
+                for mask, edge in ((is_top, self.ymax), (is_bottom, self.ymin)):
+                    x[mask] = ax[mask] + (bx[mask] - ax[mask]) * (edge - ay[mask]) / (by[mask] - ay[mask])
+                    y[mask] = edge
+                for mask, edge in ((is_right, self.xmax), (is_left, self.xmin)):
+                    y[mask] = ay[mask] + (by[mask] - ay[mask]) * (edge - ax[mask]) / (bx[mask] - ax[mask])
+                    x[mask] = edge
+
+            move1 = active[first]
+            move2 = active[~first]
+            x1[move1], y1[move1] = x[first], y[first]
+            x2[move2], y2[move2] = x[~first], y[~first]
+            code1[move1] = self.calculate_codes(x1[move1], y1[move1])
+            code2[move2] = self.calculate_codes(x2[move2], y2[move2])
+
+        return np.column_stack((x1, y1, x2, y2)), accepted
+
+
 def print_lines_and_screen(xmin, ymin, xmax, ymax, line_segments):
     turtle.speed(0)
     turtle.hideturtle()
@@ -150,38 +276,39 @@ def print_lines_and_screen(xmin, ymin, xmax, ymax, line_segments):
 
 
 
-#take input for window size
-x1_win,y1_win = map(int,input("Enter first corner of window (x1 y1): ").split())
-x2_win,y2_win = map(int,input("Enter second corner of window (x2 y2): ").split())
+if __name__ == "__main__":
+    #take input for window size
+    x1_win,y1_win = map(int,input("Enter first corner of window (x1 y1): ").split())
+    x2_win,y2_win = map(int,input("Enter second corner of window (x2 y2): ").split())
 
-# Automatically determine bottom-left and top-right corners
-xmin = min(x1_win, x2_win)
-xmax = max(x1_win, x2_win)
-ymin = min(y1_win, y2_win)
-ymax = max(y1_win, y2_win)
+    # Automatically determine bottom-left and top-right corners
+    xmin = min(x1_win, x2_win)
+    xmax = max(x1_win, x2_win)
+    ymin = min(y1_win, y2_win)
+    ymax = max(y1_win, y2_win)
 
-print(f"Window set: Bottom-left ({xmin}, {ymin}) to Top-right ({xmax}, {ymax})")
+    print(f"Window set: Bottom-left ({xmin}, {ymin}) to Top-right ({xmax}, {ymax})")
 
-#take input for line endpoints
-x1,y1 = map(int,input("Enter first endpoint of line (x1 y1): ").split())
-x2,y2 = map(int,input("Enter second endpoint of line (x2 y2): ").split())
+    #take input for line endpoints
+    x1,y1 = map(int,input("Enter first endpoint of line (x1 y1): ").split())
+    x2,y2 = map(int,input("Enter second endpoint of line (x2 y2): ").split())
 
-# Calculate clipping
-result = calculate_clip(x1, y1, x2, y2)
+    # Calculate clipping
+    result = calculate_clip(x1, y1, x2, y2)
 
-line_segments = []
-if result["inside"] == True:
-    line_segments.append((result["insidewindow"][0], result["insidewindow"][1], "solid"))
-elif result["inside"] == "partially":
-    line_segments.append((result["insidewindow"][0], result["insidewindow"][1], "solid"))
-    if result["outsidewindow"]:
-        for outside_segment in result["outsidewindow"]:
-            line_segments.append((outside_segment[0], outside_segment[1], "dotted"))
-elif result["inside"] == False:
-    if result["outsidewindow"]:
-        for outside_segment in result["outsidewindow"]:
-            line_segments.append((outside_segment[0], outside_segment[1], "dotted"))
+    line_segments = []
+    if result["inside"] == True:
+        line_segments.append((result["insidewindow"][0], result["insidewindow"][1], "solid"))
+    elif result["inside"] == "partially":
+        line_segments.append((result["insidewindow"][0], result["insidewindow"][1], "solid"))
+        if result["outsidewindow"]:
+            for outside_segment in result["outsidewindow"]:
+                line_segments.append((outside_segment[0], outside_segment[1], "dotted"))
+    elif result["inside"] == False:
+        if result["outsidewindow"]:
+            for outside_segment in result["outsidewindow"]:
+                line_segments.append((outside_segment[0], outside_segment[1], "dotted"))
             
-# Print lines and clipping window
-print_lines_and_screen(xmin, ymin, xmax, ymax, line_segments)
+    # Print lines and clipping window
+    print_lines_and_screen(xmin, ymin, xmax, ymax, line_segments)
 
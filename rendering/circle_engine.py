@@ -0,0 +1,153 @@
+# Shared circle engine: one octant as an array, mirrored into the full circle with array ops
+import numpy as np
+
+#decision rules of the circle algorithms in this repository
+# midpoint  - Mid_point_Circle (d = 1 - r, keep y while d < 0)
+# bresenham - Besherman_circle (d = 3 - 2r, keep y while d < 0)
+# dda       - dda_circle (p = 1 - r, keep x while p <= 0, stops before the diagonal)
+circle_rules = ("midpoint", "bresenham", "dda")
+
+
+#largest radius the closed form handles; the loop arithmetic stays exact in floating point below it
+exact_radius_limit = 2 ** 20
+
+
+def _octant_loop(r, rule):
+    # The incremental loop of `rule` itself, for radii whose decision variable the loop rounds
+    points = []
+    if rule == "dda":
+        x, y, p = r, 0, 1 - r
+        while x > y:
+            points.append((y, x))
+            y += 1
+            if p <= 0:
+                p += 2 * y + 1
+            else:
+                x -= 1
+                p += 2 * (y - x) + 1
+    elif rule == "bresenham":
+        x, y, d = 0, r, 3 - (2 * r)
+        while x <= y:
+            points.append((x, y))
+            if d < 0:
+                d = d + (4 * x) + 6
+            else:
+                y -= 1
+                d = d + (4 * (x - y)) + 10
+            x += 1
+    else:
+        x, y, d = 0, r, 1 - r
+        while x <= y:
+            points.append((x, y))
+            if d < 0:
+                d += 2 * x + 3
+            else:
+                d += 2 * (x - y) + 5
+                y -= 1
+            x += 1
+    return np.array(points, dtype=np.float64).reshape(-1, 2)
+
+
+def circle_octant(radius, rule="midpoint"):
+    """
+    Pixels of the octant from (0, r) to the diagonal as an (n, 2) array of (x, y), identical
+    to the pixels the incremental loop of `rule` visits, with x increasing. The array is
+    int64 for whole radii and float64 otherwise (y steps down from r by whole pixels).
+
+    Every column is solved directly from the closed form of the decision variable. That
+    matches the loop whenever the loop's arithmetic is exact, i.e. for radii on a quarter
+    pixel grid up to exact_radius_limit. For other radii such as 10.3 the decision variable
+    can be exactly zero in real arithmetic, where only the loop's rounding decides, so the
+    loop itself is run.
+    """
+    if rule not in circle_rules:
+        raise ValueError(f"Rule must be one of {', '.join(circle_rules)}.")
+    if radius < 0:
+        raise ValueError("Radius must not be negative.")
+    r = float(radius)
+    if not (r * 4).is_integer() or r > exact_radius_limit:
+        return _octant_loop(r, rule)
+
+    x = np.arange(int(r / np.sqrt(2)) + 2, dtype=np.int64)
+
+    # The decision keeps y = r - k in column x while (2y - offset)^2 < bound (<= for dda)
+    if rule == "bresenham":
+        bound = 4 * r * r - 8 * r + 7 - 4.0 * x * x
+        offset = 3
+    else:
+        bound = 4 * r * r + 1 - 4.0 * x * x
+        offset = 1
+
+    def keeps(k):
+        distance = (2 * (r - k) - offset) ** 2
+        return distance <= bound if rule == "dda" else distance < bound
+
+    # Smallest k that keeps, from the square root and corrected for its rounding
+    k = np.maximum(np.floor(r - (offset + np.sqrt(np.maximum(bound, 0))) / 2).astype(np.int64) + 1, 0)
+    k += ~keeps(k)
+    k -= (k > 0) & keeps(k - 1)
+    k[bound <= 0] = len(x) + 1
+    k[0] = 0
+
+    # The loops lower y by at most one pixel per column
+    k = x - np.maximum.accumulate(x - k)
+    y = r - k
+
+    inside = x < y if rule == "dda" else x <= y
+    n = int(np.argmin(inside)) if not inside.all() else len(x)
+    octant = np.column_stack((x[:n], y[:n]))
+    return octant.astype(np.int64) if r.is_integer() else octant
+
+
+def mirror_octant(octant, ordered=True):
+    """
+    Expand an octant from circle_octant into all eight octants around the origin.
+    The axis pixels and (when present) diagonal pixels shared by neighbouring octants
+    are kept once. With ordered=True the result walks the circle counter-clockwise
+    from (r, 0), so it can be drawn directly as a closed polyline.
+    """
+    n = len(octant)
+    if n == 0:
+        return np.empty((0, 2), dtype=octant.dtype)
+    if octant[0, 1] == 0:
+        return octant[:1].copy()
+
+    ox = octant[:, 0]
+    oy = octant[:, 1]
+    forward = np.arange(n)
+    backward = forward[::-1] if ordered else forward
+    on_diagonal = ox[-1] == oy[-1]
+
+    # (swap, sign x, sign y, index order) for the octants starting at 0, 45, 90, ... degrees
+    octants = (
+        (True, 1, 1, forward), (False, 1, 1, backward),
+        (False, -1, 1, forward), (True, -1, 1, backward),
+        (True, -1, -1, forward), (False, -1, -1, backward),
+        (False, 1, -1, forward), (True, 1, -1, backward),
+    )
+
+    pieces = []
+    for k, (swap, sx, sy, order) in enumerate(octants):
+        # Octants 1, 3, 5, 7 start on the diagonal shared with the previous one,
+        # octants 2, 4, 6 start on the axis shared with the previous one and
+        # octant 7 ends on the axis pixel octant 0 already starts with
+        if k % 2 == 1 and on_diagonal:
+            order = order[1:] if ordered else order[:-1]
+        elif k % 2 == 0 and k > 0:
+            order = order[1:]
+        if k == 7:
+            order = order[:-1] if ordered else order[1:]
+        px = oy[order] if swap else ox[order]
+        py = ox[order] if swap else oy[order]
+        pieces.append(np.column_stack((sx * px, sy * py)))
+
+    return np.concatenate(pieces)
+
+
+def circle_points(x_center, y_center, radius, rule="midpoint", ordered=True):
+    """
+    Every pixel of the circle once, as an (m, 2) array offset by the center.
+    See mirror_octant for the meaning of ordered.
+    """
+    points = mirror_octant(circle_octant(radius, rule), ordered)
+    return points + np.array((x_center, y_center))
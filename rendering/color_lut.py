@@ -0,0 +1,47 @@
+# Precomputed color lookup tables served by integer index
+import colorsys
+import functools
+import math
+
+import numpy as np
+
+
+class ColorLUT:
+    """
+    Table of colors indexed by integers that wrap around. lut[i] returns one color as a
+    tuple for drawing calls, lut.lookup(indices) colors a whole array of primitives at once.
+    For tables indexed by hue, entry i has hue i * 360 / len(lut) degrees.
+    """
+    def __init__(self, table):
+        self.table = np.array(table)
+        self.table.flags.writeable = False
+        self.colors = [tuple(row) for row in self.table.tolist()]
+
+    def __len__(self):
+        return len(self.colors)
+
+    def __getitem__(self, index):
+        return self.colors[int(index) % len(self.colors)]
+
+    def lookup(self, indices):
+        """Colors of an array of indices as an (..., 3) array"""
+        return self.table[np.asarray(indices, dtype=np.int64) % len(self.colors)]
+
+
+@functools.lru_cache(maxsize=None)
+def rainbow_lut(size=360):
+    """
+    Cosine rainbow of size entries with integer channels in 0-255: red, green and blue
+    follow the cosine of the hue shifted by 0, 120 and 240 degrees.
+    """
+    table = []
+    for i in range(size):
+        hue = i * 360 / size
+        table.append([int(255 * (1 + math.cos(math.radians(hue + shift))) / 2) for shift in (0, 120, 240)])
+    return ColorLUT(np.array(table, dtype=np.int64))
+
+
+@functools.lru_cache(maxsize=None)
+def hsv_lut(size=360, saturation=1.0, value=1.0):
+    """HSV colors of size evenly spaced hues as floats in 0-1, like colorsys returns them"""
+    return ColorLUT([colorsys.hsv_to_rgb(i / size, saturation, value) for i in range(size)])
@@ -0,0 +1,133 @@
+# Shared ellipse engine: one quadrant as an array, mirrored into an ordered closed contour
+import numpy as np
+
+#largest rx * ry the closed form handles; the loop arithmetic stays exact in floating point below it
+exact_area_limit = 2 ** 20
+
+
+def _quadrant_loop(rx, ry):
+    # The two-region midpoint loop itself, for radii whose decision variables the loop rounds
+    points = []
+    x = 0
+    y = ry
+    rx2 = rx * rx
+    ry2 = ry * ry
+    tworx2 = 2 * rx2
+    twory2 = 2 * ry2
+    px = 0
+    py = tworx2 * y
+
+    d1 = ry2 - (rx2 * ry) + (0.25 * rx2)
+    while px < py:
+        points.append((x, y))
+        x += 1
+        px += twory2
+        if d1 < 0:
+            d1 += ry2 + px
+        else:
+            y -= 1
+            py -= tworx2
+            d1 += ry2 + px - py
+
+    d2 = (ry2) * ((x + 0.5) ** 2) + (rx2) * ((y - 1) ** 2) - (rx2 * ry2)
+    while y >= 0:
+        points.append((x, y))
+        y -= 1
+        py -= tworx2
+        if d2 > 0:
+            d2 += rx2 - py
+        else:
+            x += 1
+            px += twory2
+            d2 += rx2 - py + px
+    return np.array(points, dtype=np.float64).reshape(-1, 2)
+
+
+def ellipse_quadrant(rx, ry):
+    """
+    Pixels of the quadrant from (0, ry) to (rx, 0) as an (n, 2) array of (x, y), identical
+    to the pixels of the two-region midpoint ellipse loop and in the same order. The array
+    is int64 for whole radii and float64 otherwise (y steps down from ry by whole pixels).
+
+    Region 1 is solved per column and region 2 per row from the closed form of the midpoint
+    decision variables. That matches the loop whenever the loop's arithmetic is exact, i.e.
+    for radii on a quarter pixel grid with rx * ry up to exact_area_limit; for other radii
+    the loop itself is run, as only its rounding decides where a decision variable is zero.
+    """
+    if rx < 0 or ry < 0:
+        raise ValueError("Radii must not be negative.")
+    rx = float(rx)
+    ry = float(ry)
+    if not ((rx * 4).is_integer() and (ry * 4).is_integer()) or rx * ry > exact_area_limit:
+        return _quadrant_loop(rx, ry)
+    rx2 = rx * rx
+    ry2 = ry * ry
+
+    # Region 1: y = ry - k is the largest value whose midpoint (x, y - 1/2) is inside the
+    # ellipse, i.e. rx2 * (2y - 1)^2 < 4 * ry2 * (rx2 - x^2), dropping at most one pixel per column
+    x = np.arange(int(rx) + 2, dtype=np.int64)
+    bound = 4 * ry2 * (rx2 - 1.0 * x * x)
+
+    def keeps(k):
+        return rx2 * (2 * (ry - k) - 1) ** 2 < bound
+
+    k = np.floor(ry - 0.5 - np.sqrt(np.maximum(bound, 0) / max(rx2, 1e-300)) / 2).astype(np.int64) + 1
+    k = np.clip(k, 0, len(x) + 1)
+    k += ~keeps(k)
+    k -= (k > 0) & keeps(k - 1)
+    k[bound <= 0] = len(x) + 1
+    k[0] = 0
+    k = x - np.maximum.accumulate(x - k)
+    y = ry - k
+
+    # Region 1 lasts while the slope is shallower than -1 (px < py in the loop)
+    region1 = ry2 * x < rx2 * y
+    n1 = int(np.argmin(region1)) if not region1.all() else len(x)
+    x_start = int(x[n1])
+
+    # Region 2: x is the smallest value whose midpoint (x + 1/2, row) is outside the ellipse,
+    # i.e. ry2 * (2x + 1)^2 > 4 * rx2 * (ry2 - row^2), advancing at most one pixel per row
+    rows = y[n1] - np.arange(int(np.floor(y[n1])) + 1)
+    bound = 4 * rx2 * (ry2 - rows * rows)
+
+    def outside(columns):
+        return ry2 * (2.0 * columns + 1) ** 2 > bound
+
+    columns = np.floor((np.sqrt(np.maximum(bound, 0) / max(ry2, 1e-300)) - 1) / 2).astype(np.int64) + 1
+    columns = np.clip(columns, x_start, x_start + len(rows))
+    columns += ~outside(columns)
+    columns -= (columns > x_start) & outside(columns - 1)
+    columns[:1] = x_start
+    step = np.arange(len(rows))
+    columns = np.minimum.accumulate(columns - step) + step
+
+    quadrant = np.empty((n1 + len(rows), 2), dtype=np.float64)
+    quadrant[:n1, 0] = x[:n1]
+    quadrant[:n1, 1] = y[:n1]
+    quadrant[n1:, 0] = columns
+    quadrant[n1:, 1] = rows
+    return quadrant.astype(np.int64) if rx.is_integer() and ry.is_integer() else quadrant
+
+
+def mirror_quadrant(quadrant):
+    """
+    Expand a quadrant from ellipse_quadrant into a closed contour walking counter-clockwise
+    from (rx, 0). Pixels on the x and y axes, which neighbouring quadrants share, are kept once.
+    """
+    qx = quadrant[:, 0]
+    qy = quadrant[:, 1]
+    off_y_axis = qx != 0
+    off_x_axis = qy != 0
+
+    return np.concatenate((
+        quadrant[::-1],
+        np.column_stack((-qx, qy))[off_y_axis],
+        np.column_stack((-qx, -qy))[off_y_axis & off_x_axis][::-1],
+        np.column_stack((qx, -qy))[off_x_axis],
+    ))
+
+
+def ellipse_points(x_center, y_center, rx, ry):
+    """Every pixel of the ellipse once, in contour order, as an (m, 2) array offset by the center"""
+    points = mirror_quadrant(ellipse_quadrant(rx, ry))
+    return points + np.array((x_center, y_center))
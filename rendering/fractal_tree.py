@@ -0,0 +1,77 @@
+# Level-by-level fractal tree generation as segment arrays
+import numpy as np
+
+from rendering.framebuffer import to_rgba
+
+
+def grow_tree(x, y, heading, length, scale, left_angle, right_angle=None, min_length=5.0, max_depth=None):
+    """
+    Generate every branch of one or more binary fractal trees without recursion. A branch
+    is drawn from its start point along its heading (degrees, turtle convention) and its
+    end point starts a right child turned by right_angle and a left child turned by
+    left_angle, both scale times as long. Branches shorter than min_length, or deeper
+    than max_depth levels, are not drawn and have no children.
+
+    x, y, heading and length may be arrays, one entry per root branch.
+
+    Returns a dict of arrays with one entry per branch, ordered level by level:
+    "segments" (N, 4) x1, y1, x2, y2, "heading", "length", "level", "root" (index of the
+    root branch), "parent" (index of the parent branch, -1 for roots) and "side"
+    (0 for right children, 1 for left children, -1 for roots).
+    """
+    right_angle = left_angle if right_angle is None else right_angle
+    x, y, heading, length = np.broadcast_arrays(*(np.atleast_1d(np.asarray(value, dtype=np.float64))
+                                                  for value in (x, y, heading, length)))
+    starts = np.column_stack((x, y))
+    count = len(starts)
+    root = np.arange(count)
+    parent = np.full(count, -1)
+    side = np.full(count, -1)
+
+    levels = []
+    first_index = 0
+    while count and (max_depth is None or len(levels) < max_depth):
+        keep = length >= min_length
+        if not keep.all():
+            starts, heading, length = starts[keep], heading[keep], length[keep]
+            root, parent, side = root[keep], parent[keep], side[keep]
+        count = len(length)
+        if not count:
+            break
+
+        radians = np.radians(heading)
+        ends = starts + length[:, None] * np.column_stack((np.cos(radians), np.sin(radians)))
+        levels.append((np.hstack((starts, ends)), heading, length, np.full(count, len(levels)),
+                       root, parent, side))
+
+        # Children of every branch of this level at once: all right children, then all left ones
+        index = first_index + np.arange(count)
+        first_index += count
+        starts = np.concatenate((ends, ends))
+        heading = np.concatenate((heading - right_angle, heading + left_angle))
+        length = np.concatenate((length, length)) * scale
+        root = np.concatenate((root, root))
+        parent = np.concatenate((index, index))
+        side = np.repeat([0, 1], count)
+
+    keys = ("segments", "heading", "length", "level", "root", "parent", "side")
+    if not levels:
+        empty = (np.empty((0, 4)), np.empty(0), np.empty(0)) + (np.empty(0, dtype=np.int64),) * 4
+        return dict(zip(keys, empty))
+    return {key: np.concatenate(arrays) for key, arrays in zip(keys, zip(*levels))}
+
+
+def fractal_tree(x, y, heading, length, scale, left_angle, right_angle=None, min_length=5.0,
+                 max_depth=None, color="white"):
+    """
+    Segments and colors of fractal trees, see grow_tree. color is one color for every
+    branch or an array with one color per root branch. Returns the (N, 4) segment array
+    and the (N, 4) RGBA color array.
+    """
+    tree = grow_tree(x, y, heading, length, scale, left_angle, right_angle, min_length, max_depth)
+    rgba = to_rgba(color)
+    if rgba.ndim == 2:
+        colors = rgba[tree["root"]]
+    else:
+        colors = np.broadcast_to(rgba, (len(tree["segments"]), 4))
+    return tree["segments"], colors
@@ -0,0 +1,225 @@
+# Headless software framebuffer backed by a NumPy RGBA array
+import struct
+import zlib
+
+import numpy as np
+
+#named colors used by the drawing scripts
+named_colors = {
+    "black": (0, 0, 0),
+    "white": (255, 255, 255),
+    "red": (255, 0, 0),
+    "green": (0, 128, 0),
+    "blue": (0, 0, 255),
+    "yellow": (255, 255, 0),
+    "orange": (255, 165, 0),
+    "purple": (128, 0, 128),
+    "gray": (128, 128, 128),
+    "cyan": (0, 255, 255),
+    "magenta": (255, 0, 255),
+    "gold": (255, 215, 0),
+    "lightgreen": (144, 238, 144),
+    "lightgray": (211, 211, 211),
+    "lightblue": (173, 216, 230),
+    "lightcoral": (240, 128, 128),
+}
+
+
+def to_rgba(color):
+    """
+    Convert a color name, "#rrggbb" string, integer (r, g, b[, a]) tuple in 0-255
+    or float tuple in 0-1 (as returned by colorsys) into an RGBA uint8 array.
+    """
+    if isinstance(color, str):
+        if color.startswith("#") and len(color) == 7:
+            color = tuple(int(color[i:i + 2], 16) for i in (1, 3, 5))
+        elif color in named_colors:
+            color = named_colors[color]
+        else:
+            raise ValueError(f"Unknown color '{color}'.")
+    rgba = np.asarray(color)
+    if rgba.shape[-1] not in (3, 4):
+        raise ValueError("Color must have 3 or 4 channels.")
+    if rgba.dtype.kind == "f":
+        rgba = np.rint(np.clip(rgba, 0.0, 1.0) * 255)
+    rgba = np.clip(rgba, 0, 255).astype(np.uint8)
+    if rgba.shape[-1] == 3:
+        alpha = np.full(rgba.shape[:-1] + (1,), 255, dtype=np.uint8)
+        rgba = np.concatenate((rgba, alpha), axis=-1)
+    return rgba
+
+
+def _window_parameters(start, end, xmin, ymin, xmax, ymax):
+    # Liang-Barsky parameters t0 <= t1 of the part of the segments from (N, 2) start to (N, 2)
+    # end inside the window, and the mask of the segments that have such a part
+    d_start = np.column_stack((start[:, 0] - xmin, xmax - start[:, 0], start[:, 1] - ymin, ymax - start[:, 1]))
+    d_end = np.column_stack((end[:, 0] - xmin, xmax - end[:, 0], end[:, 1] - ymin, ymax - end[:, 1]))
+    out_start, out_end = d_start < 0, d_end < 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = d_start / (d_start - d_end)
+    t0 = np.where(out_start, t, 0.0).max(axis=1)
+    t1 = np.where(out_end, t, 1.0).min(axis=1)
+    return t0, t1, ~(out_start & out_end).any(axis=1) & (t0 <= t1)
+
+
+class Framebuffer:
+    """
+    RGBA image of width x height pixels. With centered=True, coordinates follow turtle
+    graphics: (0, 0) is the middle of the image and y grows upwards. Otherwise (0, 0)
+    is the top-left pixel and y grows downwards. Pixels outside the image are ignored.
+    """
+    def __init__(self, width, height, background="white", centered=True):
+        self.width = width
+        self.height = height
+        self.centered = centered
+        self.background = background
+        self.pixels = np.empty((height, width, 4), dtype=np.uint8)
+        self.clear()
+
+    def clear(self, color=None):
+        self.pixels[:] = to_rgba(self.background if color is None else color)
+
+    def to_pixel(self, x, y):
+        """Map coordinates to integer (column, row) arrays"""
+        x = np.rint(np.asarray(x, dtype=np.float64)).astype(np.int64)
+        y = np.rint(np.asarray(y, dtype=np.float64)).astype(np.int64)
+        if self.centered:
+            return x + self.width // 2, self.height // 2 - y
+        return x, y
+
+    def plot(self, x, y, color="black"):
+        """Set a single pixel"""
+        column, row = self.to_pixel(x, y)
+        if 0 <= column < self.width and 0 <= row < self.height:
+            self.pixels[row, column] = to_rgba(color)
+
+    def scatter(self, points, color="black"):
+        """
+        Set many pixels at once. points is an (N, 2) array or list of (x, y) tuples, color is
+        one color for all points or an (N, 3|4) array with one color per point.
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        columns, rows = self.to_pixel(points[:, 0], points[:, 1])
+        visible = (columns >= 0) & (columns < self.width) & (rows >= 0) & (rows < self.height)
+
+        rgba = to_rgba(color)
+        if rgba.ndim == 2:
+            rgba = rgba[visible]
+        self.pixels[rows[visible], columns[visible]] = rgba
+
+    def fill_span(self, y, x_start, x_end, color="black"):
+        """Fill the horizontal run of pixels from x_start to x_end (inclusive) on row y"""
+        self.fill_spans([y], [x_start], [x_end], color)
+
+    def fill_spans(self, ys, x_starts, x_ends, color="black"):
+        """Fill many horizontal spans, each from x_starts[i] to x_ends[i] (inclusive) on row ys[i]"""
+        columns_start, rows = self.to_pixel(x_starts, ys)
+        columns_end, _ = self.to_pixel(x_ends, ys)
+        columns_start, columns_end = np.minimum(columns_start, columns_end), np.maximum(columns_start, columns_end)
+
+        # Clip spans to the image before expanding them into pixels
+        columns_start = np.maximum(columns_start, 0)
+        columns_end = np.minimum(columns_end, self.width - 1)
+        visible = (rows >= 0) & (rows < self.height) & (columns_start <= columns_end)
+        rows = rows[visible]
+        columns_start = columns_start[visible]
+        lengths = columns_end[visible] - columns_start + 1
+        if not lengths.size:
+            return
+
+        rgba = to_rgba(color)
+        if rgba.ndim == 2:
+            rgba = np.repeat(rgba[visible], lengths, axis=0)
+
+        # Column of every pixel: span start plus the offset inside the span
+        offsets = np.zeros(lengths.size, dtype=np.int64)
+        np.cumsum(lengths[:-1], out=offsets[1:])
+        columns = np.arange(int(lengths.sum())) - np.repeat(offsets - columns_start, lengths)
+        self.pixels[np.repeat(rows, lengths), columns] = rgba
+
+    def lines(self, segments, color="black"):
+        """
+        Draw independent straight segments given as an (N, 4) array of x1, y1, x2, y2, sampling
+        every segment DDA-style with one pixel per step along its major axis. color is one
+        color for all segments or an (N, 3|4) array with one color per segment. Only the steps
+        of the part of a segment inside the image are sampled, so far away end points cost
+        nothing.
+        """
+        segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+        rgba = to_rgba(color)
+        start = np.column_stack(self.to_pixel(segments[:, 0], segments[:, 1]))
+        end = np.column_stack(self.to_pixel(segments[:, 2], segments[:, 3]))
+
+        steps = np.abs(end - start).max(axis=1)
+
+        # Liang-Barsky clip to the image grown by half a pixel (samples are rounded), the
+        # step numbers at both ends of the visible part following from its parameters; one
+        # step of margin covers their rounding
+        t0, t1, shown = _window_parameters(start, end, -0.5, -0.5, self.width - 0.5, self.height - 0.5)
+        start = start[shown]
+        delta = end[shown] - start
+        steps = steps[shown]
+        if rgba.ndim == 2:
+            rgba = rgba[shown]
+        first = np.maximum(np.floor(t0[shown] * steps).astype(np.int64) - 1, 0)
+        last = np.minimum(np.ceil(steps - (1 - t1[shown]) * steps).astype(np.int64) + 1, steps)
+
+        # Steps first to last of every segment, its end point being step `steps`
+        counts = last - first + 1
+        offsets = np.zeros(counts.size, dtype=np.int64)
+        np.cumsum(counts[:-1], out=offsets[1:])
+        k = np.arange(int(counts.sum())) - np.repeat(offsets - first, counts)
+        fraction = k / np.repeat(np.maximum(steps, 1), counts)
+        samples = np.repeat(start, counts, axis=0) + np.rint(fraction[:, None] * np.repeat(delta, counts, axis=0))
+        samples = samples.astype(np.int64)
+        if rgba.ndim == 2:
+            rgba = np.repeat(rgba, counts, axis=0)
+
+        visible = ((samples[:, 0] >= 0) & (samples[:, 0] < self.width)
+                   & (samples[:, 1] >= 0) & (samples[:, 1] < self.height))
+        if rgba.ndim == 2:
+            rgba = rgba[visible]
+        samples = samples[visible]
+        self.pixels[samples[:, 1], samples[:, 0]] = rgba
+
+    def polyline(self, points, color="black", closed=False):
+        """Draw straight segments through an (N, 2) array of points"""
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if closed and len(points) > 1:
+            points = np.concatenate((points, points[:1]))
+        if len(points) < 2:
+            self.scatter(points, color)
+            return
+        self.lines(np.hstack((points[:-1], points[1:])), color)
+
+    def write_ppm(self, filename):
+        """Write the image as a binary PPM (alpha is dropped)"""
+        with open(filename, "wb") as f:
+            f.write(f"P6 {self.width} {self.height} 255\n".encode("ascii"))
+            f.write(np.ascontiguousarray(self.pixels[:, :, :3]).tobytes())
+
+    def write_png(self, filename):
+        """Write the image as an RGBA PNG using only zlib"""
+        def chunk(tag, data):
+            return (struct.pack(">I", len(data)) + tag + data
+                    + struct.pack(">I", zlib.crc32(tag + data) & 0xFFFFFFFF))
+
+        # Every scanline starts with filter type 0 (none)
+        raw = np.zeros((self.height, self.width * 4 + 1), dtype=np.uint8)
+        raw[:, 1:] = self.pixels.reshape(self.height, -1)
+        header = struct.pack(">IIBBBBB", self.width, self.height, 8, 6, 0, 0, 0)
+
+        with open(filename, "wb") as f:
+            f.write(b"\x89PNG\r\n\x1a\n")
+            f.write(chunk(b"IHDR", header))
+            f.write(chunk(b"IDAT", zlib.compress(raw.tobytes(), 6)))
+            f.write(chunk(b"IEND", b""))
+
+    def save(self, filename):
+        """Write a .png or .ppm file depending on the extension"""
+        if filename.lower().endswith(".png"):
+            self.write_png(filename)
+        elif filename.lower().endswith(".ppm"):
+            self.write_ppm(filename)
+        else:
+            raise ValueError("Filename must end with .png or .ppm.")
@@ -0,0 +1,326 @@
+# Clipping of segments and polygons against the view frustum in homogeneous clip space
+# (Liang-Barsky and Sutherland-Hodgman extended to 4D, before the perspective divide)
+import math
+import time
+
+import numpy as np
+
+#frustum planes as (x, y, z, w) coefficients: a clip space point p is inside plane i when
+#frustum_planes[i] @ p >= 0, i.e. -w <= x, y, z <= w (left, right, bottom, top, near, far)
+frustum_planes = np.array([
+    (1, 0, 0, 1), (-1, 0, 0, 1),
+    (0, 1, 0, 1), (0, -1, 0, 1),
+    (0, 0, 1, 1), (0, 0, -1, 1),
+], dtype=np.float64)
+frustum_planes.flags.writeable = False
+
+#the near plane alone, enough to keep w positive for the perspective divide
+near_plane = frustum_planes[4:5]
+
+
+def window_planes(xmin, ymin, xmax, ymax):
+    """
+    A rectangular 2D window as clipping planes for points (x, y, 0, 1), in the order of the
+    Cohen-Sutherland region code bits (left, right, bottom, top).
+
+    Returns:
+        numpy.ndarray: (4, 4) planes.
+    """
+    return np.array([(1, 0, 0, -xmin), (-1, 0, 0, xmax), (0, 1, 0, -ymin), (0, -1, 0, ymax)], dtype=np.float64)
+
+
+def homogeneous_2d(points):
+    """(N, 2) points as (N, 4) clip space points (x, y, 0, 1)"""
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+    return np.column_stack((points, np.zeros(len(points)), np.ones(len(points))))
+
+
+def to_clip(matrix, points):
+    """
+    Clip space coordinates of 3D points.
+
+    Args:
+        matrix (numpy.ndarray): 4x4 view-projection matrix.
+        points (array): (N, 3) points.
+
+    Returns:
+        numpy.ndarray: (N, 4) homogeneous (x, y, z, w) coordinates.
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    return points @ matrix[:, :3].T + matrix[:, 3]
+
+
+def outcodes(clip, planes=frustum_planes):
+    """
+    Outcodes of clip space points: bit i is set when a point is outside plane i.
+
+    Args:
+        clip (array): (N, 4) clip space points, extra columns are ignored.
+        planes (array): (P, 4) planes, at most 63.
+
+    Returns:
+        numpy.ndarray: (N,) int64 outcodes.
+    """
+    clip = np.asarray(clip, dtype=np.float64)
+    outside = clip[:, :4] @ np.asarray(planes).T < 0
+    return outside @ (1 << np.arange(len(planes), dtype=np.int64))
+
+
+def clip_segment(start, end, planes=frustum_planes):
+    """
+    Liang-Barsky clipping of one clip space segment.
+
+    Args:
+        start (sequence): (x, y, z, w) start point.
+        end (sequence): (x, y, z, w) end point.
+        planes (array): (P, 4) planes to clip against.
+
+    Returns:
+        tuple: (t0, t1) such that start + t * (end - start) is inside for t0 <= t <= t1,
+        or None when the segment is completely outside.
+    """
+    t0, t1 = 0.0, 1.0
+    for plane in planes:
+        d_start = float(np.dot(plane, start[:4]))
+        d_end = float(np.dot(plane, end[:4]))
+        if d_start < 0 and d_end < 0:
+            return None  # Both end points are outside this plane
+        if d_start < 0:
+            t0 = max(t0, d_start / (d_start - d_end))  # Entering
+        elif d_end < 0:
+            t1 = min(t1, d_start / (d_start - d_end))  # Leaving
+    if t0 > t1:
+        return None
+    return t0, t1
+
+
+def clip_segments(starts, ends, planes=frustum_planes):
+    """
+    Vectorized Liang-Barsky clipping of clip space segments.
+
+    Args:
+        starts (array): (N, 4 + K) start points, (x, y, z, w) followed by K attributes
+            (e.g. colors or world positions) that are interpolated along with them.
+        ends (array): (N, 4 + K) end points.
+        planes (array): (P, 4) planes to clip against.
+
+    Returns:
+        tuple: (M, 4 + K) clipped start points, (M, 4 + K) clipped end points and the
+        length-N accept mask. Segments that are completely inside are returned unchanged.
+    """
+    starts = np.asarray(starts, dtype=np.float64)
+    ends = np.asarray(ends, dtype=np.float64)
+    planes = np.asarray(planes, dtype=np.float64)
+    d_start = starts[:, :4] @ planes.T
+    d_end = ends[:, :4] @ planes.T
+    out_start, out_end = d_start < 0, d_end < 0
+
+    # Trivial reject (both end points outside one plane) and trivial accept (no end point outside)
+    accept = ~(out_start & out_end).any(axis=1)
+    crossing = np.flatnonzero(accept & (out_start | out_end).any(axis=1))
+
+    d_start, d_end = d_start[crossing], d_end[crossing]
+    out_start, out_end = out_start[crossing], out_end[crossing]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = d_start / (d_start - d_end)
+    t0 = np.where(out_start, t, 0.0).max(axis=1)
+    t1 = np.where(out_end, t, 1.0).min(axis=1)
+    accept[crossing[t0 > t1]] = False
+
+    clipped_starts = starts.copy()
+    clipped_ends = ends.copy()
+    a, b = starts[crossing], ends[crossing]
+    # Interpolate from the nearer end point so that t0 = 0 and t1 = 1 keep them exactly
+    clipped_starts[crossing] = a + t0[:, None] * (b - a)
+    clipped_ends[crossing] = b + (1 - t1)[:, None] * (a - b)
+    return clipped_starts[accept], clipped_ends[accept], accept
+
+
+def clip_polygon(points, planes=frustum_planes):
+    """
+    Sutherland-Hodgman clipping of one convex or concave clip space polygon.
+
+    Args:
+        points (array): (N, 4 + K) vertices, (x, y, z, w) followed by K attributes.
+        planes (array): (P, 4) planes to clip against.
+
+    Returns:
+        numpy.ndarray: (M, 4 + K) vertices of the clipped polygon, M is 0 when it is outside.
+    """
+    polygon = [np.asarray(point, dtype=np.float64) for point in points]
+    for plane in planes:
+        if not polygon:
+            break
+        clipped = []
+        for i, point in enumerate(polygon):
+            following = polygon[(i + 1) % len(polygon)]
+            d_point = float(np.dot(plane, point[:4]))
+            d_following = float(np.dot(plane, following[:4]))
+            if d_point >= 0:
+                clipped.append(point)
+            if (d_point >= 0) != (d_following >= 0):
+                t = d_point / (d_point - d_following)
+                clipped.append(point + t * (following - point))
+        polygon = clipped
+    width = np.shape(points)[1] if len(points) else 4
+    return np.array(polygon, dtype=np.float64).reshape(-1, width)
+
+
+def polygon_outcodes(codes, offsets):
+    """
+    Union and intersection of the vertex outcodes of packed polygons.
+
+    Args:
+        codes (array): (N,) vertex outcodes.
+        offsets (array): (P + 1,) polygon i has the vertices offsets[i] to offsets[i + 1].
+
+    Returns:
+        tuple: (P,) outcodes of the planes any vertex is outside of (none outside means the
+        polygon is inside) and (P,) outcodes of the planes all vertices are outside of (any
+        such plane means it is outside). Both are 0 for polygons without vertices.
+    """
+    counts = np.diff(offsets)
+    any_outside = np.zeros(len(counts), dtype=np.int64)
+    all_outside = np.zeros(len(counts), dtype=np.int64)
+    filled = np.flatnonzero(counts)
+    if len(filled):
+        any_outside[filled] = np.bitwise_or.reduceat(codes, offsets[filled])
+        all_outside[filled] = np.bitwise_and.reduceat(codes, offsets[filled])
+    return any_outside, all_outside
+
+
+def _take(points, offsets, polygons):
+    # Vertices and offsets of a subset of packed polygons
+    counts = np.diff(offsets)[polygons]
+    new_offsets = np.zeros(len(polygons) + 1, dtype=np.int64)
+    np.cumsum(counts, out=new_offsets[1:])
+    rows = np.repeat(offsets[polygons] - new_offsets[:-1], counts) + np.arange(new_offsets[-1])
+    return points[rows], new_offsets
+
+
+def clip_polygons(points, offsets, planes=frustum_planes):
+    """
+    Vectorized Sutherland-Hodgman clipping of many clip space polygons, one plane at a
+    time for all polygons together. Polygons that are completely inside are copied
+    unchanged and polygons completely outside one plane are dropped without clipping.
+
+    Args:
+        points (array): (N, 4 + K) packed vertices, (x, y, z, w) followed by K attributes.
+        offsets (array): (P + 1,) polygon i has the vertices offsets[i] to offsets[i + 1].
+        planes (array): (P, 4) planes to clip against.
+
+    Returns:
+        tuple: (M, 4 + K) packed clipped vertices and their (P + 1,) offsets. Polygon i
+        stays polygon i, with no vertices when nothing of it is left.
+    """
+    points = np.asarray(points, dtype=np.float64)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    planes = np.asarray(planes, dtype=np.float64)
+    counts = np.diff(offsets)
+    if offsets[0] != 0 or offsets[-1] != len(points) or (counts < 0).any():
+        raise ValueError("offsets must rise from 0 to the number of points.")
+
+    # Trivial accept and reject from the union and intersection of the vertex outcodes
+    any_outside, all_outside = polygon_outcodes(outcodes(points, planes), offsets)
+    inside = np.flatnonzero((counts > 0) & (any_outside == 0))
+    crossing = np.flatnonzero((any_outside != 0) & (all_outside == 0))
+
+    polygon, polygon_offsets = _take(points, offsets, crossing)
+    for plane in planes:
+        d = polygon[:, :4] @ plane
+        if (d >= 0).all():
+            continue
+        # Every edge from a vertex to the next one in its polygon emits the vertex when it is
+        # inside and the intersection with the plane when the edge crosses it
+        polygon_counts = np.diff(polygon_offsets)
+        following = np.arange(1, len(polygon) + 1)
+        ends = polygon_offsets[1:][polygon_counts > 0]
+        following[ends - 1] = polygon_offsets[:-1][polygon_counts > 0]
+        d_following = d[following]
+        kept = d >= 0
+        cut = kept != (d_following >= 0)
+
+        emitted = np.zeros(len(polygon) + 1, dtype=np.int64)
+        np.cumsum(kept.astype(np.int64) + cut, out=emitted[1:])
+        cut = np.flatnonzero(cut)
+        # Copy the kept vertices with one gather (the rows of the intersections are overwritten)
+        source = np.zeros(emitted[-1], dtype=np.int64)
+        kept = np.flatnonzero(kept)
+        source[emitted[kept]] = kept
+        clipped = polygon[source]
+        d_cut, d_end = d[cut], d_following[cut]
+        start, end = polygon[cut], polygon[following[cut]]
+        clipped[emitted[cut] + (d_cut >= 0)] = start + (d_cut / (d_cut - d_end))[:, None] * (end - start)
+        polygon, polygon_offsets = clipped, emitted[polygon_offsets]
+
+    # Polygons reduced to a point or an edge are dropped too
+    polygon_counts = np.diff(polygon_offsets)
+    polygon_counts[polygon_counts < 3] = 0
+    polygon = polygon[np.repeat(np.diff(polygon_offsets) >= 3, np.diff(polygon_offsets))]
+
+    # Put the untouched and the clipped polygons back in their original order
+    result_counts = np.zeros(len(counts), dtype=np.int64)
+    result_counts[inside] = counts[inside]
+    result_counts[crossing] = polygon_counts
+    result_offsets = np.zeros(len(counts) + 1, dtype=np.int64)
+    np.cumsum(result_counts, out=result_offsets[1:])
+    result = np.empty((result_offsets[-1], points.shape[1]))
+    for polygons, packed in ((inside, _take(points, offsets, inside)[0]), (crossing, polygon)):
+        group_counts = result_counts[polygons]
+        group_offsets = np.concatenate(([0], np.cumsum(group_counts)))
+        rows = np.repeat(result_offsets[polygons] - group_offsets[:-1], group_counts) + np.arange(group_offsets[-1])
+        result[rows] = packed
+    return result, result_offsets
+
+
+def benchmark_frustum_clip(sizes=(10**4, 10**5, 10**6), scalar_limit=10**4, repeat=3, seed=0):
+    """
+    Compare clip_segment and clip_polygon against clip_segments and clip_polygons on random
+    segments and triangles in a clip space box twice as wide as the frustum (w = 1).
+    The scalar versions are only timed up to scalar_limit items and extrapolated beyond
+    that, and the batch results are checked against them on that prefix.
+    """
+    rng = np.random.default_rng(seed)
+
+    print("=== Homogeneous Frustum Clipping Benchmark ===")
+    print(f"{'items':>10} {'kind':>10} {'scalar (s)':>12} {'batch (s)':>12} {'speedup':>10}")
+    for n in sizes:
+        starts = np.column_stack((rng.uniform(-2, 2, (n, 3)), np.ones(n)))
+        ends = np.column_stack((rng.uniform(-2, 2, (n, 3)), np.ones(n)))
+        triangles = np.column_stack((rng.uniform(-2, 2, (n * 3, 3)), np.ones(n * 3)))
+        offsets = np.arange(n + 1) * 3
+        m = min(n, scalar_limit)
+
+        batch_time = math.inf
+        for _ in range(repeat):
+            start = time.perf_counter()
+            clipped_starts, clipped_ends, accept = clip_segments(starts, ends)
+            batch_time = min(batch_time, time.perf_counter() - start)
+        start = time.perf_counter()
+        scalar_results = [clip_segment(a, b) for a, b in zip(starts[:m], ends[:m])]
+        scalar_time = (time.perf_counter() - start) * n / m
+        if not np.array_equal(accept[:m], [result is not None for result in scalar_results]):
+            raise ValueError("Batch accept mask differs from scalar clipper")
+        expected = np.array([starts[i] + result[0] * (ends[i] - starts[i])
+                             for i, result in enumerate(scalar_results) if result is not None]).reshape(-1, 4)
+        if not np.allclose(clipped_starts[:len(expected)], expected):
+            raise ValueError("Batch clipped segments differ from scalar clipper")
+        note = "" if m == n else " (scalar extrapolated)"
+        print(f"{n:>10} {'segments':>10} {scalar_time:>12.4f} {batch_time:>12.4f} {scalar_time / batch_time:>9.1f}x{note}")
+
+        batch_time = math.inf
+        for _ in range(repeat):
+            start = time.perf_counter()
+            clipped, clipped_offsets = clip_polygons(triangles, offsets)
+            batch_time = min(batch_time, time.perf_counter() - start)
+        start = time.perf_counter()
+        scalar_results = [clip_polygon(triangles[i * 3:i * 3 + 3]) for i in range(m)]
+        scalar_time = (time.perf_counter() - start) * n / m
+        expected = [result if len(result) >= 3 else result[:0] for result in scalar_results]
+        if not np.allclose(clipped[:clipped_offsets[m]], np.vstack(expected)):
+            raise ValueError("Batch clipped polygons differ from scalar clipper")
+        print(f"{n:>10} {'triangles':>10} {scalar_time:>12.4f} {batch_time:>12.4f} {scalar_time / batch_time:>9.1f}x{note}")
+
+
+if __name__ == "__main__":
+    benchmark_frustum_clip()
@@ -0,0 +1,75 @@
+# Glyph atlas for drawing thousands of characters into a Framebuffer per call
+import numpy as np
+
+from rendering.framebuffer import to_rgba
+
+#5x7 bitmap font for the characters the digit visualizations draw
+digit_font = {
+    "0": ("01110", "10001", "10011", "10101", "11001", "10001", "01110"),
+    "1": ("00100", "01100", "00100", "00100", "00100", "00100", "01110"),
+    "2": ("01110", "10001", "00001", "00010", "00100", "01000", "11111"),
+    "3": ("11111", "00010", "00100", "00010", "00001", "10001", "01110"),
+    "4": ("00010", "00110", "01010", "10010", "11111", "00010", "00010"),
+    "5": ("11111", "10000", "11110", "00001", "00001", "10001", "01110"),
+    "6": ("00110", "01000", "10000", "11110", "10001", "10001", "01110"),
+    "7": ("11111", "00001", "00010", "00100", "01000", "01000", "01000"),
+    "8": ("01110", "10001", "10001", "01110", "10001", "10001", "01110"),
+    "9": ("01110", "10001", "10001", "01111", "00001", "00010", "01100"),
+    ".": ("00000", "00000", "00000", "00000", "00000", "01100", "01100"),
+}
+
+
+class GlyphAtlas:
+    """
+    Glyphs of a bitmap font rasterized once per (character, pixel height) and kept as
+    arrays of pixel offsets, so drawing a batch of characters is one scatter per
+    distinct (character, size) pair instead of one call per character.
+    """
+    def __init__(self, font=digit_font):
+        self.font = {char: np.array([[bit == "1" for bit in row] for row in rows])
+                     for char, rows in font.items()}
+        self._offsets = {}
+
+    def glyph(self, char, size):
+        """Boolean mask of char scaled (nearest neighbour) to size pixels high"""
+        if char not in self.font:
+            raise ValueError(f"No glyph for character '{char}'.")
+        bitmap = self.font[char]
+        height = max(int(size), 1)
+        width = max(int(round(height * bitmap.shape[1] / bitmap.shape[0])), 1)
+        rows = np.arange(height) * bitmap.shape[0] // height
+        columns = np.arange(width) * bitmap.shape[1] // width
+        return bitmap[rows[:, None], columns[None, :]]
+
+    def offsets(self, char, size):
+        """
+        (k, 2) x/y offsets of the set pixels of a glyph from its anchor, which is the middle
+        of the glyph's bottom edge like turtle's write(align="center"). y grows upwards.
+        """
+        key = (char, int(size))
+        if key not in self._offsets:
+            mask = self.glyph(char, size)
+            rows, columns = np.nonzero(mask)
+            self._offsets[key] = np.column_stack((columns - mask.shape[1] // 2,
+                                                  mask.shape[0] - 1 - rows)).astype(np.float64)
+        return self._offsets[key]
+
+    def draw(self, framebuffer, chars, xs, ys, sizes, colors="white"):
+        """
+        Draw characters at anchor points (xs[i], ys[i]) with pixel heights sizes[i].
+        colors is one color for all characters or an (N, 3|4) array with one per character.
+        """
+        chars = np.asarray(list(chars) if isinstance(chars, str) else chars)
+        anchors = np.column_stack((np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64)))
+        sizes = np.broadcast_to(np.asarray(sizes, dtype=np.int64), chars.shape)
+        rgba = to_rgba(colors)
+
+        # Group by (size, character) so every group is one broadcast add and one scatter
+        for size in np.unique(sizes):
+            same_size = sizes == size
+            for char in np.unique(chars[same_size]):
+                selected = same_size & (chars == char)
+                offsets = self.offsets(str(char), size)
+                points = (anchors[selected][:, None, :] + offsets[None, :, :]).reshape(-1, 2)
+                color = np.repeat(rgba[selected], len(offsets), axis=0) if rgba.ndim == 2 else rgba
+                framebuffer.scatter(points, color)
@@ -0,0 +1,386 @@
+# Clipping of packed polygons against a rectangular window: batched Sutherland-Hodgman and
+# Weiler-Atherton for concave polygons
+import math
+import time
+
+import numpy as np
+
+from rendering.frustum_clip import (clip_polygon, clip_polygons, clip_segments, homogeneous_2d, outcodes,
+                                    polygon_outcodes, window_planes)
+
+
+def pack_polygons(polygons):
+    """
+    Packed form of a list of polygons.
+
+    Args:
+        polygons (list): (N_i, 2) vertex arrays or lists of (x, y) points.
+
+    Returns:
+        tuple: (N, 2) vertex array and (P + 1,) offsets, polygon i has the vertices
+        offsets[i] to offsets[i + 1].
+    """
+    arrays = [np.asarray(polygon, dtype=np.float64).reshape(-1, 2) for polygon in polygons]
+    offsets = np.zeros(len(arrays) + 1, dtype=np.int64)
+    np.cumsum([len(array) for array in arrays], out=offsets[1:])
+    points = np.concatenate(arrays) if arrays else np.empty((0, 2))
+    return points, offsets
+
+
+def unpack_polygons(points, offsets):
+    """List of the (N_i, 2) vertex arrays of packed polygons"""
+    return [points[start:end] for start, end in zip(offsets[:-1], offsets[1:])]
+
+
+class PolygonClipper:
+    '''
+    Polygon clipper bound to one window, given as (xmin, ymin, xmax, ymax) like the window of
+    liang_barsky_clip_batch and CohenSutherlandClipper. Polygons are passed packed (see
+    pack_polygons) so that thousands of them are clipped per call. Polygons completely inside
+    or completely outside the window are found from region codes for all polygons at once;
+    only the others are clipped, by the homogeneous clippers of rendering.frustum_clip with
+    the window edges as planes (see window_planes).
+
+    After every call of clip(), stats holds its counts and timings, see timing_report().
+    '''
+    def __init__(self, xmin, ymin, xmax, ymax):
+        if xmin > xmax or ymin > ymax:
+            raise ValueError("Window minimum must not exceed its maximum.")
+        self.xmin = xmin
+        self.ymin = ymin
+        self.xmax = xmax
+        self.ymax = ymax
+        self.planes = window_planes(xmin, ymin, xmax, ymax)
+        self.stats = {}
+
+    def clip(self, points, offsets, method="sutherland-hodgman"):
+        '''
+        Clip packed polygons to the window.
+
+        method 'sutherland-hodgman' clips all polygons together one window edge at a time.
+        A concave polygon that leaves and re-enters the window stays one polygon, its parts
+        joined by edges along the window boundary. 'weiler-atherton' walks the boundary of
+        every such polygon instead and returns its separate parts as separate polygons; it
+        expects simple polygons (no self-intersections) and returns them counter-clockwise.
+
+        Returns a tuple of
+        points: (M, 2) packed vertices of the clipped polygons
+        offsets: (Q + 1,) offsets of the clipped polygons
+        owner: (Q,) index of the input polygon every clipped polygon belongs to
+        '''
+        if method not in ("sutherland-hodgman", "weiler-atherton"):
+            raise ValueError("method must be 'sutherland-hodgman' or 'weiler-atherton'.")
+        start = time.perf_counter()
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        offsets = np.asarray(offsets, dtype=np.int64)
+        counts = np.diff(offsets)
+        if offsets[0] != 0 or offsets[-1] != len(points) or (counts < 0).any():
+            raise ValueError("offsets must rise from 0 to the number of points.")
+
+        any_outside, all_outside = polygon_outcodes(outcodes(homogeneous_2d(points), self.planes), offsets)
+        inside = (counts > 0) & (any_outside == 0)
+        crossing = (any_outside != 0) & (all_outside == 0)
+        classified = time.perf_counter()
+
+        if method == "sutherland-hodgman":
+            clipped, clipped_offsets = clip_polygons(homogeneous_2d(points), offsets, self.planes)
+            clipped, clipped_offsets = _drop_packed_repeats(self._snap(clipped[:, :2]), clipped_offsets)
+            owner = np.flatnonzero(np.diff(clipped_offsets))
+            clipped_offsets = np.concatenate(([0], clipped_offsets[owner + 1]))
+        else:
+            clipped, clipped_offsets, owner = self._weiler_atherton(points, offsets, inside, crossing)
+        end = time.perf_counter()
+
+        self.stats = dict(
+            method=method,
+            polygons=len(counts),
+            inside=int(inside.sum()),
+            outside=int(len(counts) - inside.sum() - crossing.sum()),
+            clipped=int(crossing.sum()),
+            output_polygons=len(owner),
+            input_vertices=len(points),
+            output_vertices=len(clipped),
+            classify_seconds=classified - start,
+            clip_seconds=end - classified,
+            seconds=end - start,
+        )
+        return clipped, clipped_offsets, owner
+
+    def timing_report(self):
+        '''Summary of the last clip() call with the time per polygon and per clipped polygon'''
+        stats = self.stats
+        if not stats:
+            return "No polygons clipped yet"
+        polygons = max(stats["polygons"], 1)
+        clipped = max(stats["clipped"], 1)
+        return "\n".join([
+            f"method            {stats['method']}",
+            f"polygons          {stats['polygons']} ({stats['inside']} inside, {stats['outside']} outside, "
+            f"{stats['clipped']} clipped)",
+            f"output            {stats['output_polygons']} polygons, {stats['output_vertices']} vertices "
+            f"(from {stats['input_vertices']})",
+            f"classify          {stats['classify_seconds'] * 1000:.3f} ms",
+            f"clip              {stats['clip_seconds'] * 1000:.3f} ms",
+            f"per polygon       {stats['seconds'] / polygons * 1e6:.3f} us",
+            f"per clipped       {stats['clip_seconds'] / clipped * 1e6:.3f} us",
+        ])
+
+    def _snap(self, points):
+        # Intersections computed by interpolation can miss the window edge by a rounding error
+        return np.column_stack((np.clip(points[:, 0], self.xmin, self.xmax),
+                                np.clip(points[:, 1], self.ymin, self.ymax)))
+
+    def _perimeter(self, points):
+        # Positions of (N, 2) points on the window boundary, counter-clockwise from (xmin, ymin)
+        x, y = points[:, 0], points[:, 1]
+        width, height = self.xmax - self.xmin, self.ymax - self.ymin
+        edge = np.argmin(np.column_stack((y - self.ymin, self.xmax - x, self.ymax - y, x - self.xmin)), axis=1)
+        positions = np.column_stack((x - self.xmin, width + y - self.ymin, width + height + self.xmax - x,
+                                     2 * width + height + self.ymax - y))
+        return positions[np.arange(len(points)), edge]
+
+    def _weiler_atherton(self, points, offsets, inside, crossing):
+        counts = np.diff(offsets)
+        parts, owner = [], []
+        for polygon in np.flatnonzero(inside):
+            part = points[offsets[polygon]:offsets[polygon + 1]]
+            parts.append(part if _signed_area(part) >= 0 else part[::-1])
+            owner.append(polygon)
+        if crossing.any():
+            # Clip every edge of the crossing polygons (made counter-clockwise) at once, the
+            # rest is one walk per polygon
+            crossing = np.flatnonzero(crossing)
+            polygon_points = [points[offsets[polygon]:offsets[polygon + 1]] for polygon in crossing]
+            polygon_points = [polygon if _signed_area(polygon) >= 0 else polygon[::-1] for polygon in polygon_points]
+            starts = np.concatenate(polygon_points)
+            ends = np.concatenate([np.roll(polygon, -1, axis=0) for polygon in polygon_points])
+            clipped_starts, clipped_ends, accept = clip_segments(homogeneous_2d(starts), homogeneous_2d(ends),
+                                                                 self.planes)
+            visible_starts = starts.copy()
+            visible_ends = ends.copy()
+            visible_starts[accept] = self._snap(clipped_starts[:, :2])
+            visible_ends[accept] = self._snap(clipped_ends[:, :2])
+            entering = accept & (visible_starts != starts).any(axis=1)
+            leaving = accept & (visible_ends != ends).any(axis=1)
+            start_positions = self._perimeter(visible_starts)
+            end_positions = self._perimeter(visible_ends)
+
+            edge_offsets = np.concatenate(([0], np.cumsum(counts[crossing])))
+            for i, polygon in enumerate(crossing):
+                edges = np.arange(edge_offsets[i], edge_offsets[i + 1])
+                for part in self._walk(polygon_points[i], edges[accept[edges]], entering, leaving, visible_starts,
+                                       visible_ends, start_positions, end_positions):
+                    parts.append(part)
+                    owner.append(polygon)
+
+        order = np.argsort(owner, kind="stable")
+        clipped, clipped_offsets = pack_polygons([parts[i] for i in order])
+        return clipped, clipped_offsets, np.array(owner, dtype=np.int64)[order]
+
+    def _walk(self, polygon, edges, entering, leaving, visible_starts, visible_ends, start_positions, end_positions):
+        # Chains of the polygon boundary inside the window, each from an entering to a leaving
+        # intersection, found by walking along the visible edges from the first entering one
+        entries = [k for k in edges if entering[k]]
+        chains, chain_entries, chain_exits = [], [], []
+        if entries:
+            first = int(np.searchsorted(edges, entries[0]))
+            for k in np.concatenate((edges[first:], edges[:first])):
+                if entering[k]:
+                    chains.append([visible_starts[k]])
+                    chain_entries.append(start_positions[k])
+                else:
+                    chains[-1].append(visible_starts[k])
+                if leaving[k]:
+                    chains[-1].append(visible_ends[k])
+                    chain_exits.append(end_positions[k])
+        # Chains that only touch the window in one point are dropped, with a tolerance since an
+        # edge through a window corner clips to a segment only a rounding error long
+        width, height = self.xmax - self.xmin, self.ymax - self.ymin
+        perimeter = 2 * (width + height) or 1.0
+        tolerance = 1e-9 * perimeter
+        touching = [np.ptp(np.array(chain), axis=0).max() > tolerance for chain in chains]
+        chains = [np.array(chain) for chain, keep in zip(chains, touching) if keep]
+        entries = np.array([position for position, keep in zip(chain_entries, touching) if keep])
+        exits = np.array([position for position, keep in zip(chain_exits, touching) if keep])
+
+        if not chains:
+            # No part of the boundary is inside: the polygon covers the window or misses it
+            center = ((self.xmin + self.xmax) / 2, (self.ymin + self.ymax) / 2)
+            if _contains(polygon, center):
+                return [np.array([(self.xmin, self.ymin), (self.xmax, self.ymin),
+                                  (self.xmax, self.ymax), (self.xmin, self.ymax)], dtype=np.float64)]
+            return []
+
+        # Leave every chain at its exit and follow the window boundary counter-clockwise to the
+        # nearest entry, passing the window corners in between. A corner at the exit or the
+        # entry is that point of the chain already.
+        corners = np.array([(self.xmin, self.ymin), (self.xmax, self.ymin),
+                            (self.xmax, self.ymax), (self.xmin, self.ymax)], dtype=np.float64)
+        corner_positions = np.array([0, width, width + height, 2 * width + height], dtype=np.float64)
+
+        parts = []
+        unvisited = set(range(len(chains)))
+        while unvisited:
+            first = current = min(unvisited)
+            unvisited.discard(first)
+            part = []
+            while True:
+                part.extend(chains[current])
+                distance = _ahead(entries, exits[current], perimeter, tolerance)
+                following = int(np.argmin(distance))
+                passed = _ahead(corner_positions, exits[current], perimeter, tolerance)
+                between = np.flatnonzero((passed > tolerance) & (passed < distance[following] - tolerance))
+                part.extend(corners[between[np.argsort(passed[between])]])
+                if following == first or following not in unvisited:
+                    break
+                unvisited.discard(following)
+                current = following
+            part = _drop_repeats(np.array(part))
+            if len(part) >= 3:
+                parts.append(part)
+        return parts
+
+
+def _signed_area(points):
+    # Shoelace formula, positive for counter-clockwise polygons
+    x, y = points[:, 0], points[:, 1]
+    return 0.5 * float(np.dot(x, np.roll(y, -1)) - np.dot(np.roll(x, -1), y))
+
+
+def _contains(points, point):
+    # Even-odd rule point in polygon test
+    x, y = point
+    x1, y1 = points[:, 0], points[:, 1]
+    x2, y2 = np.roll(x1, -1), np.roll(y1, -1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        crosses = ((y1 > y) != (y2 > y)) & (x < x1 + (y - y1) * (x2 - x1) / (y2 - y1))
+    return bool(np.count_nonzero(crosses) % 2)
+
+
+def _ahead(positions, origin, perimeter, tolerance):
+    # Counter-clockwise distances along the window boundary from origin, those within the
+    # tolerance of a full turn are the same position
+    distance = (positions - origin) % perimeter
+    distance[distance > perimeter - tolerance] = 0.0
+    return distance
+
+
+def _drop_repeats(points):
+    # Remove vertices equal to the one before them (cyclically)
+    keep = (points != np.roll(points, 1, axis=0)).any(axis=1)
+    return points[keep] if keep.any() else points[:1]
+
+
+def _drop_packed_repeats(points, offsets):
+    # _drop_repeats on every packed polygon at once
+    counts = np.diff(offsets)
+    starts = offsets[:-1][counts > 0]
+    previous = np.arange(len(points)) - 1
+    previous[starts] = offsets[1:][counts > 0] - 1
+    keep = (points != points[previous]).any(axis=1)
+    if len(starts):
+        keep[starts] |= ~np.logical_or.reduceat(keep, starts)
+    kept = np.zeros(len(counts), dtype=np.int64)
+    if len(starts):
+        kept[counts > 0] = np.add.reduceat(keep.astype(np.int64), starts)
+    new_offsets = np.zeros_like(offsets)
+    np.cumsum(kept, out=new_offsets[1:])
+    return points[keep], new_offsets
+
+
+# Polygons with edges through the corners or along the edges of the window (0, 0, 10, 10),
+# clipped by benchmark_polygon_clip before timing
+degenerate_polygons = [
+    [(10, 8), (3, 5), (1, 5), (4, 3), (5, 0), (2, -5), (6, -4), (11, 1)],
+    [(14, 5), (5, 7), (5, 6), (3, 10), (-2, 10), (-1, 7), (-2, 6), (1, -3), (10, 1)],
+    [(4, 4), (4, -2), (4, -5), (-1, 3), (-7, -2), (-8, 12), (-5, 12), (-3, 9), (6, 12)],
+]
+
+
+def check_degenerate_polygons():
+    """
+    Clip degenerate_polygons with both methods and check their areas against the scalar
+    clip_polygon and that no clipped polygon repeats a vertex.
+
+    Raises:
+        ValueError: If a method gets an area wrong or repeats a vertex.
+    """
+    clipper = PolygonClipper(0.0, 0.0, 10.0, 10.0)
+    points, offsets = pack_polygons(degenerate_polygons)
+    homogeneous = homogeneous_2d(points)
+    expected = np.array([abs(_signed_area(clip_polygon(homogeneous[start:end], clipper.planes)[:, :2]))
+                         for start, end in zip(offsets[:-1], offsets[1:])])
+    for method in ("sutherland-hodgman", "weiler-atherton"):
+        clipped, clipped_offsets, owner = clipper.clip(points, offsets, method)
+        parts = unpack_polygons(clipped, clipped_offsets)
+        area = np.zeros(len(expected))
+        np.add.at(area, owner, [abs(_signed_area(part)) for part in parts])
+        if not np.allclose(area, expected, atol=1e-6):
+            raise ValueError(f"{method} clipped areas of degenerate_polygons differ from the scalar clipper")
+        if any(len(_drop_repeats(part)) != len(part) for part in parts):
+            raise ValueError(f"{method} repeats vertices of degenerate_polygons")
+
+
+def random_polygons(count, vertices=12, radius=60.0, extent=400.0, seed=0):
+    """
+    Random star-shaped (mostly concave) polygons with centers spread over [-extent, extent]^2.
+
+    Returns:
+        tuple: Packed (count * vertices, 2) points and (count + 1,) offsets.
+    """
+    rng = np.random.default_rng(seed)
+    centers = rng.uniform(-extent, extent, (count, 1, 2))
+    angles = np.sort(rng.uniform(0, 2 * np.pi, (count, vertices)), axis=1)
+    radii = radius * rng.uniform(0.3, 1.0, (count, vertices))
+    points = centers + radii[..., None] * np.stack((np.cos(angles), np.sin(angles)), axis=-1)
+    return points.reshape(-1, 2), np.arange(count + 1) * vertices
+
+
+def benchmark_polygon_clip(sizes=(10**3, 10**4, 10**5), scalar_limit=10**3, repeat=3,
+                           window=(-200.0, -150.0, 200.0, 150.0)):
+    """
+    Time PolygonClipper with both methods on random_polygons against clipping every polygon
+    on its own with the scalar clip_polygon, checking that the clipped areas agree. The scalar
+    version is only timed up to scalar_limit polygons and extrapolated beyond that.
+    """
+    check_degenerate_polygons()
+    clipper = PolygonClipper(*window)
+
+    print("=== Polygon Clipping Benchmark ===")
+    print(f"{'polygons':>10} {'scalar (s)':>12} {'SH (s)':>10} {'WA (s)':>10} {'SH speedup':>11} {'us/polygon':>11}")
+    for n in sizes:
+        points, offsets = random_polygons(n)
+        times = {}
+        results = {}
+        for method in ("sutherland-hodgman", "weiler-atherton"):
+            best = math.inf
+            for _ in range(repeat):
+                results[method] = clipper.clip(points, offsets, method)
+                best = min(best, clipper.stats["seconds"])
+            times[method] = best
+
+        m = min(n, scalar_limit)
+        homogeneous = homogeneous_2d(points)
+        start = time.perf_counter()
+        scalar = [clip_polygon(homogeneous[offsets[i]:offsets[i + 1]], clipper.planes) for i in range(m)]
+        scalar_time = (time.perf_counter() - start) * n / m
+
+        # Sutherland-Hodgman joins separate parts with zero-area edges, so all areas agree
+        areas = {}
+        for method, (clipped, clipped_offsets, owner) in results.items():
+            area = np.zeros(n)
+            np.add.at(area, owner, [_signed_area(part) for part in unpack_polygons(clipped, clipped_offsets)])
+            areas[method] = area[:m]
+        scalar_area = np.array([_signed_area(part[:, :2]) if len(part) >= 3 else 0.0 for part in scalar])
+        for method, area in areas.items():
+            if not np.allclose(np.abs(area), np.abs(scalar_area), atol=1e-6):
+                raise ValueError(f"{method} clipped areas differ from the scalar clipper")
+
+        print(f"{n:>10} {scalar_time:>12.4f} {times['sutherland-hodgman']:>10.4f} {times['weiler-atherton']:>10.4f} "
+              f"{scalar_time / times['sutherland-hodgman']:>10.1f}x {times['sutherland-hodgman'] / n * 1e6:>11.3f}")
+    print()
+    print(clipper.timing_report())
+
+
+if __name__ == "__main__":
+    benchmark_polygon_clip()
@@ -0,0 +1,500 @@
+# Software triangle rasterizer: perspective camera, z-buffer, flat and Gouraud shading
+import math
+import time
+
+import numpy as np
+
+from rendering.framebuffer import Framebuffer, to_rgba
+from rendering.frustum_clip import clip_polygons, clip_segments, near_plane, outcodes, to_clip
+
+#outcode bit of the near plane (see rendering.frustum_clip.frustum_planes)
+_near_bit = 1 << 4
+
+
+def look_at(eye, target, up):
+    """
+    View matrix of a camera at eye looking at target (right handed, the camera looks down -z).
+
+    Args:
+        eye (sequence): Camera position.
+        target (sequence): Point the camera looks at.
+        up (sequence): Direction that is up on screen.
+
+    Returns:
+        numpy.ndarray: 4x4 view matrix.
+    """
+    eye = np.asarray(eye, dtype=np.float64)
+    forward = np.asarray(target, dtype=np.float64) - eye
+    forward /= np.linalg.norm(forward)
+    right = np.cross(forward, up)
+    if np.linalg.norm(right) < 1e-12:
+        raise ValueError("up must not be parallel to the viewing direction.")
+    right /= np.linalg.norm(right)
+    true_up = np.cross(right, forward)
+
+    matrix = np.eye(4)
+    matrix[0, :3], matrix[1, :3], matrix[2, :3] = right, true_up, -forward
+    matrix[:3, 3] = -matrix[:3, :3] @ eye
+    return matrix
+
+
+def perspective(fov_degrees, aspect, near, far):
+    """
+    Perspective projection mapping the view frustum to the clip cube [-1, 1]^3 (OpenGL style).
+
+    Args:
+        fov_degrees (float): Vertical field of view in degrees.
+        aspect (float): Width divided by height of the viewport.
+        near (float): Distance of the near plane, greater than 0.
+        far (float): Distance of the far plane, greater than near.
+
+    Returns:
+        numpy.ndarray: 4x4 projection matrix.
+    """
+    if not 0 < near < far:
+        raise ValueError("Frustum planes must satisfy 0 < near < far.")
+    f = 1.0 / math.tan(math.radians(fov_degrees) / 2)
+    matrix = np.zeros((4, 4))
+    matrix[0, 0] = f / aspect
+    matrix[1, 1] = f
+    matrix[2, 2] = (far + near) / (near - far)
+    matrix[2, 3] = 2 * far * near / (near - far)
+    matrix[3, 2] = -1.0
+    return matrix
+
+
+class Camera:
+    """
+    Perspective camera at eye looking at target, with a vertical field of view of fov_degrees
+    and a view frustum between the near and far planes.
+    """
+    def __init__(self, eye, target=(0, 0, 0), up=(0, 0, 1), fov_degrees=45.0, near=0.1, far=1000.0):
+        self.eye = np.asarray(eye, dtype=np.float64)
+        self.target = np.asarray(target, dtype=np.float64)
+        self.up = np.asarray(up, dtype=np.float64)
+        self.fov_degrees = fov_degrees
+        self.near = near
+        self.far = far
+
+    @classmethod
+    def orbit(cls, points, elevation=30.0, azimuth=-60.0, fov_degrees=35.0, margin=1.1):
+        """
+        Camera that sees all points, looking at the center of their bounding box from the
+        given elevation and azimuth in degrees (matplotlib's default 3D view by default).
+        """
+        points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+        center = (points.min(axis=0) + points.max(axis=0)) / 2
+        radius = max(np.linalg.norm(points - center, axis=1).max(), 1e-9)
+        distance = margin * radius / math.sin(math.radians(fov_degrees) / 2)
+        elevation, azimuth = math.radians(elevation), math.radians(azimuth)
+        direction = np.array([math.cos(elevation) * math.cos(azimuth),
+                              math.cos(elevation) * math.sin(azimuth),
+                              math.sin(elevation)])
+        return cls(center + distance * direction, center, fov_degrees=fov_degrees,
+                   near=max(distance - radius * margin, distance * 1e-3), far=distance + radius * margin)
+
+    def view_projection(self, aspect):
+        """Combined 4x4 projection @ view matrix"""
+        return perspective(self.fov_degrees, aspect, self.near, self.far) @ look_at(self.eye, self.target, self.up)
+
+
+def triangulate(faces):
+    """
+    Split polygons given as vertex index lists into triangle fans.
+
+    Returns:
+        tuple: (T, 3) triangle indices and the index of the polygon of every triangle.
+    """
+    triangles, face_index = [], []
+    for i, face in enumerate(faces):
+        for k in range(1, len(face) - 1):
+            triangles.append((face[0], face[k], face[k + 1]))
+            face_index.append(i)
+    return np.array(triangles, dtype=np.int64).reshape(-1, 3), np.array(face_index, dtype=np.int64)
+
+
+def polygon_edges(faces):
+    """Unique (E, 2) edges of polygons given as vertex index lists"""
+    edges = [(face[k], face[(k + 1) % len(face)]) for face in faces for k in range(len(face))]
+    return np.unique(np.sort(np.array(edges, dtype=np.int64).reshape(-1, 2), axis=1), axis=0)
+
+
+def _pack(rgb):
+    # Opaque (N, 3) colors as RGBA uint32 values in the framebuffer's byte order
+    rgba = np.empty((len(rgb), 4), dtype=np.uint8)
+    rgba[:, :3] = np.clip(rgb, 0, 255)
+    rgba[:, 3] = 255
+    return rgba.view(np.uint32).reshape(-1)
+
+
+class Rasterizer:
+    """
+    Renders indexed triangle meshes into a Framebuffer (top-left origin) with a z-buffer.
+    Triangles are rasterized all at once: the span of pixel centers inside every triangle row
+    follows from its barycentric plane equations, depths are resolved per pixel with
+    np.minimum.at, and only the nearest fragment of every pixel is shaded. Triangles are
+    processed in chunks of at most chunk_size candidate pixels to bound memory use.
+    Triangles outside the view frustum are culled and triangles crossing the near plane are
+    clipped to it in clip space; the other planes need no clipping because spans are clamped
+    to the screen and fragments beyond the far plane are discarded.
+    """
+    def __init__(self, width, height, background="white", chunk_size=1 << 22):
+        self.width = width
+        self.height = height
+        self.chunk_size = chunk_size
+        self.framebuffer = Framebuffer(width, height, background, centered=False)
+        self.depth = np.empty(width * height, dtype=np.float32)
+        self.clear()
+
+    def clear(self):
+        self.framebuffer.clear()
+        self.depth.fill(np.inf)
+
+    def project(self, camera, vertices):
+        """
+        Screen positions of (N, 3) vertices.
+
+        Returns:
+            tuple: (N, 2) pixel coordinates (y down, pixel centers at .5), (N,) normalized
+            depth in [-1, 1] inside the frustum and (N,) clip w (positive in front of the camera).
+        """
+        clip = to_clip(camera.view_projection(self.width / self.height), vertices)
+        screen, depth = self._viewport(clip)
+        return screen, depth, clip[:, 3]
+
+    def _viewport(self, clip):
+        # Perspective divide and viewport transform of (N, 4) clip space points
+        with np.errstate(divide="ignore", invalid="ignore"):
+            ndc = clip[:, :3] / clip[:, 3:4]
+        screen = np.column_stack(((ndc[:, 0] + 1) * 0.5 * self.width, (1 - ndc[:, 1]) * 0.5 * self.height))
+        return screen, ndc[:, 2]
+
+    def _clip_near(self, clip, triangles):
+        """
+        Cull triangles outside the frustum and clip the ones crossing the near plane.
+
+        Returns:
+            tuple: Clip space vertices with the new vertices appended, the (T', 3) triangles to
+            draw, the index of the input triangle of every one of them, and for every new vertex
+            the index of its input triangle and its (3,) barycentric weights in it.
+        """
+        codes = outcodes(clip)[triangles.T]
+        inside = (codes[0] & codes[1] & codes[2]) == 0
+        crossing_near = ((codes[0] | codes[1] | codes[2]) & _near_bit) != 0
+        plain = np.flatnonzero(inside & ~crossing_near)
+        crossing = np.flatnonzero(inside & crossing_near)
+        if not len(crossing):
+            return clip, triangles[plain], plain, crossing, np.empty((0, 3))
+
+        # Clip the crossing triangles with their barycentric weights as attributes, then split
+        # the resulting polygons into triangle fans
+        corners = np.concatenate((clip[triangles[crossing]], np.broadcast_to(np.eye(3), (len(crossing), 3, 3))),
+                                 axis=2).reshape(-1, 7)
+        polygons, offsets = clip_polygons(corners, np.arange(len(crossing) + 1) * 3, near_plane)
+        counts = np.diff(offsets)
+        fans = np.maximum(counts - 2, 0)
+        polygon = np.repeat(np.arange(len(crossing)), fans)
+        fan_start = np.zeros(len(fans), dtype=np.int64)
+        np.cumsum(fans[:-1], out=fan_start[1:])
+        k = np.arange(len(polygon)) - fan_start[polygon] + 1
+        first = len(clip) + offsets[polygon]
+        fan_triangles = np.column_stack((first, first + k, first + k + 1))
+
+        return (np.vstack((clip, polygons[:, :4])), np.vstack((triangles[plain], fan_triangles)),
+                np.concatenate((plain, crossing[polygon])), crossing[np.repeat(np.arange(len(crossing)), counts)],
+                polygons[:, 4:])
+
+    def draw_mesh(self, camera, vertices, triangles, color="lightgray", vertex_colors=None, shading="flat",
+                  light=None, ambient=0.3, cull_backfaces=False):
+        """
+        Rasterize an indexed triangle mesh.
+
+        Args:
+            camera (Camera): Camera to render from.
+            vertices (array): (V, 3) vertex positions.
+            triangles (array): (T, 3) vertex indices, counter-clockwise seen from outside.
+            color: One color for the mesh or a (T, 3|4) array with one color per triangle.
+            vertex_colors (array): Optional (V, 3|4) colors per vertex, used instead of color.
+            shading (str): 'flat' (one intensity per triangle) or 'gouraud' (intensities of
+                area weighted vertex normals interpolated across triangles).
+            light (sequence): Direction towards the light, from the camera when None.
+            ambient (float): Intensity of unlit surfaces.
+            cull_backfaces (bool): Skip triangles facing away from the camera. Otherwise
+                back faces are lit as if they faced the camera.
+
+        Returns:
+            int: Number of pixels written.
+        """
+        if shading not in ("flat", "gouraud"):
+            raise ValueError("shading must be 'flat' or 'gouraud'.")
+        vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 3)
+        mesh_triangles = np.asarray(triangles, dtype=np.int64).reshape(-1, 3)
+        clip = to_clip(camera.view_projection(self.width / self.height), vertices)
+        clip, triangles, source, new_vertex_triangle, new_vertex_weights = self._clip_near(clip, mesh_triangles)
+        screen, depth = self._viewport(clip)
+
+        def new_vertex_values(values):
+            # Vertex values with the values of the vertices made by clipping appended
+            corners = values[mesh_triangles[new_vertex_triangle]]
+            return np.concatenate((values, np.einsum("ij,ij...->i...", new_vertex_weights, corners)))
+
+        # Drop triangles that are degenerate on screen
+        corner = triangles.T
+        x, y, tri_depth = screen[:, 0][corner], screen[:, 1][corner], depth[corner]
+        area = (x[1] - x[0]) * (y[2] - y[0]) - (y[1] - y[0]) * (x[2] - x[0])
+        keep = np.abs(area) > 1e-12
+        if cull_backfaces:
+            # Counter-clockwise on screen with y up is clockwise with y down
+            keep &= area < 0
+        index = np.flatnonzero(keep)
+        x, y, tri_depth, area = x[:, index], y[:, index], tri_depth[:, index], area[index]
+        x_min, x_max, y_min, y_max = x.min(axis=0), x.max(axis=0), y.min(axis=0), y.max(axis=0)
+        triangles, face = triangles[index], source[index]
+
+        # Lighting in world space
+        light = camera.eye - camera.target if light is None else np.asarray(light, dtype=np.float64)
+        light = light / np.linalg.norm(light)
+        if vertex_colors is not None:
+            vertex_rgb = to_rgba(vertex_colors)[:, :3].astype(np.float64)
+            face_rgb = vertex_rgb[mesh_triangles[face]].mean(axis=1)
+        else:
+            rgb = to_rgba(color)[..., :3].astype(np.float64)
+            face_rgb = rgb[face] if rgb.ndim == 2 else np.broadcast_to(rgb, (len(index), 3))
+
+        if shading == "flat":
+            kept = vertices[mesh_triangles[face]]
+            normals = np.cross(kept[:, 1] - kept[:, 0], kept[:, 2] - kept[:, 0])
+            normals /= np.maximum(np.linalg.norm(normals, axis=1, keepdims=True), 1e-300)
+            # Light back faces as if they faced the camera
+            facing = np.sign(np.einsum("ij,ij->i", normals, camera.eye - kept[:, 0]))
+            intensity = ambient + (1 - ambient) * np.maximum(normals @ light * facing, 0)
+            face_color = _pack(face_rgb * intensity[:, None])
+        else:
+            corners = vertices[mesh_triangles]
+            normals = np.cross(corners[:, 1] - corners[:, 0], corners[:, 2] - corners[:, 0])
+            vertex_normals = np.column_stack([np.bincount(mesh_triangles.ravel(), weights=np.repeat(normals[:, k], 3),
+                                                          minlength=len(vertices)) for k in range(3)])
+            vertex_normals /= np.maximum(np.linalg.norm(vertex_normals, axis=1, keepdims=True), 1e-300)
+            vertex_intensity = ambient + (1 - ambient) * np.maximum(vertex_normals @ light, 0)
+            corner_intensity = new_vertex_values(vertex_intensity)[triangles][:, :, None]
+            if vertex_colors is None:
+                corner_rgb = face_rgb[:, None, :] * corner_intensity
+            else:
+                corner_rgb = new_vertex_values(vertex_rgb)[triangles] * corner_intensity
+
+        # Pixel bounding boxes (pixel i covers centers at i + 0.5)
+        x0 = np.maximum(np.ceil(x_min - 0.5), 0).astype(np.int64)
+        x1 = np.minimum(np.floor(x_max - 0.5), self.width - 1).astype(np.int64)
+        y0 = np.maximum(np.ceil(y_min - 0.5), 0).astype(np.int64)
+        y1 = np.minimum(np.floor(y_max - 0.5), self.height - 1).astype(np.int64)
+        heights = np.where(x1 >= x0, np.maximum(y1 - y0 + 1, 0), 0)
+        counts = heights * (x1 - x0 + 1)
+
+        # Barycentric weights of the three vertices and depth as planes a * x + b * y + c
+        a1, b1 = (y[2] - y[0]) / area, -(x[2] - x[0]) / area
+        a2, b2 = -(y[1] - y[0]) / area, (x[1] - x[0]) / area
+        c1 = -(x[0] * a1 + y[0] * b1)
+        c2 = -(x[0] * a2 + y[0] * b2)
+        planes = ((-a1 - a2, -b1 - b2, 1 - c1 - c2), (a1, b1, c1), (a2, b2, c2))
+        dz1, dz2 = tri_depth[1] - tri_depth[0], tri_depth[2] - tri_depth[0]
+        az, bz = dz1 * a1 + dz2 * a2, dz1 * b1 + dz2 * b2
+        cz = tri_depth[0] + dz1 * c1 + dz2 * c2
+        crosses_near_far = (tri_depth.min(axis=0) < -1) | (tri_depth.max(axis=0) > 1)
+        if shading == "gouraud":
+            # Colors interpolated in screen space, also as planes, (3, T) float32 for fast
+            # per channel gathers
+            dc1, dc2 = corner_rgb[:, 1] - corner_rgb[:, 0], corner_rgb[:, 2] - corner_rgb[:, 0]
+            a_rgb = np.ascontiguousarray((dc1 * a1[:, None] + dc2 * a2[:, None]).T, dtype=np.float32)
+            b_rgb = np.ascontiguousarray((dc1 * b1[:, None] + dc2 * b2[:, None]).T, dtype=np.float32)
+            c_rgb = np.ascontiguousarray((corner_rgb[:, 0] + dc1 * c1[:, None] + dc2 * c2[:, None]).T,
+                                         dtype=np.float32)
+
+        pixels = self.framebuffer.pixels.view(np.uint32).reshape(-1)
+        written = 0
+        # Chunks of triangles whose bounding boxes hold at most chunk_size pixels together
+        ends = np.cumsum(counts)
+        bounds = [0]
+        while bounds[-1] < len(index):
+            base = ends[bounds[-1] - 1] if bounds[-1] else 0
+            bounds.append(max(int(np.searchsorted(ends, base + self.chunk_size, side="right")), bounds[-1] + 1))
+
+        for first, last in zip(bounds[:-1], bounds[1:]):
+            chunk_heights = heights[first:last]
+            rows = int(chunk_heights.sum())
+            if not rows:
+                continue
+
+            # One span per triangle and row: the pixel centers where all three weights are >= 0
+            local = np.repeat(np.arange(first, last), chunk_heights)
+            offsets = np.zeros(len(chunk_heights), dtype=np.int64)
+            np.cumsum(chunk_heights[:-1], out=offsets[1:])
+            row = y0[local] + np.arange(rows) - np.repeat(offsets, chunk_heights)
+            center_y = row + 0.5
+            low, high = x0[local] + 0.5, x1[local] + 0.5
+            with np.errstate(divide="ignore", invalid="ignore"):
+                for a, b, c in planes:
+                    slope = a[local]
+                    value = b[local] * center_y + c[local] + 1e-9
+                    bound = -value / slope
+                    low = np.where(slope > 0, np.maximum(low, bound), low)
+                    high = np.where(slope < 0, np.minimum(high, bound), high)
+                    high = np.where((slope == 0) & (value < 0), -np.inf, high)
+            span_start = np.ceil(low - 0.5)
+            lengths = np.maximum(np.floor(high - 0.5) - span_start + 1, 0).astype(np.int64)
+            total = int(lengths.sum())
+            if not total:
+                continue
+
+            # Expand the spans into fragments: pixel index and depth grow linearly along a span
+            span_offsets = np.zeros(len(lengths), dtype=np.int64)
+            np.cumsum(lengths[:-1], out=span_offsets[1:])
+            k = np.arange(total) - np.repeat(span_offsets, lengths)
+            pixel = np.repeat(row * self.width + span_start.astype(np.int64), lengths) + k
+            slope_z = az[local]
+            start_z = slope_z * (span_start + 0.5) + bz[local] * center_y + cz[local]
+            z = (np.repeat(start_z.astype(np.float32), lengths)
+                 + np.repeat(slope_z.astype(np.float32), lengths) * k.astype(np.float32))
+            local = np.repeat(local, lengths)
+            if crosses_near_far[first:last].any():
+                in_range = (z >= -1) & (z <= 1)
+                pixel, z, local = pixel[in_range], z[in_range], local[in_range]
+
+            # Depth test: the nearest fragment of every pixel wins and only winners are shaded
+            np.minimum.at(self.depth, pixel, z)
+            won = z == self.depth[pixel]
+            pixel, triangle = pixel[won], local[won]
+            if shading == "flat":
+                pixels[pixel] = face_color[triangle]
+            else:
+                center_y, center_x = np.divmod(pixel, self.width)
+                center_x = center_x.astype(np.float32) + np.float32(0.5)
+                center_y = center_y.astype(np.float32) + np.float32(0.5)
+                rgba = np.empty((len(pixel), 4), dtype=np.uint8)
+                rgba[:, 3] = 255
+                for channel in range(3):
+                    value = a_rgb[channel].take(triangle) * center_x
+                    value += b_rgb[channel].take(triangle) * center_y
+                    value += c_rgb[channel].take(triangle)
+                    rgba[:, channel] = np.clip(value, 0, 255, out=value)
+                pixels[pixel] = rgba.view(np.uint32).reshape(-1)
+            written += len(pixel)
+        return written
+
+    def draw_lines(self, camera, starts, ends, color="black"):
+        """
+        Draw 3D segments from (N, 3) starts to (N, 3) ends on top of the image (no depth test),
+        clipped to the view frustum.
+        """
+        matrix = camera.view_projection(self.width / self.height)
+        starts, ends, visible = clip_segments(to_clip(matrix, starts), to_clip(matrix, ends))
+        rgba = to_rgba(color)
+        if rgba.ndim == 2:
+            rgba = rgba[visible]
+        self.framebuffer.lines(np.hstack((self._viewport(starts)[0], self._viewport(ends)[0])) - 0.5, rgba)
+
+    def draw_points(self, camera, points, color="black", radius=3):
+        """Draw 3D points as filled discs of radius pixels on top of the image (no depth test)"""
+        clip = to_clip(camera.view_projection(self.width / self.height), points)
+        screen = self._viewport(clip[outcodes(clip) == 0])[0] - 0.5
+        dx, dy = np.mgrid[-radius:radius + 1, -radius:radius + 1]
+        disc = np.column_stack((dx.ravel(), dy.ravel()))[dx.ravel() ** 2 + dy.ravel() ** 2 <= radius ** 2]
+        self.framebuffer.scatter((screen[:, None] + disc).reshape(-1, 2), color)
+
+
+def mesh_figure(meshes, title="", width=800, height=800, elevation=30.0, azimuth=-60.0):
+    """
+    Render polygon meshes with the rasterizer and show the image in a new matplotlib figure.
+
+    Args:
+        meshes (list): Dicts with "vertices" ((V, 3) array) and "faces" (vertex index lists),
+            and optionally "color", "edge_color" and "point_color".
+        title (str): Title of the figure.
+        width (int): Image width in pixels.
+        height (int): Image height in pixels.
+        elevation (float): Camera elevation in degrees.
+        azimuth (float): Camera azimuth in degrees.
+
+    Returns:
+        matplotlib.figure.Figure: The figure.
+    """
+    import matplotlib.pyplot as plt
+
+    rasterizer = Rasterizer(width, height)
+    camera = Camera.orbit(np.vstack([mesh["vertices"] for mesh in meshes]), elevation, azimuth)
+    for mesh in meshes:
+        vertices = np.asarray(mesh["vertices"], dtype=np.float64)
+        triangles, _ = triangulate(mesh["faces"])
+        rasterizer.draw_mesh(camera, vertices, triangles, mesh.get("color", "lightgray"))
+    for mesh in meshes:
+        vertices = np.asarray(mesh["vertices"], dtype=np.float64)
+        if mesh.get("edge_color"):
+            edges = polygon_edges(mesh["faces"])
+            rasterizer.draw_lines(camera, vertices[edges[:, 0]], vertices[edges[:, 1]], mesh["edge_color"])
+        if mesh.get("point_color"):
+            rasterizer.draw_points(camera, vertices, mesh["point_color"])
+
+    fig = plt.figure(figsize=(width / 100, height / 100))
+    ax = fig.add_axes([0, 0, 1, 0.95])
+    ax.imshow(rasterizer.framebuffer.pixels)
+    ax.set_axis_off()
+    fig.suptitle(title)
+    return fig
+
+
+def benchmark_rasterizer(triangle_counts=(1000, 10000, 100000), width=800, height=800, repeat=3,
+                         matplotlib_limit=20000):
+    """
+    Time rendering UV spheres of about the given triangle counts with the rasterizer (flat and
+    Gouraud shading) against matplotlib's Poly3DCollection drawn on an Agg canvas. Both draw
+    every triangle, back faces included, since Poly3DCollection does not cull. matplotlib is
+    skipped above matplotlib_limit triangles.
+
+    Returns:
+        list: One dict per triangle count with the best times in seconds.
+    """
+    from rendering.sphere_mesh import uv_sphere
+
+    results = []
+    print(f"{'triangles':>10}{'flat ms':>10}{'gouraud ms':>12}{'flat fps':>10}{'matplotlib ms':>15}")
+    for count in triangle_counts:
+        vertices, triangles = uv_sphere(max(int(round(math.sqrt(count) / 2)) * 2, 4))
+        camera = Camera.orbit(vertices)
+        rasterizer = Rasterizer(width, height)
+        times = {}
+        for shading in ("flat", "gouraud"):
+            best = math.inf
+            for _ in range(repeat):
+                start = time.perf_counter()
+                rasterizer.clear()
+                rasterizer.draw_mesh(camera, vertices, triangles, "lightblue", shading=shading)
+                best = min(best, time.perf_counter() - start)
+            times[shading] = best
+
+        times["matplotlib"] = None
+        if len(triangles) <= matplotlib_limit:
+            import matplotlib
+            matplotlib.use("Agg")
+            import matplotlib.pyplot as plt
+            from mpl_toolkits.mplot3d.art3d import Poly3DCollection
+
+            fig = plt.figure(figsize=(width / 100, height / 100))
+            ax = fig.add_subplot(111, projection="3d")
+            ax.add_collection3d(Poly3DCollection(vertices[triangles], facecolors="lightblue"))
+            ax.auto_scale_xyz(vertices[:, 0], vertices[:, 1], vertices[:, 2])
+            best = math.inf
+            for _ in range(repeat):
+                start = time.perf_counter()
+                fig.canvas.draw()
+                best = min(best, time.perf_counter() - start)
+            plt.close(fig)
+            times["matplotlib"] = best
+
+        mpl = "-" if times["matplotlib"] is None else f"{times['matplotlib'] * 1000:.1f}"
+        print(f"{len(triangles):>10}{times['flat'] * 1000:>10.1f}{times['gouraud'] * 1000:>12.1f}"
+              f"{1 / times['flat']:>10.1f}{mpl:>15}")
+        results.append(dict(triangles=len(triangles), **times))
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_rasterizer()
@@ -0,0 +1,95 @@
+# Bounded LRU cache of rotation matrices and sin/cos pairs keyed by axis and quantized angle
+from collections import OrderedDict
+
+import numpy as np
+
+
+class RotationCache:
+    """
+    Caches rotation matrices for animation loops that rotate by the same angles every frame.
+    Angles are quantized to multiples of angle_step degrees, so 29.9999999 and 30.0 share an
+    entry, and the least recently used entries are dropped once maxsize is exceeded.
+    Cached matrices are read-only; copy them before modifying.
+    """
+    def __init__(self, maxsize=512, angle_step=1e-6):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1.")
+        self.maxsize = maxsize
+        self.angle_step = angle_step
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+
+    def _lookup(self, key, build):
+        entry = self._entries.get(key)
+        if entry is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return entry
+
+        self.misses += 1
+        entry = build()
+        self._entries[key] = entry
+        if len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+        return entry
+
+    def quantize(self, angle_degrees):
+        """Integer key of an angle, wrapped to one turn"""
+        steps_per_turn = int(round(360.0 / self.angle_step))
+        return int(round(angle_degrees / self.angle_step)) % steps_per_turn
+
+    def _compute_sin_cos(self, step):
+        angle_radians = np.radians(step * self.angle_step)
+        return float(np.sin(angle_radians)), float(np.cos(angle_radians))
+
+    def sin_cos(self, angle_degrees):
+        """(sin, cos) of the quantized angle"""
+        step = self.quantize(angle_degrees)
+        return self._lookup(("sincos", step), lambda: self._compute_sin_cos(step))
+
+    def matrix_2d(self, angle_degrees):
+        """2x2 counter-clockwise rotation matrix"""
+        step = self.quantize(angle_degrees)
+
+        def build():
+            s, c = self._compute_sin_cos(step)
+            matrix = np.array([[c, -s], [s, c]])
+            matrix.flags.writeable = False
+            return matrix
+
+        return self._lookup(("2d", step), build)
+
+    def matrix_3d(self, axis, angle_degrees):
+        """3x3 rotation matrix around the 'x', 'y' or 'z' axis"""
+        axis = axis.lower()
+        if axis not in ('x', 'y', 'z'):
+            raise ValueError("Axis must be 'x', 'y', or 'z'.")
+        step = self.quantize(angle_degrees)
+
+        def build():
+            s, c = self._compute_sin_cos(step)
+            if axis == 'x':
+                matrix = np.array([[1, 0, 0], [0, c, -s], [0, s, c]])
+            elif axis == 'y':
+                matrix = np.array([[c, 0, s], [0, 1, 0], [-s, 0, c]])
+            else:
+                matrix = np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]])
+            matrix.flags.writeable = False
+            return matrix
+
+        return self._lookup((axis, step), build)
+
+    def info(self):
+        """Hit/miss counters and current size"""
+        return {"hits": self.hits, "misses": self.misses,
+                "size": len(self._entries), "maxsize": self.maxsize}
+
+    def clear(self):
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+#shared cache used by the 2D and 3D rotation functions
+rotation_cache = RotationCache()
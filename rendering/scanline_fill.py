@@ -0,0 +1,91 @@
+# Scanline polygon fill with an edge table and an active edge list
+import numpy as np
+
+fill_rules = ("evenodd", "nonzero")
+
+
+def build_edge_table(vertices):
+    """
+    Edge table of a closed polygon given as an (N, 2) array of vertices.
+    Horizontal edges are dropped. Returns arrays sorted by the first scanline of each edge:
+    first and last scanline (inclusive), x at the first scanline, dx per scanline
+    and direction (+1 for upward edges, -1 for downward ones, used by the nonzero rule).
+    """
+    vertices = np.asarray(vertices, dtype=np.float64).reshape(-1, 2)
+    start = vertices
+    end = np.roll(vertices, -1, axis=0)
+    keep = start[:, 1] != end[:, 1]
+    start = start[keep]
+    end = end[keep]
+
+    direction = np.where(end[:, 1] > start[:, 1], 1, -1)
+    lower = np.where((direction > 0)[:, None], start, end)
+    upper = np.where((direction > 0)[:, None], end, start)
+
+    # Scanlines are the integer y values in [lower y, upper y), so shared vertices count once
+    first = np.ceil(lower[:, 1]).astype(np.int64)
+    last = np.ceil(upper[:, 1]).astype(np.int64) - 1
+    dx = (upper[:, 0] - lower[:, 0]) / (upper[:, 1] - lower[:, 1])
+    x_first = lower[:, 0] + (first - lower[:, 1]) * dx
+
+    order = np.argsort(first, kind="stable")
+    return first[order], last[order], x_first[order], dx[order], direction[order]
+
+
+def polygon_spans(vertices, rule="evenodd"):
+    """
+    Horizontal spans covering the interior of a polygon under the even-odd or nonzero
+    winding rule. A pixel center (x, y) with integer y is inside a span when
+    x_start <= x <= x_end. Returns the (ys, x_starts, x_ends) arrays.
+    """
+    if rule not in fill_rules:
+        raise ValueError(f"Rule must be one of {', '.join(fill_rules)}.")
+    first, last, x_first, dx, direction = build_edge_table(vertices)
+    if not first.size:
+        return np.empty(0, dtype=np.int64), np.empty(0), np.empty(0)
+
+    ys = []
+    x_starts = []
+    x_ends = []
+    active = np.empty(0, dtype=np.int64)
+    next_edge = 0
+
+    for y in range(int(first[0]), int(last.max()) + 1):
+        # Move edges starting on this scanline from the edge table to the active list
+        added = np.searchsorted(first, y, side="right")
+        if added > next_edge:
+            active = np.concatenate((active, np.arange(next_edge, added)))
+            next_edge = added
+        active = active[last[active] >= y]
+        if not active.size:
+            if next_edge < first.size:
+                continue
+            break
+
+        x = x_first[active] + (y - first[active]) * dx[active]
+        order = np.argsort(x, kind="stable")
+        x = x[order]
+        if rule == "evenodd":
+            inside = np.arange(1, x.size + 1) % 2 == 1
+        else:
+            inside = np.cumsum(direction[active][order]) != 0
+
+        # The interior lies between each crossing that leaves us inside and the next one
+        left = x[:-1][inside[:-1]]
+        right = x[1:][inside[:-1]]
+        x_start = np.ceil(left)
+        x_end = np.ceil(right) - 1
+        filled = x_start <= x_end
+        ys.append(np.full(int(filled.sum()), y, dtype=np.int64))
+        x_starts.append(x_start[filled])
+        x_ends.append(x_end[filled])
+
+    if not ys:
+        return np.empty(0, dtype=np.int64), np.empty(0), np.empty(0)
+    return np.concatenate(ys), np.concatenate(x_starts), np.concatenate(x_ends)
+
+
+def fill_polygon(framebuffer, vertices, color="yellow", rule="evenodd"):
+    """Fill a polygon given in framebuffer coordinates with one batched span write"""
+    ys, x_starts, x_ends = polygon_spans(vertices, rule)
+    framebuffer.fill_spans(ys, x_starts, x_ends, color)
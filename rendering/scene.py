@@ -0,0 +1,132 @@
+# Retained-mode scene of parametric patterns that keep their geometry between frames
+import time
+
+import numpy as np
+
+from rendering.framebuffer import to_rgba
+
+#key of a node that has never been built
+_stale = object()
+
+
+def tk_color(color):
+    """Color as a Tk color string ("#rrggbb" or a name Tk knows)"""
+    if isinstance(color, str):
+        return color
+    if isinstance(color, (tuple, list)) and len(color) == 3 and all(type(c) is int and 0 <= c <= 255 for c in color):
+        return "#%02x%02x%02x" % tuple(color)
+    return "#%02x%02x%02x" % tuple(int(c) for c in to_rgba(color)[:3])
+
+
+class SceneNode:
+    """
+    One pattern of a scene. params() returns a hashable value covering everything the pattern
+    depends on and build() returns its geometry as a list of (points, color) polylines,
+    points being an (N, 2) array with N >= 2. The geometry is only rebuilt, and its canvas
+    items only updated, when params() returns something new.
+    """
+    def __init__(self, name, params, build, width=1):
+        self.name = name
+        self.params = params
+        self.build = build
+        self.width = width
+        self.key = _stale
+        self.polylines = []
+        self.items = []
+        self.item_colors = []
+
+        # Timing statistics
+        self.builds = 0
+        self.skips = 0
+        self.build_seconds = 0.0
+        self.draw_seconds = 0.0
+
+    def invalidate(self):
+        """Force a rebuild on the next update"""
+        self.key = _stale
+
+
+class Scene:
+    """
+    Ordered collection of SceneNodes. With a Tk canvas (e.g. turtle.Screen().getcanvas()) every
+    node keeps one line item per polyline and moves it in place with coords() instead of
+    deleting and recreating it. Nodes that are not updated keep showing their last geometry.
+    xscale and yscale map scene coordinates to the canvas like turtle does.
+    """
+    def __init__(self, canvas=None, xscale=1.0, yscale=1.0):
+        self.canvas = canvas
+        self.scale = np.array([xscale, -yscale])
+        self.nodes = {}
+
+    def add(self, node):
+        self.nodes[node.name] = node
+        return node
+
+    def update(self, names=None):
+        """
+        Rebuild the named nodes (all by default) whose parameters changed and update their
+        canvas items. Nodes left unchanged or not named keep their geometry and items and
+        count as skipped. Returns the names of the rebuilt nodes.
+        """
+        names = list(self.nodes) if names is None else list(names)
+        for name in self.nodes.keys() - set(names):
+            self.nodes[name].skips += 1
+        rebuilt = []
+        for name in names:
+            node = self.nodes[name]
+            key = node.params()
+            if key == node.key:
+                node.skips += 1
+                continue
+
+            start = time.perf_counter()
+            node.polylines = node.build()
+            built = time.perf_counter()
+            node.key = key
+            if self.canvas is not None:
+                self._show(node)
+            node.build_seconds += built - start
+            node.draw_seconds += time.perf_counter() - built
+            node.builds += 1
+            rebuilt.append(name)
+        return rebuilt
+
+    def _show(self, node):
+        # Reuse the node's line items, create the missing ones and delete the rest
+        canvas = self.canvas
+        count = len(node.polylines)
+        for i, (points, color) in enumerate(node.polylines):
+            coords = (np.asarray(points, dtype=np.float64) * self.scale).ravel().tolist()
+            color = tk_color(color)
+            if i < len(node.items):
+                canvas.coords(node.items[i], coords)
+                if node.item_colors[i] != color:
+                    canvas.itemconfigure(node.items[i], fill=color)
+                    node.item_colors[i] = color
+            else:
+                node.items.append(canvas.create_line(coords, fill=color, width=node.width, capstyle="round"))
+                node.item_colors.append(color)
+        for item in node.items[count:]:
+            canvas.delete(item)
+        del node.items[count:], node.item_colors[count:]
+
+    def render(self, framebuffer):
+        """Draw the current geometry of every node into a Framebuffer"""
+        for node in self.nodes.values():
+            for points, color in node.polylines:
+                framebuffer.polyline(points, color)
+
+    def timing_report(self):
+        """
+        Table of rebuilds, skipped updates, mean build and canvas update time per rebuild
+        and share of the total time spent in patterns, one row per node.
+        """
+        total = sum(node.build_seconds + node.draw_seconds for node in self.nodes.values()) or 1.0
+        lines = [f"{'pattern':<22}{'builds':>8}{'skipped':>9}{'build ms':>10}{'draw ms':>9}{'share':>8}"]
+        for node in self.nodes.values():
+            builds = max(node.builds, 1)
+            share = (node.build_seconds + node.draw_seconds) / total
+            lines.append(f"{node.name:<22}{node.builds:>8}{node.skips:>9}"
+                         f"{node.build_seconds / builds * 1000:>10.3f}{node.draw_seconds / builds * 1000:>9.3f}"
+                         f"{share:>8.1%}")
+        return "\n".join(lines)
@@ -0,0 +1,235 @@
+# Uniform grid over the bounding boxes of a static segment set, for finding the segments near
+# a clipping window without testing all of them
+import math
+import time
+
+import numpy as np
+
+from rendering.frustum_clip import clip_segments, homogeneous_2d, window_planes
+
+#windows whose cells list more entries than this share of the segments test every bounding box instead
+dense_share = 0.25
+
+
+def clip_to_window(segments, xmin, ymin, xmax, ymax):
+    """
+    Liang-Barsky clipping of (N, 4) segments (x1, y1, x2, y2) to a window.
+
+    Returns:
+        tuple: (M, 4) clipped segments and the length-N accept mask.
+    """
+    segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+    starts, ends, accept = clip_segments(homogeneous_2d(segments[:, :2]), homogeneous_2d(segments[:, 2:]),
+                                         window_planes(xmin, ymin, xmax, ymax))
+    return np.column_stack((starts[:, :2], ends[:, :2])), accept
+
+
+class SegmentGrid:
+    """
+    Uniform grid index over an (N, 4) array of segments (x1, y1, x2, y2) that finds the
+    segments whose bounding boxes overlap a window, so that only those go to the clipper.
+    Every segment is listed in all cells its bounding box overlaps; the lists are stored
+    back to back (cell_segments) with per-cell offsets (cell_offsets). Segments that would
+    cover more than max_cells cells are kept apart and tested against every window.
+    Windows whose cells list more than dense_share entries per segment (counted with a 2D
+    prefix sum of the cell counts) test every bounding box instead.
+
+    By default cells are about as large as a typical segment, limited to 4 cells per segment
+    overall.
+    """
+    def __init__(self, segments, cell_size=None, max_cells=64):
+        self.segments = np.asarray(segments, dtype=np.float64).reshape(-1, 4)
+        x1, y1, x2, y2 = self.segments.T
+        self.boxes = np.column_stack((np.minimum(x1, x2), np.minimum(y1, y2), np.maximum(x1, x2), np.maximum(y1, y2)))
+        count = len(self.segments)
+
+        if count:
+            self.origin = self.boxes[:, :2].min(axis=0)
+            extent = np.maximum(self.boxes[:, 2:].max(axis=0) - self.origin, 1e-12)
+        else:
+            self.origin, extent = np.zeros(2), np.ones(2)
+        if cell_size is None:
+            sizes = np.maximum(self.boxes[:, 2] - self.boxes[:, 0], self.boxes[:, 3] - self.boxes[:, 1])
+            cell_size = float(np.median(sizes)) if count else 1.0
+            cell_size = max(cell_size, math.sqrt(extent[0] * extent[1] / (4 * max(count, 1))))
+        if cell_size <= 0:
+            raise ValueError("cell_size must be positive.")
+        self.cell_size = cell_size
+        self.shape = (int(extent[1] // cell_size) + 1, int(extent[0] // cell_size) + 1)
+
+        # Cell ranges of every bounding box
+        low = self._cells(self.boxes[:, :2])
+        high = self._cells(self.boxes[:, 2:])
+        widths = high[:, 0] - low[:, 0] + 1
+        cells = widths * (high[:, 1] - low[:, 1] + 1)
+        self.oversized = np.flatnonzero(cells > max_cells)
+        listed = np.flatnonzero(cells <= max_cells)
+
+        # One (cell, segment) entry per covered cell, grouped by cell
+        segment = np.repeat(listed, cells[listed])
+        entry_offsets = np.zeros(len(listed), dtype=np.int64)
+        np.cumsum(cells[listed][:-1], out=entry_offsets[1:])
+        k = np.arange(len(segment)) - np.repeat(entry_offsets, cells[listed])
+        cell = ((low[segment, 1] + k // widths[segment]) * self.shape[1]
+                + low[segment, 0] + k % widths[segment])
+        order = np.argsort(cell, kind="stable")
+        self.cell_segments = segment[order]
+        cell_counts = np.bincount(cell, minlength=self.shape[0] * self.shape[1])
+        self.cell_offsets = np.zeros(len(cell_counts) + 1, dtype=np.int64)
+        np.cumsum(cell_counts, out=self.cell_offsets[1:])
+        self.prefix_counts = np.zeros((self.shape[0] + 1, self.shape[1] + 1), dtype=np.int64)
+        self.prefix_counts[1:, 1:] = cell_counts.reshape(self.shape).cumsum(axis=0).cumsum(axis=1)
+
+    def _cells(self, points):
+        # (column, row) of the cells holding (N, 2) points, clamped to the grid
+        cells = np.floor((points - self.origin) / self.cell_size).astype(np.int64)
+        return np.minimum(np.maximum(cells, 0), np.array([self.shape[1] - 1, self.shape[0] - 1]))
+
+    def query(self, xmin, ymin, xmax, ymax):
+        """
+        Segments whose bounding boxes overlap a window.
+
+        Returns:
+            numpy.ndarray: Sorted indices into the segments.
+        """
+        offsets, indices = self.query_many([(xmin, ymin, xmax, ymax)])
+        return indices
+
+    def query_many(self, windows):
+        """
+        Segments whose bounding boxes overlap each of many windows, all windows at once.
+
+        Args:
+            windows (array): (W, 4) windows (xmin, ymin, xmax, ymax).
+
+        Returns:
+            tuple: (W + 1,) offsets and the indices of the segments of window i, sorted,
+            at offsets[i] to offsets[i + 1].
+        """
+        windows = np.asarray(windows, dtype=np.float64).reshape(-1, 4)
+        if (windows[:, :2] > windows[:, 2:]).any():
+            raise ValueError("Window minimum must not exceed its maximum.")
+        # Windows that miss the grid cover no cells (clamping would give them the border cells)
+        hits = ((windows[:, 2:] >= self.origin)
+                & (windows[:, :2] <= self.origin + np.array(self.shape[::-1]) * self.cell_size)).all(axis=1)
+        low = self._cells(windows[:, :2])
+        high = self._cells(windows[:, 2:])
+        prefix = self.prefix_counts
+        entries = (prefix[high[:, 1] + 1, high[:, 0] + 1] - prefix[low[:, 1], high[:, 0] + 1]
+                   - prefix[high[:, 1] + 1, low[:, 0]] + prefix[low[:, 1], low[:, 0]])
+        dense = hits & (entries > dense_share * len(self.segments))
+        hits &= ~dense
+        widths = high[:, 0] - low[:, 0] + 1
+        cells = np.where(hits, widths * (high[:, 1] - low[:, 1] + 1), 0)
+
+        # (window, cell) pairs, then (window, segment) pairs from the cell lists
+        window = np.repeat(np.arange(len(windows)), cells)
+        pair_offsets = np.zeros(len(windows), dtype=np.int64)
+        np.cumsum(cells[:-1], out=pair_offsets[1:])
+        k = np.arange(len(window)) - pair_offsets[window]
+        cell = (low[window, 1] + k // widths[window]) * self.shape[1] + low[window, 0] + k % widths[window]
+        lengths = self.cell_offsets[cell + 1] - self.cell_offsets[cell]
+        entry_offsets = np.zeros(len(cell), dtype=np.int64)
+        np.cumsum(lengths[:-1], out=entry_offsets[1:])
+        rows = np.repeat(self.cell_offsets[cell] - entry_offsets, lengths) + np.arange(lengths.sum())
+        sparse = np.flatnonzero(~dense)
+        window = np.concatenate((np.repeat(window, lengths), np.repeat(sparse, len(self.oversized))))
+        segment = np.concatenate((self.cell_segments[rows], np.tile(self.oversized, len(sparse))))
+        cell = np.concatenate((np.repeat(cell, lengths), np.full(len(window) - len(rows), -1)))
+
+        boxes = self.boxes[segment]
+        bounds = windows[window]
+        overlap = ((boxes[:, 0] <= bounds[:, 2]) & (boxes[:, 2] >= bounds[:, 0])
+                   & (boxes[:, 1] <= bounds[:, 3]) & (boxes[:, 3] >= bounds[:, 1]))
+        # A segment listed in several cells of a window is only kept in the cell holding the
+        # lower left corner of the overlap of its bounding box and the window
+        corner = self._cells(np.maximum(boxes[:, :2], bounds[:, :2]))
+        overlap &= (cell < 0) | (cell == corner[:, 1] * self.shape[1] + corner[:, 0])
+        keys = [window[overlap] * len(self.segments) + segment[overlap]]
+        for i in np.flatnonzero(dense):
+            xmin, ymin, xmax, ymax = windows[i]
+            keys.append(i * len(self.segments) + np.flatnonzero(
+                (self.boxes[:, 0] <= xmax) & (self.boxes[:, 2] >= xmin)
+                & (self.boxes[:, 1] <= ymax) & (self.boxes[:, 3] >= ymin)))
+        key = np.sort(np.concatenate(keys), kind="stable")
+        window, segment = np.divmod(key, max(len(self.segments), 1))
+        offsets = np.zeros(len(windows) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(window, minlength=len(windows)), out=offsets[1:])
+        return offsets, segment
+
+    def clip(self, xmin, ymin, xmax, ymax):
+        """
+        Clip only the segments near a window.
+
+        Returns:
+            tuple: (M, 4) clipped segments and the (M,) indices of their segments.
+        """
+        candidates = self.query(xmin, ymin, xmax, ymax)
+        segments = self.segments if len(candidates) == len(self.segments) else self.segments[candidates]
+        clipped, accept = clip_to_window(segments, xmin, ymin, xmax, ymax)
+        return clipped, candidates[accept]
+
+
+def random_segments(count, extent=10000.0, length=20.0, seed=0):
+    """(count, 4) random segments of lengths up to length spread over [0, extent]^2"""
+    rng = np.random.default_rng(seed)
+    starts = rng.uniform(0, extent, (count, 2))
+    angles = rng.uniform(0, 2 * np.pi, count)
+    lengths = rng.uniform(0, length, count)
+    ends = starts + lengths[:, None] * np.column_stack((np.cos(angles), np.sin(angles)))
+    return np.column_stack((starts, ends))
+
+
+def benchmark_segment_grid(segment_count=10**6, window_sizes=(50, 200, 1000, 3000, 10000), windows=50,
+                           extent=10000.0, batched_limit=1000, seed=0):
+    """
+    Clip random segments (see random_segments) to many square windows, once by clipping all
+    segments for every window and once through a SegmentGrid built once, checking that both
+    give the same clipped segments. Prints the mean time per window, the number of windows
+    after which building the grid has paid off and the time per window of one batched
+    query_many for all windows (only up to batched_limit, as its memory grows with the
+    number of window and segment pairs).
+    """
+    rng = np.random.default_rng(seed)
+    segments = random_segments(segment_count, extent, seed=seed)
+
+    build_time = math.inf
+    for _ in range(2):
+        start = time.perf_counter()
+        grid = SegmentGrid(segments)
+        build_time = min(build_time, time.perf_counter() - start)
+
+    print("=== Segment Grid Benchmark ===")
+    print(f"{segment_count} segments, grid {grid.shape[1]}x{grid.shape[0]} cells of {grid.cell_size:.1f}, "
+          f"built in {build_time:.3f} s")
+    print(f"{'window':>8} {'brute (ms)':>11} {'grid (ms)':>10} {'speedup':>9} {'break-even':>11} {'batched (ms)':>13}")
+    for size in window_sizes:
+        corners = rng.uniform(0, max(extent - size, 0), (windows, 2))
+        boxes = np.column_stack((corners, corners + size))
+
+        brute_time = grid_time = 0.0
+        for box in boxes:
+            start = time.perf_counter()
+            clipped, accept = clip_to_window(segments, *box)
+            brute_time += time.perf_counter() - start
+            start = time.perf_counter()
+            grid_clipped, index = grid.clip(*box)
+            grid_time += time.perf_counter() - start
+            if not (np.array_equal(np.flatnonzero(accept), index) and np.array_equal(clipped, grid_clipped)):
+                raise ValueError("Grid clipping differs from clipping every segment")
+        brute_time /= windows
+        grid_time /= windows
+
+        batched = "-"
+        if size <= batched_limit:
+            start = time.perf_counter()
+            grid.query_many(boxes)
+            batched = f"{(time.perf_counter() - start) / windows * 1000:.3f}"
+
+        break_even = f"{math.ceil(build_time / (brute_time - grid_time))}" if brute_time > grid_time else "never"
+        print(f"{size:>8g} {brute_time * 1000:>11.3f} {grid_time * 1000:>10.3f} {brute_time / grid_time:>8.1f}x "
+              f"{break_even:>11} {batched:>13}")
+
+
+if __name__ == "__main__":
+    benchmark_segment_grid()
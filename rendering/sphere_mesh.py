@@ -0,0 +1,220 @@
+# Indexed sphere meshes (UV sphere and icosphere) with cached unit meshes per level of detail
+import functools
+import math
+
+import numpy as np
+
+#segments around the equator of every UV sphere level of detail, rings are half as many
+uv_lods = (8, 16, 32, 64, 128)
+
+#subdivisions of every icosphere level of detail
+ico_lods = (0, 1, 2, 3, 4, 5)
+
+#edge length of the icosahedron with circumradius 1
+_icosahedron_edge = 4 / math.sqrt(10 + 2 * math.sqrt(5))
+
+
+def uv_sphere(segments=32):
+    """
+    Unit UV sphere without duplicated pole or seam vertices.
+
+    Args:
+        segments (int): Vertices around every ring, at least 3. There are segments // 2
+            rings from pole to pole.
+
+    Returns:
+        tuple: (V, 3) vertex array (also the vertex normals) and (T, 3) array of
+        counter-clockwise (outward facing) triangle indices.
+    """
+    if segments < 3:
+        raise ValueError("A UV sphere needs at least 3 segments.")
+    rings = max(segments // 2, 2)
+    theta = np.pi * np.arange(1, rings) / rings
+    phi = 2 * np.pi * np.arange(segments) / segments
+    ring_vertices = np.stack((np.outer(np.sin(theta), np.cos(phi)),
+                              np.outer(np.sin(theta), np.sin(phi)),
+                              np.outer(np.cos(theta), np.ones(segments))), axis=-1).reshape(-1, 3)
+    vertices = np.vstack(([0.0, 0.0, 1.0], ring_vertices, [0.0, 0.0, -1.0]))
+
+    # Index of every ring vertex and of its neighbour along the ring (the seam wraps around)
+    ring_index = 1 + np.arange(rings - 1)[:, None] * segments + np.arange(segments)
+    next_index = np.roll(ring_index, -1, axis=1)
+    south = len(vertices) - 1
+
+    top = np.column_stack((np.zeros(segments, dtype=np.int64), ring_index[0], next_index[0]))
+    a, b = ring_index[:-1].ravel(), next_index[:-1].ravel()
+    c, d = ring_index[1:].ravel(), next_index[1:].ravel()
+    middle = np.concatenate((np.column_stack((a, c, d)), np.column_stack((a, d, b))))
+    bottom = np.column_stack((np.full(segments, south), next_index[-1], ring_index[-1]))
+    return vertices, np.concatenate((top, middle, bottom))
+
+
+def uv_sphere_edges(segments=32):
+    """
+    Ring and meridian edges of uv_sphere(segments), without the diagonals that split its
+    quads into triangles, for wireframes like matplotlib's plot_wireframe.
+
+    Returns:
+        numpy.ndarray: (E, 2) vertex index pairs.
+    """
+    if segments < 3:
+        raise ValueError("A UV sphere needs at least 3 segments.")
+    rings = max(segments // 2, 2)
+    ring_index = 1 + np.arange(rings - 1)[:, None] * segments + np.arange(segments)
+    south = 1 + (rings - 1) * segments
+    ring_edges = np.column_stack((ring_index.ravel(), np.roll(ring_index, -1, axis=1).ravel()))
+    meridians = np.vstack((np.zeros((1, segments), dtype=np.int64), ring_index, np.full((1, segments), south)))
+    meridian_edges = np.column_stack((meridians[:-1].ravel(), meridians[1:].ravel()))
+    return np.concatenate((ring_edges, meridian_edges))
+
+
+def icosphere(subdivisions=2):
+    """
+    Unit icosphere: an icosahedron whose triangles are split in four subdivisions times,
+    with new vertices shared between neighbouring triangles.
+
+    Args:
+        subdivisions (int): Number of subdivision steps, 0 for the icosahedron.
+
+    Returns:
+        tuple: (V, 3) vertex array (also the vertex normals) and (T, 3) array of
+        counter-clockwise (outward facing) triangle indices.
+    """
+    if subdivisions < 0:
+        raise ValueError("subdivisions must be at least 0.")
+    t = (1 + math.sqrt(5)) / 2
+    vertices = np.array([
+        (-1, t, 0), (1, t, 0), (-1, -t, 0), (1, -t, 0),
+        (0, -1, t), (0, 1, t), (0, -1, -t), (0, 1, -t),
+        (t, 0, -1), (t, 0, 1), (-t, 0, -1), (-t, 0, 1),
+    ], dtype=np.float64)
+    vertices /= np.linalg.norm(vertices, axis=1, keepdims=True)
+    triangles = np.array([
+        (0, 11, 5), (0, 5, 1), (0, 1, 7), (0, 7, 10), (0, 10, 11),
+        (1, 5, 9), (5, 11, 4), (11, 10, 2), (10, 7, 6), (7, 1, 8),
+        (3, 9, 4), (3, 4, 2), (3, 2, 6), (3, 6, 8), (3, 8, 9),
+        (4, 9, 5), (2, 4, 11), (6, 2, 10), (8, 6, 7), (9, 8, 1),
+    ], dtype=np.int64)
+
+    for _ in range(subdivisions):
+        # One new vertex per unique edge, then every triangle becomes four
+        edges = np.sort(triangles[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+        unique_edges, inverse = np.unique(edges, axis=0, return_inverse=True)
+        midpoints = vertices[unique_edges].sum(axis=1)
+        midpoints /= np.linalg.norm(midpoints, axis=1, keepdims=True)
+        ab, bc, ca = (len(vertices) + inverse.reshape(-1, 3)).T
+        a, b, c = triangles.T
+        triangles = np.stack((np.column_stack((a, ab, ca)), np.column_stack((ab, b, bc)),
+                              np.column_stack((ca, bc, c)), np.column_stack((ab, bc, ca))), axis=1).reshape(-1, 3)
+        vertices = np.vstack((vertices, midpoints))
+    return vertices, triangles
+
+
+def _check_kind(kind):
+    if kind not in ("uv", "ico"):
+        raise ValueError("kind must be 'uv' or 'ico'.")
+    return uv_lods if kind == "uv" else ico_lods
+
+
+@functools.lru_cache(maxsize=None)
+def unit_sphere(lod, kind="uv"):
+    """
+    Cached unit sphere mesh of one level of detail, see uv_lods and ico_lods.
+
+    Args:
+        lod (int): Level of detail, 0 is the coarsest.
+        kind (str): 'uv' or 'ico'.
+
+    Returns:
+        tuple: Read-only vertex and triangle arrays shared by every caller.
+    """
+    lods = _check_kind(kind)
+    if not 0 <= lod < len(lods):
+        raise ValueError(f"lod must be between 0 and {len(lods) - 1}.")
+    vertices, triangles = uv_sphere(lods[lod]) if kind == "uv" else icosphere(lods[lod])
+    vertices.flags.writeable = False
+    triangles.flags.writeable = False
+    return vertices, triangles
+
+
+def select_lod(screen_radius, kind="uv", max_edge_pixels=8.0):
+    """
+    Coarsest level of detail whose edges are at most max_edge_pixels long on screen.
+
+    Args:
+        screen_radius (float): Radius of the sphere on screen in pixels.
+        kind (str): 'uv' or 'ico'.
+        max_edge_pixels (float): Longest acceptable edge on screen in pixels.
+
+    Returns:
+        int: Level of detail, the finest one when none is fine enough.
+    """
+    lods = _check_kind(kind)
+    for lod, detail in enumerate(lods):
+        if kind == "uv":
+            edge = 2 * math.pi * screen_radius / detail
+        else:
+            edge = _icosahedron_edge * screen_radius / 2 ** detail
+        if edge <= max_edge_pixels:
+            return lod
+    return len(lods) - 1
+
+
+def sphere_mesh(center, radius, lod=None, screen_radius=None, kind="uv", max_edge_pixels=8.0):
+    """
+    Sphere mesh made by scaling and offsetting the cached unit mesh.
+
+    Args:
+        center (sequence): (x, y, z) center of the sphere.
+        radius (float): Radius of the sphere.
+        lod (int): Level of detail, chosen from screen_radius when None.
+        screen_radius (float): Radius on screen in pixels, for select_lod.
+        kind (str): 'uv' or 'ico'.
+        max_edge_pixels (float): Longest acceptable edge on screen, for select_lod.
+
+    Returns:
+        tuple: New (V, 3) vertex array and the shared read-only (T, 3) triangle array.
+    """
+    if lod is None:
+        if screen_radius is None:
+            raise ValueError("Give either lod or screen_radius.")
+        lod = select_lod(screen_radius, kind, max_edge_pixels)
+    vertices, triangles = unit_sphere(lod, kind)
+    return vertices * radius + np.asarray(center, dtype=np.float64), triangles
+
+
+def sphere_instances(centers, radii, lod, kind="uv"):
+    """
+    Many spheres of one level of detail as a single mesh.
+
+    Args:
+        centers (array): (N, 3) sphere centers.
+        radii (array): N radii, or one radius for every sphere.
+        lod (int): Level of detail.
+        kind (str): 'uv' or 'ico'.
+
+    Returns:
+        tuple: (N * V, 3) vertex array and (N * T, 3) triangle array, sphere i using
+        vertices i * V to (i + 1) * V.
+    """
+    vertices, triangles = unit_sphere(lod, kind)
+    centers = np.asarray(centers, dtype=np.float64).reshape(-1, 3)
+    radii = np.broadcast_to(np.asarray(radii, dtype=np.float64), (len(centers),))
+    all_vertices = (vertices * radii[:, None, None] + centers[:, None]).reshape(-1, 3)
+    offsets = np.arange(len(centers)) * len(vertices)
+    all_triangles = (triangles + offsets[:, None, None]).reshape(-1, 3)
+    return all_vertices, all_triangles
+
+
+def mesh_edges(triangles):
+    """
+    Unique edges of a triangle mesh, for wireframes that draw every edge once.
+
+    Args:
+        triangles (array): (T, 3) triangle indices.
+
+    Returns:
+        numpy.ndarray: (E, 2) vertex index pairs.
+    """
+    edges = np.sort(np.asarray(triangles)[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis=1)
+    return np.unique(edges, axis=0)
@@ -0,0 +1,136 @@
+# Homogeneous 4x4 transforms for 3D points
+import numpy as np
+
+from rendering.rotation_cache import rotation_cache
+
+
+def _about_center(matrix, center):
+    # Conjugate with a translation so the transform keeps `center` fixed
+    if center is None:
+        return matrix
+    center = np.asarray(center, dtype=np.float64)
+    matrix[:3, 3] = center - matrix[:3, :3] @ center
+    return matrix
+
+
+def translation_matrix(tx, ty, tz):
+    """
+    Creates a translation transform.
+
+    Args:
+        tx (float): Translation distance along X-axis.
+        ty (float): Translation distance along Y-axis.
+        tz (float): Translation distance along Z-axis.
+
+    Returns:
+        numpy.ndarray: 4x4 translation matrix.
+    """
+    matrix = np.eye(4)
+    matrix[:3, 3] = (tx, ty, tz)
+    return matrix
+
+
+def scaling_matrix(sx, sy=None, sz=None, center=None):
+    """
+    Creates a scaling transform, uniform when only sx is given.
+
+    Args:
+        sx (float): Scaling factor for X-axis (or all axes).
+        sy (float): Scaling factor for Y-axis.
+        sz (float): Scaling factor for Z-axis.
+        center (sequence): Fixed point of the scaling, the origin when None.
+
+    Returns:
+        numpy.ndarray: 4x4 scaling matrix.
+    """
+    sy = sx if sy is None else sy
+    sz = sx if sz is None else sz
+    matrix = np.diag([sx, sy, sz, 1.0]).astype(np.float64)
+    return _about_center(matrix, center)
+
+
+def rotation_matrix_3x3(axis, angle_degrees):
+    """
+    Returns the 3x3 rotation matrix around a coordinate axis from the shared rotation cache.
+
+    Args:
+        axis (str): Rotation axis ('x', 'y', or 'z').
+        angle_degrees (float): Rotation angle in degrees.
+
+    Returns:
+        numpy.ndarray: Read-only 3x3 rotation matrix.
+    """
+    return rotation_cache.matrix_3d(axis, angle_degrees)
+
+
+def rotation_matrix(axis, angle_degrees, center=None):
+    """
+    Creates a rotation transform around a coordinate axis.
+
+    Args:
+        axis (str): Rotation axis ('x', 'y', or 'z').
+        angle_degrees (float): Rotation angle in degrees.
+        center (sequence): Point the axis passes through, the origin when None.
+
+    Returns:
+        numpy.ndarray: 4x4 rotation matrix.
+    """
+    matrix = np.eye(4)
+    matrix[:3, :3] = rotation_matrix_3x3(axis, angle_degrees)
+    return _about_center(matrix, center)
+
+
+def shearing_matrix(shear_xy=0, shear_xz=0, shear_yx=0, shear_yz=0, shear_zx=0, shear_zy=0):
+    """
+    Creates a shearing transform, e.g. shear_xy adds shear_xy * y to x.
+
+    Returns:
+        numpy.ndarray: 4x4 shearing matrix.
+    """
+    matrix = np.eye(4)
+    matrix[:3, :3] = [
+        [1, shear_xy, shear_xz],
+        [shear_yx, 1, shear_yz],
+        [shear_zx, shear_zy, 1],
+    ]
+    return matrix
+
+
+def compose(*matrices):
+    """
+    Composes transforms into one matrix. The first matrix is applied first, so
+    compose(A, B, C) maps a point p to C @ B @ A @ p.
+
+    Args:
+        *matrices (numpy.ndarray): 4x4 transforms, or (K, 4, 4) stacks of them.
+
+    Returns:
+        numpy.ndarray: The combined 4x4 (or (K, 4, 4)) transform.
+    """
+    result = np.eye(4)
+    for matrix in matrices:
+        result = np.matmul(matrix, result)
+    return result
+
+
+def apply_transform(matrix, points, out=None):
+    """
+    Applies a homogeneous transform to a batch of 3D points in one matmul, without
+    building homogeneous copies of the points.
+
+    Args:
+        matrix (numpy.ndarray): 4x4 transform, or (K, 4, 4) with one transform per batch.
+        points (numpy.ndarray): (N, 3) or (K, N, 3) points.
+        out (numpy.ndarray): Optional array of the result's shape to write into.
+
+    Returns:
+        numpy.ndarray: Transformed points with the same shape as the input.
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    points = np.asarray(points, dtype=np.float64)
+
+    linear = np.swapaxes(matrix[..., :3, :3], -1, -2)
+    offset = matrix[..., None, :3, 3]
+    result = np.matmul(points, linear, out=out)
+    result += offset
+    return result
@@ -1,260 +1,208 @@
 import turtle
+import tkinter
 import math
 import random
 import time
+import os
+import sys
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rendering.fractal_tree import grow_tree
+from rendering.color_lut import rainbow_lut
+from rendering.framebuffer import Framebuffer
+from rendering.scene import Scene, SceneNode
+
+#patterns shown in each phase of the animation cycle, every phase lasts 200 frames
+pattern_cycles = [
+    ("spiraling polygons", "concentric circles"),
+    ("fractal trees", "rotating mandalas"),
+    ("infinity loops", "spiraling polygons"),
+    ("rotating mandalas", "concentric circles", "fractal trees"),
+]
+
+#mandala centers and the (center, layer, petal, petals in layer) of every mandala petal
+mandala_centers = np.array([(0, 0), (400, 200), (-400, 200), (400, -200), (-400, -200)], dtype=np.float64)
+mandala_petals = np.array([(center, layer, petal, 6 + layer * 2)
+                           for center in range(len(mandala_centers))
+                           for layer in range(5)
+                           for petal in range(6 + layer * 2)])
 
 class InfiniteGeometry:
-    def __init__(self):
+    def __init__(self, headless=False):
         # Setup the screen
-        self.screen = turtle.Screen()
-        self.screen.bgcolor("black")
-        self.screen.title("Mind-Blowing Infinite Geometry Animation")
-        self.screen.setup(width=1200, height=800)
-        self.screen.colormode(255)
-        self.screen.tracer(0)  # Turn off animation for faster drawing
-        
-        # Create multiple turtles for different patterns
-        self.spiral_turtle = turtle.Turtle()
-        self.fractal_turtle = turtle.Turtle()
-        self.circle_turtle = turtle.Turtle()
-        self.polygon_turtle = turtle.Turtle()
-        
-        # Configure turtles
-        self.setup_turtle(self.spiral_turtle)
-        self.setup_turtle(self.fractal_turtle)
-        self.setup_turtle(self.circle_turtle)
-        self.setup_turtle(self.polygon_turtle)
-        
+        self.screen = None
+        canvas = None
+        xscale = yscale = 1.0
+        if not headless:
+            self.screen = turtle.Screen()
+            self.screen.bgcolor("black")
+            self.screen.title("Mind-Blowing Infinite Geometry Animation")
+            self.screen.setup(width=1200, height=800)
+            self.screen.colormode(255)
+            self.screen.tracer(0)  # Turn off animation for faster drawing
+            canvas = self.screen.getcanvas()
+            xscale, yscale = self.screen.xscale, self.screen.yscale
+
+        # Rainbow colors by whole degree of hue, see get_rainbow_color
+        self.rainbow = rainbow_lut(360)
+
         # Animation parameters
         self.angle = 0
         self.size_factor = 1
         self.color_shift = 0
         self.pattern_phase = 0
-        
-    def setup_turtle(self, t):
-        """Configure turtle settings"""
-        t.speed(0)
-        t.pensize(2)
-        t.hideturtle()
-        
+
+        # Every pattern is a scene node that keeps its geometry and canvas lines between frames
+        # and is only rebuilt when the parameters it depends on change
+        self.scene = Scene(canvas, xscale, yscale)
+        nodes = [
+            ("spiraling polygons", lambda: (self.angle, self.size_factor, self.color_shift), self.spiraling_polygons),
+            ("fractal trees", lambda: (self.angle, self.color_shift), self.fractal_trees),
+            ("concentric circles", lambda: (self.angle, self.color_shift), self.concentric_circles),
+            ("rotating mandalas", lambda: (self.angle, self.color_shift), self.rotating_mandalas),
+            ("infinity loops", lambda: (self.angle, self.color_shift), self.infinity_loops),
+        ]
+        for name, params, build in nodes:
+            self.scene.add(SceneNode(name, params, build, width=2))
+
     def get_rainbow_color(self, offset=0):
-        """Generate rainbow colors based on time and offset"""
-        hue = (self.color_shift + offset) % 360
-        # Convert HSV to RGB
-        r = int(255 * (1 + math.cos(math.radians(hue))) / 2)
-        g = int(255 * (1 + math.cos(math.radians(hue + 120))) / 2)
-        b = int(255 * (1 + math.cos(math.radians(hue + 240))) / 2)
-        return (r, g, b)
-    
-    def draw_spiraling_polygons(self):
-        """Draw animated spiraling polygons"""
-        self.spiral_turtle.clear()
-        self.spiral_turtle.goto(0, 0)
-        
+        """Rainbow color based on time and offset (degrees of hue)"""
+        return self.rainbow[self.color_shift + offset]
+
+    def get_rainbow_colors(self, offsets):
+        """Rainbow colors for an array of offsets, as a list of (r, g, b) lists"""
+        return self.rainbow.lookup(np.asarray(offsets) + self.color_shift).tolist()
+
+    def spiraling_polygons(self):
+        """Animated spiraling polygons as (points, color) polylines"""
+        polylines = []
         num_polygons = 8
         for i in range(num_polygons):
             # Calculate dynamic parameters
             size = 50 + i * 20 * self.size_factor
             sides = 3 + i
             rotation = self.angle + i * 45
-            
-            # Set rainbow color
-            color = self.get_rainbow_color(i * 45)
-            self.spiral_turtle.pencolor(color)
-            
-            # Move to starting position
-            x = math.cos(math.radians(rotation)) * i * 30
-            y = math.sin(math.radians(rotation)) * i * 30
-            self.spiral_turtle.goto(x, y)
-            self.spiral_turtle.setheading(rotation)
-            
-            # Draw polygon
-            self.spiral_turtle.pendown()
-            for _ in range(sides):
-                self.spiral_turtle.forward(size)
-                self.spiral_turtle.right(360 / sides)
-            self.spiral_turtle.penup()
-    
-    def draw_fractal_tree(self):
-        """Draw animated fractal tree patterns"""
-        self.fractal_turtle.clear()
-        
-        # Draw multiple fractal trees
+
+            # Start position, then one side per heading turning right
+            start = np.array([math.cos(math.radians(rotation)), math.sin(math.radians(rotation))]) * i * 30
+            headings = np.radians(rotation - np.arange(sides) * 360 / sides)
+            steps = size * np.column_stack((np.cos(headings), np.sin(headings)))
+            points = np.vstack((start, start + np.cumsum(steps, axis=0)))
+            polylines.append((points, self.get_rainbow_color(i * 45)))
+        return polylines
+
+    def fractal_trees(self):
+        """Animated fractal trees as one (points, color) polyline per branch"""
+        # Grow all trees at once, four levels deep, each from its own position
         positions = [(200, -200), (-200, -200), (0, 150), (300, 0), (-300, 0)]
-        
-        for i, pos in enumerate(positions):
-            self.fractal_turtle.goto(pos)
-            self.fractal_turtle.setheading(90 + math.sin(self.angle * 0.02 + i) * 30)
-            
-            color = self.get_rainbow_color(i * 72)
-            self.fractal_turtle.pencolor(color)
-            
-            branch_length = 80 + math.sin(self.angle * 0.03 + i) * 20
-            self.draw_fractal_branch(branch_length, 4)
-    
-    def draw_fractal_branch(self, length, depth):
-        """Recursive fractal branch drawing"""
-        if depth == 0 or length < 5:
-            return
-        
-        self.fractal_turtle.pendown()
-        self.fractal_turtle.forward(length)
-        
-        # Right branch
-        self.fractal_turtle.right(30 + math.sin(self.angle * 0.01) * 15)
-        self.draw_fractal_branch(length * 0.7, depth - 1)
-        
-        # Left branch
-        self.fractal_turtle.left(60 + math.sin(self.angle * 0.01) * 30)
-        self.draw_fractal_branch(length * 0.7, depth - 1)
-        
-        # Return to original position and heading
-        self.fractal_turtle.right(30 + math.sin(self.angle * 0.01) * 15)
-        self.fractal_turtle.penup()
-        self.fractal_turtle.backward(length)
-    
-    def draw_concentric_circles(self):
-        """Draw animated concentric circles with varying patterns"""
-        self.circle_turtle.clear()
-        
+        x, y = zip(*positions)
+        headings = [90 + math.sin(self.angle * 0.02 + i) * 30 for i in range(len(positions))]
+        branch_lengths = [80 + math.sin(self.angle * 0.03 + i) * 20 for i in range(len(positions))]
+        branch_angle = 30 + math.sin(self.angle * 0.01) * 15
+        tree = grow_tree(x, y, headings, branch_lengths, 0.7, branch_angle, min_length=5, max_depth=4)
+
+        colors = self.get_rainbow_colors(tree["root"] * 72)
+        branches = tree["segments"].reshape(-1, 2, 2)
+        return list(zip(branches, colors))
+
+    def concentric_circles(self):
+        """Animated dashed concentric circles as (points, color) polylines, one per dash"""
         num_circles = 12
-        for i in range(num_circles):
-            # Calculate dynamic parameters
-            radius = 20 + i * 25
-            x_offset = math.cos(self.angle * 0.02 + i * 0.5) * 100
-            y_offset = math.sin(self.angle * 0.02 + i * 0.5) * 50
-            
-            # Set position
-            self.circle_turtle.goto(x_offset, y_offset - radius)
-            
-            # Set rainbow color
-            color = self.get_rainbow_color(i * 30)
-            self.circle_turtle.pencolor(color)
-            
-            # Draw circle with animated segments
-            self.circle_turtle.pendown()
-            segments = 36
-            segment_angle = 360 / segments
-            
-            for j in range(segments):
-                # Create pulsing effect
-                if (j + int(self.angle * 0.5)) % 6 < 3:
-                    self.circle_turtle.pendown()
-                else:
-                    self.circle_turtle.penup()
-                
-                arc_length = 2 * math.pi * radius / segments
-                self.circle_turtle.forward(arc_length)
-                self.circle_turtle.left(segment_angle)
-            
-            self.circle_turtle.penup()
-    
-    def draw_rotating_mandalas(self):
-        """Draw rotating mandala patterns"""
-        self.polygon_turtle.clear()
-        
-        centers = [(0, 0), (400, 200), (-400, 200), (400, -200), (-400, -200)]
-        
-        for center_idx, center in enumerate(centers):
-            self.polygon_turtle.goto(center)
-            
-            # Draw mandala layers
-            layers = 5
-            for layer in range(layers):
-                radius = 30 + layer * 25
-                petals = 6 + layer * 2
-                
-                for petal in range(petals):
-                    # Calculate petal position
-                    petal_angle = (360 / petals) * petal + self.angle + center_idx * 30
-                    x = center[0] + math.cos(math.radians(petal_angle)) * radius
-                    y = center[1] + math.sin(math.radians(petal_angle)) * radius
-                    
-                    # Move to petal position
-                    self.polygon_turtle.goto(x, y)
-                    self.polygon_turtle.setheading(petal_angle + 90)
-                    
-                    # Set color
-                    color = self.get_rainbow_color(petal * 15 + layer * 45 + center_idx * 72)
-                    self.polygon_turtle.pencolor(color)
-                    
-                    # Draw petal
-                    petal_size = 15 + math.sin(self.angle * 0.03 + petal) * 5
-                    self.polygon_turtle.pendown()
-                    for _ in range(3):  # Triangle petal
-                        self.polygon_turtle.forward(petal_size)
-                        self.polygon_turtle.right(120)
-                    self.polygon_turtle.penup()
-    
-    def draw_infinity_loops(self):
-        """Draw animated infinity symbol patterns"""
-        self.spiral_turtle.goto(0, 0)
-        
-        # Draw multiple infinity loops at different scales and orientations
+        i = np.arange(num_circles)
+        radius = 20 + i * 25
+        x_offset = np.cos(self.angle * 0.02 + i * 0.5) * 100
+        y_offset = np.sin(self.angle * 0.02 + i * 0.5) * 50
+
+        # Every circle is 36 straight segments turning left, starting at its bottom
+        segments = 36
+        headings = np.radians(np.arange(segments) * 360 / segments)
+        steps = 2 * math.pi / segments * np.column_stack((np.cos(headings), np.sin(headings)))
+        unit_circle = np.vstack(([0, 0], np.cumsum(steps, axis=0)))
+        starts = np.column_stack((x_offset, y_offset - radius))
+        vertices = starts[:, None] + radius[:, None, None] * unit_circle
+
+        # Create pulsing effect: runs of drawn segments, the same for every circle
+        shown = (np.arange(segments) + int(self.angle * 0.5)) % 6 < 3
+        edges = np.diff(np.concatenate(([0], shown.astype(np.int64), [0])))
+        runs = list(zip(np.flatnonzero(edges == 1), np.flatnonzero(edges == -1)))
+
+        polylines = []
+        for color, circle_vertices in zip(self.get_rainbow_colors(i * 30), vertices):
+            polylines.extend((circle_vertices[first:last + 1], color) for first, last in runs)
+        return polylines
+
+    def rotating_mandalas(self):
+        """Rotating mandala patterns as one closed triangle per petal"""
+        center, layer, petal, petals = mandala_petals.T
+        radius = 30 + layer * 25
+        petal_angle = (360 / petals) * petal + self.angle + center * 30
+
+        # Petal position, then three sides turning right by 120 degrees
+        radians = np.radians(petal_angle)
+        starts = mandala_centers[center] + radius[:, None] * np.column_stack((np.cos(radians), np.sin(radians)))
+        petal_size = 15 + np.sin(self.angle * 0.03 + petal) * 5
+        headings = np.radians(petal_angle[:, None] + 90 - np.array([0, 120, 240]))
+        steps = petal_size[:, None, None] * np.stack((np.cos(headings), np.sin(headings)), axis=-1)
+        points = np.concatenate((starts[:, None], starts[:, None] + np.cumsum(steps, axis=1)), axis=1)
+
+        colors = self.get_rainbow_colors(petal * 15 + layer * 45 + center * 72)
+        return list(zip(points, colors))
+
+    def infinity_loops(self):
+        """Animated infinity symbol patterns as (points, color) polylines"""
+        angle_rad = np.radians(np.arange(360) * 2)
+        polylines = []
+
+        # Every loop starts where the previous one ended, as one pen drew them all
+        start = np.zeros(2)
         for i in range(5):
             scale = 0.5 + i * 0.3
-            rotation = i * 36 + self.angle * 0.5
-            
-            color = self.get_rainbow_color(i * 72)
-            self.spiral_turtle.pencolor(color)
-            
-            # Save position
-            start_x, start_y = 0, 0
-            
-            # Draw infinity loop
-            self.spiral_turtle.pendown()
-            for t in range(360):
-                # Parametric infinity curve (lemniscate)
-                angle_rad = math.radians(t * 2)
-                r = scale * 100 / (1 + math.cos(angle_rad) ** 2)
-                x = r * math.cos(angle_rad) * math.cos(math.radians(rotation))
-                y = r * math.sin(angle_rad) * math.cos(angle_rad) * math.sin(math.radians(rotation)) + \
-                    r * math.cos(angle_rad) * math.sin(math.radians(rotation))
-                
-                self.spiral_turtle.goto(start_x + x, start_y + y)
-            
-            self.spiral_turtle.penup()
-    
+            rotation = math.radians(i * 36 + self.angle * 0.5)
+
+            # Parametric infinity curve (lemniscate)
+            r = scale * 100 / (1 + np.cos(angle_rad) ** 2)
+            x = r * np.cos(angle_rad) * math.cos(rotation)
+            y = r * np.sin(angle_rad) * np.cos(angle_rad) * math.sin(rotation) + \
+                r * np.cos(angle_rad) * math.sin(rotation)
+            points = np.vstack((start, np.column_stack((x, y))))
+            polylines.append((points, self.get_rainbow_color(i * 72)))
+            start = points[-1]
+        return polylines
+
+    def update_frame(self):
+        """Advance the animation by one frame and update the patterns of the current phase"""
+        # Update animation parameters
+        self.angle += 2
+        self.color_shift += 3
+        self.size_factor = 1 + 0.3 * math.sin(self.angle * 0.02)
+        self.pattern_phase += 1
+
+        # Cycle through different pattern combinations
+        pattern_cycle = (self.pattern_phase // 200) % 4
+        self.scene.update(pattern_cycles[pattern_cycle])
+
+        # Reset angle to prevent overflow
+        if self.angle > 36000:
+            self.angle = 0
+        if self.color_shift > 36000:
+            self.color_shift = 0
+
     def animate(self):
         """Main animation loop"""
         try:
             while True:
-                # Update animation parameters
-                self.angle += 2
-                self.color_shift += 3
-                self.size_factor = 1 + 0.3 * math.sin(self.angle * 0.02)
-                self.pattern_phase += 1
-                
-                # Cycle through different pattern combinations
-                pattern_cycle = (self.pattern_phase // 200) % 4
-                
-                if pattern_cycle == 0:
-                    self.draw_spiraling_polygons()
-                    self.draw_concentric_circles()
-                elif pattern_cycle == 1:
-                    self.draw_fractal_tree()
-                    self.draw_rotating_mandalas()
-                elif pattern_cycle == 2:
-                    self.draw_infinity_loops()
-                    self.draw_spiraling_polygons()
-                else:
-                    self.draw_rotating_mandalas()
-                    self.draw_concentric_circles()
-                    self.draw_fractal_tree()
-                
+                self.update_frame()
+
                 # Update screen
                 self.screen.update()
                 time.sleep(0.03)  # Control animation speed
-                
-                # Reset angle to prevent overflow
-                if self.angle > 36000:
-                    self.angle = 0
-                if self.color_shift > 36000:
-                    self.color_shift = 0
-                    
-        except turtle.Terminator:
+
+        except (turtle.Terminator, tkinter.TclError):
             pass
-    
+        print(self.scene.timing_report())
+
     def start_animation(self):
         """Start the infinite geometry animation"""
         print("Starting Mind-Blowing Infinite Geometry Animation!")
@@ -263,8 +211,19 @@ class InfiniteGeometry:
 
 def main():
     """Main function to run the infinite geometry animation"""
+    if "--headless" in sys.argv:
+        # Run one full pattern cycle without a window and save the last frame
+        geometry = InfiniteGeometry(headless=True)
+        for _ in range(200 * len(pattern_cycles)):
+            geometry.update_frame()
+        framebuffer = Framebuffer(1200, 800, background="black")
+        geometry.scene.render(framebuffer)
+        framebuffer.save("geometry.png")
+        print("Saved geometry.png")
+        print(geometry.scene.timing_report())
+        return
     geometry = InfiniteGeometry()
     geometry.start_animation()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
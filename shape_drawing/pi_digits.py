@@ -0,0 +1,148 @@
+"""
+Arbitrary-precision digits of pi for the pi visualizations.
+Digits come from the Chudnovsky series summed by binary splitting in decimal
+arithmetic and are streamed lazily. Given a cache_path they are also kept in an
+on-disk cache so restarts do not recompute them; without one nothing is written.
+"""
+
+import decimal
+import os
+import time
+
+#the Chudnovsky series gains about this many digits per term
+digits_per_term = 14.181647462725477
+#guard digits computed beyond the requested count and then dropped
+guard_digits = 10
+#suggested location of the digit cache (only used when passed as cache_path)
+default_cache_path = os.path.join(os.path.expanduser("~"), ".cache", "pi_digits.txt")
+
+
+def _context(precision):
+    return decimal.Context(prec=precision, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
+
+
+def _binary_split(a, b, exact):
+    # P, Q, T of the series terms a..b-1; products of Decimals are exact in `exact`
+    if b - a == 1:
+        if a == 0:
+            p = q = 1
+        else:
+            p = (6 * a - 5) * (2 * a - 1) * (6 * a - 1)
+            q = a * a * a * 10939058860032000
+        t = p * (13591409 + 545140134 * a)
+        if a & 1:
+            t = -t
+        return decimal.Decimal(p), decimal.Decimal(q), decimal.Decimal(t)
+
+    m = (a + b) // 2
+    p1, q1, t1 = _binary_split(a, m, exact)
+    p2, q2, t2 = _binary_split(m, b, exact)
+    return (exact.multiply(p1, p2), exact.multiply(q1, q2),
+            exact.add(exact.multiply(t1, q2), exact.multiply(p1, t2)))
+
+
+def _inverse_sqrt(value, precision):
+    # Newton iteration y <- y * (3 - value * y^2) / 2, doubling the precision each step
+    # (much faster than Context.sqrt at a million digits)
+    y = decimal.Decimal(1 / value ** 0.5)
+    value = decimal.Decimal(value)
+    current = 15
+    while current < precision:
+        current = min(2 * current, precision)
+        ctx = _context(current + guard_digits)
+        y = ctx.multiply(ctx.multiply(y, decimal.Decimal("0.5")),
+                         ctx.subtract(3, ctx.multiply(value, ctx.multiply(y, y))))
+    return y
+
+
+def compute_pi_digits(count):
+    """Return the first count digits of pi as a string without the decimal point ("31415...")"""
+    if count < 1:
+        raise ValueError("Digit count must be at least 1.")
+    precision = count + guard_digits
+    exact = _context(decimal.MAX_PREC)
+    exact.traps[decimal.Inexact] = True
+    _, q, t = _binary_split(0, int(precision / digits_per_term) + 2, exact)
+
+    # pi = 426880 * sqrt(10005) * Q / T = 426880 * 10005 * (1 / sqrt(10005)) * Q / T
+    ctx = _context(precision)
+    numerator = ctx.multiply(ctx.multiply(decimal.Decimal(426880 * 10005), _inverse_sqrt(10005, precision)), q)
+    pi = ctx.divide(numerator, t)
+    return str(pi).replace(".", "")[:count]
+
+
+def load_cached_digits(cache_path=None):
+    """Digits stored in the cache, or an empty string if there is no valid cache"""
+    if cache_path is None or not os.path.exists(cache_path):
+        return ""
+    with open(cache_path) as f:
+        digits = f.read().strip()
+    if not digits.startswith("31415") or not digits.isdigit():
+        return ""
+    return digits
+
+
+def _save_cached_digits(cache_path, digits):
+    if cache_path is None:
+        return
+    directory = os.path.dirname(cache_path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    # Write to a temporary file first so an interrupted run never leaves a truncated cache
+    temporary_path = cache_path + ".tmp"
+    with open(temporary_path, "w") as f:
+        f.write(digits)
+    os.replace(temporary_path, cache_path)
+
+
+def precompute_pi_digits(count, cache_path=None):
+    """Make sure the cache (if any) holds at least count digits and return the first count of them"""
+    digits = load_cached_digits(cache_path)
+    if len(digits) < count:
+        digits = compute_pi_digits(count)
+        _save_cached_digits(cache_path, digits)
+    return digits[:count]
+
+
+def pi_digit_stream(chunk_size=10000, cache_path=None, start=0):
+    """
+    Lazily yield the digits of pi ('3', '1', '4', ...) without end, starting at digit
+    index start. Cached digits are yielded first; whenever they run out the next chunk
+    is computed, at least doubling the known digits so the total work stays close to
+    one computation of the final length, and the cache is updated when cache_path is given.
+    """
+    digits = load_cached_digits(cache_path)
+    position = start
+    while True:
+        if position >= len(digits):
+            digits = precompute_pi_digits(max(position + chunk_size, 2 * len(digits)), cache_path)
+        end = len(digits)
+        for digit in digits[position:end]:
+            yield digit
+        position = end
+
+
+def pi_text_stream(chunk_size=10000, cache_path=None):
+    """Like pi_digit_stream but with the decimal point: '3', '.', '1', '4', ..."""
+    digits = pi_digit_stream(chunk_size, cache_path)
+    yield next(digits)
+    yield "."
+    yield from digits
+
+
+def benchmark_pi_digits(counts=(10**3, 10**4, 10**5, 10**6), repeat=1):
+    """Time compute_pi_digits (no cache) for increasing digit counts"""
+    results = []
+    for count in counts:
+        best = float("inf")
+        for _ in range(repeat):
+            start = time.perf_counter()
+            digits = compute_pi_digits(count)
+            best = min(best, time.perf_counter() - start)
+        results.append((count, best))
+        print(f"{count:>9} digits: {best:8.3f} s  ({count / best:,.0f} digits/s)  ...{digits[-10:]}")
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_pi_digits()
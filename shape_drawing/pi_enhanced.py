@@ -6,27 +6,45 @@ Features multiple visualization modes and improved visual effects
 import turtle
 import math
 import time
-import colorsys
 import random
+import os
+import sys
+from itertools import islice
+
+import matplotlib.pyplot as plt
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rendering.color_lut import hsv_lut
+from rendering.framebuffer import Framebuffer, to_rgba
+from rendering.glyph_atlas import GlyphAtlas
+from shape_drawing.pi_digits import default_cache_path, pi_text_stream
 
 class EnhancedPiVisualization:
-    def __init__(self):
-        self.screen = turtle.Screen()
-        self.screen.bgcolor("black")
-        self.screen.title("Enhanced Infinite Pi Visualization")
-        self.screen.setup(width=1000, height=1000)
-        self.screen.tracer(0)
-        
-        # Create multiple turtles for different effects
-        self.artist = turtle.Turtle()
-        self.artist.speed(0)
-        self.artist.penup()
-        self.artist.color("white")
-        
-        self.tracer = turtle.Turtle()  # For drawing connecting lines
-        self.tracer.speed(0)
-        self.tracer.pensize(1)
-        self.tracer.color("darkblue")
+    def __init__(self, render_mode="turtle"):
+        # "turtle" writes one digit at a time, "atlas" blits batches of digits
+        # from a glyph atlas into a framebuffer without opening a turtle window
+        self.render_mode = render_mode
+        if render_mode == "atlas":
+            self.framebuffer = Framebuffer(1000, 1000, background="black")
+            self.glyph_atlas = GlyphAtlas()
+        else:
+            self.screen = turtle.Screen()
+            self.screen.bgcolor("black")
+            self.screen.title("Enhanced Infinite Pi Visualization")
+            self.screen.setup(width=1000, height=1000)
+            self.screen.tracer(0)
+            
+            # Create multiple turtles for different effects
+            self.artist = turtle.Turtle()
+            self.artist.speed(0)
+            self.artist.penup()
+            self.artist.color("white")
+            
+            self.tracer = turtle.Turtle()  # For drawing connecting lines
+            self.tracer.speed(0)
+            self.tracer.pensize(1)
+            self.tracer.color("darkblue")
         
         # Animation parameters
         self.radius = 30
@@ -36,8 +54,8 @@ class EnhancedPiVisualization:
         self.digit_count = 0
         self.mode = "spiral"  # "spiral", "circle", "wave"
         
-        # Pi digits with higher precision
-        self.pi_string = self.get_extended_pi_digits()
+        # Pi digits, streamed with arbitrary precision
+        self.pi_digits = self.get_extended_pi_digits()
         self.current_index = 0
         
         # Visual effects
@@ -45,44 +63,23 @@ class EnhancedPiVisualization:
         self.show_connections = True
         self.fade_effect = True
         self.previous_positions = []
+        self.rng = np.random.default_rng()
+        
+        # Digits drawn so far by the batched renderer, kept for re-layout on mode changes
+        self.shown_digits = []
+        self.last_position = None
         
         # Animation speed
         self.delay = 0.05
         
     def get_extended_pi_digits(self):
-        """Extended pi digits for longer animation"""
-        return ("3.1415926535897932384626433832795028841971693993751058209749445923"
-               "0781640628620899862803482534211706798214808651328230664709384460955"
-               "0582231725359408128481117450284102701938521105559644622948954930381"
-               "9644288109756659334461284756482337867831652712019091456485669234603"
-               "4861045432664821339360726024914127372458700660631558817488152092096"
-               "2829254091715364367892590360011330530548820466521384146951941511609"
-               "4330572703657595919530921861173819326117931051185480744623799627495"
-               "6735188575272489122793818301194912983367336244065664308602139494639"
-               "5224737190702179860943702770539217176293176752384674818467669405132"
-               "0005681271452635608277857713427577896091736371787214684409012249534"
-               "3014654958537105079227968925894234201995611212902196086403441815981"
-               "3629774771309960518707211349999998372978049951059731732816096318595"
-               "0244594553469083026425223082533446850352619311881710100031378387528"
-               "8658753320838142061717766914730359825349042875546873115956286388235"
-               "3787593751957781857780532171226806613001927876611195909216420198938"
-               "3676362596148330440022572010654858632788659361533818279682303019520"
-               "3530185296897572362259941389124972177528347913151574857242454150695"
-               "9508295331168617278558890750983817546374649393192550604009277016711"
-               "3900984882401285836160356370766010471018194295559619894676783744944"
-               "8255379774726847104047534646208046684259069491293313677028998915210"
-               "4752162056966024058038150193511253382430035587640247496473263914199"
-               "2726042699227967823547816360093417216412199245863150302861829745557")
+        """Endless stream of pi characters, computed in chunks and cached in default_cache_path"""
+        return pi_text_stream(cache_path=default_cache_path)
     
     def generate_rainbow_colors(self, num_colors):
-        """Generate rainbow colors for digits"""
-        colors = []
-        for i in range(num_colors):
-            hue = i / num_colors
-            # Use HSV color space for vibrant colors
-            rgb = colorsys.hsv_to_rgb(hue, 0.9, 1.0)
-            colors.append(rgb)
-        return colors
+        """Generate rainbow colors for digits, from a shared lookup table"""
+        # Use HSV color space for vibrant colors
+        return list(hsv_lut(num_colors, 0.9, 1.0).colors)
     
     def get_digit_color(self, digit):
         """Get color for digit with some randomization for visual appeal"""
@@ -134,10 +131,9 @@ class EnhancedPiVisualization:
             y = 0
         return x, y
     
-    def draw_digit_with_effects(self, x, y, digit, index):
-        """Draw digit with various visual effects"""
-        self.artist.goto(x, y)
-        self.artist.color(self.get_digit_color(digit))
+    def get_digit_style(self, digit, index):
+        """Color and font size of a digit"""
+        color = self.get_digit_color(digit)
         
         # Variable font size based on digit value and position
         if digit.isdigit():
@@ -150,9 +146,16 @@ class EnhancedPiVisualization:
         
         # Add glow effect for special digits
         if digit in ['3', '1', '4', '1', '5', '9']:  # First few digits of pi
-            self.artist.color("gold")
+            color = "gold"
             font_size += 2
         
+        return color, font_size
+    
+    def draw_digit_with_effects(self, x, y, digit, index):
+        """Draw digit with various visual effects"""
+        color, font_size = self.get_digit_style(digit, index)
+        self.artist.goto(x, y)
+        self.artist.color(color)
         self.artist.write(digit, align="center", font=("Arial", font_size, "bold"))
         
         # Store position for connecting lines
@@ -214,9 +217,7 @@ class EnhancedPiVisualization:
         self.screen.onkey(self.speed_up, "f")
         self.screen.listen()
         
-        while self.current_index < len(self.pi_string):
-            current_digit = self.pi_string[self.current_index]
-            
+        for current_digit in self.pi_digits:
             # Calculate position based on current mode
             x, y = self.calculate_position(self.current_index, current_digit)
             
@@ -240,7 +241,150 @@ class EnhancedPiVisualization:
         print(f"Animation complete! Displayed {self.digit_count} digits of π")
         print("Click anywhere to close the window.")
         self.screen.exitonclick()
+
+    def layout_digits(self, digits, start_index=0, spiral_start=(0, 30)):
+        """
+        Vectorized layout of many digits in the current mode, matching calculate_position,
+        get_digit_style and update_animation_parameters applied digit by digit.
+        
+        Args:
+            digits (str): Characters to lay out.
+            start_index (int): Index of the first character in the pi stream.
+            spiral_start (tuple): Spiral (angle, radius) of the first character.
+        
+        Returns:
+            tuple: x and y arrays, font size array, (N, 4) RGBA color array and
+                   the spiral (angle, radius) following the last character.
+        """
+        # Characters become table indices: 0-9 for digits, 10 for anything else (the decimal point)
+        codes = np.frombuffer("".join(digits).encode("ascii"), dtype=np.uint8).astype(np.int64) - ord("0")
+        is_digit = (codes >= 0) & (codes <= 9)
+        codes = np.where(is_digit, codes, 10)
+        index = start_index + np.arange(len(codes))
+        next_spiral = spiral_start
+        
+        if self.mode == "circle":
+            # 36 digits per ring, 10 degrees apart, rings 25 apart
+            angles = np.radians(index % 36 * 10)
+            radii = 50 + index // 36 * 25
+            xs, ys = radii * np.cos(angles), radii * np.sin(angles)
+        elif self.mode == "wave":
+            xs = (index * 5 - 400).astype(np.float64)
+            ys = np.where(is_digit, codes * 20 - 100, 0).astype(np.float64)
+        else:
+            # The angle grows until it reaches 360, then restarts at 0 on a wider ring
+            start_angle, start_radius = spiral_start
+            first_ring = int(np.ceil((360 - start_angle) / self.angle_increment))
+            per_ring = int(np.ceil(360 / self.angle_increment))
+            step = np.arange(len(codes) + 1)
+            later = np.maximum(step - first_ring, 0)
+            in_first_ring = step < first_ring
+            angles = np.where(in_first_ring, start_angle + step * self.angle_increment,
+                              later % per_ring * self.angle_increment)
+            radii = np.where(in_first_ring, start_radius,
+                             start_radius + (later // per_ring + 1) * self.radius_increment)
+            next_spiral = (angles[-1], radii[-1])
+            xs = radii[:-1] * np.cos(np.radians(angles[:-1]))
+            ys = radii[:-1] * np.sin(np.radians(angles[:-1]))
+        
+        # Font sizes and colors, see get_digit_style, looked up in per-character tables
+        special = np.zeros(11, dtype=bool)
+        special[[3, 1, 4, 5, 9]] = True
+        size_table = np.append(np.arange(10, 20), 20) + np.where(special, 2, 0)
+        sizes = size_table[codes] + np.where(is_digit, index % 5, 0)
+        
+        color_table = np.vstack((np.asarray(self.colors), (0, 0, 0))).astype(np.float32)
+        variation = self.rng.random((len(codes), 3), dtype=np.float32)
+        variation *= 0.2
+        variation += color_table[codes] - 0.1
+        colors = np.empty((len(codes), 4), dtype=np.uint8)
+        colors[:, :3] = np.rint(np.clip(variation, 0, 1) * 255)
+        colors[:, 3] = 255
+        colors[~is_digit] = to_rgba("white")
+        colors[special[codes]] = to_rgba("gold")
+        return xs, ys, sizes, colors, next_spiral
     
+    def layout_batch(self, digits):
+        """Positions, font sizes and RGBA colors of the next digits, advancing the layout state"""
+        xs, ys, sizes, colors, (self.current_angle, self.radius) = self.layout_digits(
+            digits, self.current_index, (self.current_angle, self.radius))
+        self.current_index += len(digits)
+        return xs, ys, sizes, colors
+    
+    def relayout(self):
+        """Redraw every digit shown so far in the current mode, in one layout call"""
+        digits = "".join(self.shown_digits)
+        self.framebuffer.clear()
+        self.current_index = 0
+        self.current_angle, self.radius = 0, 30
+        if digits:
+            xs, ys, sizes, colors = self.layout_batch(digits)
+            if self.show_connections:
+                self.framebuffer.polyline(np.column_stack((xs, ys)), "#00008b")
+            self.glyph_atlas.draw(self.framebuffer, digits, xs, ys, sizes, colors)
+            self.last_position = (xs[-1], ys[-1])
+    
+    def animate_pi_digits_atlas(self, target_fps=30, digits_per_frame=2000, max_frames=None, frame_pattern=None):
+        """
+        Batched animation loop: every frame blits digits_per_frame digits from the glyph
+        atlas into the framebuffer. Frames are paced by target_fps and either shown in a
+        matplotlib window or saved to frame_pattern (e.g. "pi_{:04d}.png").
+        """
+        print(f"Starting batched Pi Visualization - Mode: {self.mode}, "
+              f"{digits_per_frame} digits/frame at {target_fps} fps")
+
+        image = None
+        self.running = True
+        if frame_pattern is None:
+            fig, ax = plt.subplots(figsize=(8, 8))
+            ax.set_axis_off()
+            image = ax.imshow(self.framebuffer.pixels)
+            keys = {"q": self.quit_animation, "m": self.change_mode, "c": self.toggle_connections}
+            fig.canvas.mpl_connect("key_press_event",
+                                   lambda event: keys[event.key]() if event.key in keys else None)
+            print("Controls: 'q' - Quit, 'm' - Change mode, 'c' - Toggle connections")
+
+        frame_interval = 1.0 / target_fps
+        start_time = time.perf_counter()
+        next_frame = start_time
+        frame = 0
+        while self.running and (max_frames is None or frame < max_frames):
+            digits = list(islice(self.pi_digits, digits_per_frame))
+            if not digits:
+                break
+            xs, ys, sizes, colors = self.layout_batch(digits)
+            self.shown_digits.append("".join(digits))
+
+            if self.show_connections:
+                points = np.column_stack((xs, ys))
+                if self.last_position is not None:
+                    points = np.vstack((self.last_position, points))
+                self.framebuffer.polyline(points, "#00008b")
+            self.last_position = (xs[-1], ys[-1])
+            self.glyph_atlas.draw(self.framebuffer, digits, xs, ys, sizes, colors)
+            self.digit_count += len(digits)
+            frame += 1
+
+            if frame_pattern is not None:
+                self.framebuffer.save(frame_pattern.format(frame))
+            else:
+                image.set_data(self.framebuffer.pixels)
+                plt.pause(0.001)
+                if not plt.fignum_exists(fig.number):
+                    break
+
+            # Sleep until the next frame is due; when running behind, drop the backlog
+            next_frame += frame_interval
+            remaining = next_frame - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+            else:
+                next_frame = time.perf_counter()
+
+        elapsed = time.perf_counter() - start_time
+        print(f"Displayed {self.digit_count} digits in {frame} frames "
+              f"({frame / elapsed:.1f} fps, {self.digit_count / elapsed:,.0f} digits/s)")
+
     def update_animation_parameters(self):
         """Update animation parameters based on current mode"""
         if self.mode == "spiral":
@@ -260,6 +404,10 @@ class EnhancedPiVisualization:
         if self.mode == "spiral":
             self.radius = 30
             self.current_angle = 0
+        
+        # The batched renderer lays out all digits shown so far again in the new mode
+        if self.render_mode == "atlas":
+            self.relayout()
     
     def toggle_connections(self):
         """Toggle connection lines between digits"""
@@ -279,13 +427,20 @@ class EnhancedPiVisualization:
     def quit_animation(self):
         """Quit the animation"""
         print("Animation stopped by user.")
-        self.screen.bye()
+        if self.render_mode == "atlas":
+            self.running = False
+        else:
+            self.screen.bye()
     
     def run(self):
         """Start the enhanced visualization"""
         print("Enhanced Pi Infinite Value Visualization")
         print("="*40)
         
+        if self.render_mode == "atlas":
+            self.animate_pi_digits_atlas()
+            return
+        
         # Draw central display
         self.draw_central_display()
         
@@ -305,8 +460,9 @@ def main():
         print("3. Wave pattern")
         
         choice = input("Enter choice (1-3, or press Enter for spiral): ").strip()
+        batched = input("Use fast batched rendering (glyph atlas)? (y/N): ").strip().lower() == "y"
         
-        visualization = EnhancedPiVisualization()
+        visualization = EnhancedPiVisualization("atlas" if batched else "turtle")
         
         if choice == "2":
             visualization.mode = "circle"
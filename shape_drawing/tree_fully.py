@@ -1,70 +1,146 @@
 import turtle
+import os
+import sys
 
-tina = turtle.Turtle()
-tina.shape('turtle')
-tina.speed(0)  # Reduced speed to see the drawing process (1-10, where 1 is slowest)
-tina.setheading(90)
-tina.penup()
-tina.backward(200)
-tina.pendown()
-tina.getscreen().colormode(255)
-tina.hideturtle()
-tina.tracer(0) #to enable animation - this was making it draw instantly
+import numpy as np
 
-def branch(d, a, s, cutoff=5):
-    if d > cutoff:
-        tina.right(a)
-        tina.forward(d)
-        branch(s * d, a, s, cutoff=cutoff)
-        tina.backward(d)
-        tina.left(a)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rendering.fractal_tree import grow_tree
+from rendering.framebuffer import Framebuffer
 
-        tina.left(a)
-        tina.forward(d)
-        branch(s * d, a, s, cutoff=cutoff)
-        tina.backward(d)
-        tina.right(a)
 
+def _grow(x, y, heading, d, right_angle, left_angle, s, cutoff):
+    # Both first branches start at the turtle; a branch of length d is drawn only if d > cutoff
+    return grow_tree(x, y, [heading - right_angle, heading + left_angle], d, s, left_angle, right_angle,
+                     min_length=np.nextafter(cutoff, np.inf))
 
-def colorbranch(d, a, s, cutoff=5, color=(0,0,0)):
-    tina.pencolor(color)
-    if d > cutoff:
-        tina.right(a)
-        tina.forward(d)
-        colorbranch(s * d, a, s, cutoff=cutoff, color=( int(color[0]-d)%255, color[1], color[2]))
-        tina.backward(d)
-        tina.left(a)
 
-        tina.left(a)
-        tina.forward(d)
-        colorbranch(s * d, a, s, cutoff=cutoff, color=( color[0], int(color[1]-d)%255, color[2]))
-        tina.backward(d)
-        tina.right(a)
+def _leaf_color(d, color, s, cutoff):
+    # Color of the last call of a subtree: the recursion ends by following left branches,
+    # each of which lowers green by the current d
+    d = np.array(d, dtype=np.float64)
+    color = np.array(color)
+    while True:
+        active = d > cutoff
+        if not active.any():
+            return color
+        color[active, 1] = np.trunc(color[active, 1] - d[active]).astype(np.int64) % 255
+        d = np.where(active, s * d, d)
 
 
-def skewcolorbranch(d, a, s, cutoff=5, color=(0,0,0)):
-    tina.pencolor(color)
-    if d > cutoff:
-        tina.right(a*1.5)
-        tina.forward(d)
-        skewcolorbranch(s * d, a, s, cutoff=cutoff, color=( int(color[0]-d)%255, color[1], color[2]))
+def _branch_colors(tree, d, s, cutoff, color):
+    """
+    Per branch: the color passed to the call at its end (right branches lower red by the
+    length, left branches lower green) and the color of the last call below that end.
+    """
+    count = len(tree["length"])
+    side = np.where(tree["side"] < 0, tree["root"], tree["side"])
+    end_color = np.zeros((count, 3), dtype=np.int64)
+    for level in range(int(tree["level"].max()) + 1 if count else 0):
+        index = np.flatnonzero(tree["level"] == level)
+        parent = tree["parent"][index]
+        spawn = np.where((parent >= 0)[:, None], end_color[np.maximum(parent, 0)], color)
+        channel = np.where(side[index] == 0, 0, 1)
+        spawn[np.arange(len(index)), channel] = np.trunc(
+            spawn[np.arange(len(index)), channel] - tree["length"][index]).astype(np.int64) % 255
+        end_color[index] = spawn
+    last_color = _leaf_color(s * tree["length"], end_color, s, cutoff)
+    return side, end_color, last_color
+
+
+def branch_segments(x, y, heading, d, a, s, cutoff=5):
+    """Segments drawn by branch from (x, y) facing heading, as an (N, 4) array"""
+    return _grow(x, y, heading, d, a, a, s, cutoff)["segments"]
+
+
+def colorbranch_segments(x, y, heading, d, a, s, cutoff=5, color=(0,0,0)):
+    """
+    Segments and colors drawn by colorbranch. The recursive version went back over every
+    branch with the pen down, so a branch ends up in the color of the last call below it.
+    """
+    tree = _grow(x, y, heading, d, a, a, s, cutoff)
+    _, _, last_color = _branch_colors(tree, d, s, cutoff, color)
+    return tree["segments"], last_color
+
+
+def skewcolorbranch_segments(x, y, heading, d, a, s, cutoff=5, color=(0,0,0)):
+    """
+    Segments and colors drawn by skewcolorbranch. A right branch is drawn in the color of
+    its call, a left branch in the color of the last call below its right sibling.
+    """
+    tree = _grow(x, y, heading, d, a * 1.5, a / 1.5, s, cutoff)
+    side, end_color, last_color = _branch_colors(tree, d, s, cutoff, color)
+
+    # Right sibling of every branch: same parent (roots share the virtual parent -1)
+    index = np.arange(len(side))
+    right_child = np.full(len(side) + 1, -1)
+    right_child[tree["parent"][side == 0] + 1] = index[side == 0]
+    sibling = right_child[tree["parent"] + 1]
+
+    parent = tree["parent"]
+    call_color = np.where((parent >= 0)[:, None], end_color[np.maximum(parent, 0)], color)
+    colors = np.where((side == 0)[:, None], call_color, last_color[sibling])
+    return tree["segments"], colors
+
+
+def _draw_segments(segments, colors=None):
+    # Draw from arrays, then put the turtle back where it started like the recursion did
+    position, heading, pen_down = tina.position(), tina.heading(), tina.isdown()
+    tina.penup()
+    for i, (x1, y1, x2, y2) in enumerate(segments):
+        if colors is not None:
+            tina.pencolor(tuple(int(c) for c in colors[i]))
+        tina.goto(x1, y1)
+        tina.pendown()
+        tina.goto(x2, y2)
         tina.penup()
-        tina.backward(d)
+    tina.goto(position)
+    tina.setheading(heading)
+    if pen_down:
         tina.pendown()
-        tina.left(a*1.5)
 
-        tina.left(a/1.5)
-        tina.forward(d)
-        skewcolorbranch(s * d, a, s, cutoff=cutoff, color=( color[0], int(color[1]-d)%255, color[2]))
+
+def branch(d, a, s, cutoff=5):
+    x, y = tina.position()
+    _draw_segments(branch_segments(x, y, tina.heading(), d, a, s, cutoff=cutoff))
+
+
+def colorbranch(d, a, s, cutoff=5, color=(0,0,0)):
+    x, y = tina.position()
+    _draw_segments(*colorbranch_segments(x, y, tina.heading(), d, a, s, cutoff=cutoff, color=color))
+    # Leave the pen in the color of the last call, as the recursive version did
+    tina.pencolor(tuple(int(c) for c in _leaf_color([d], [color], s, cutoff)[0]))
+
+
+def skewcolorbranch(d, a, s, cutoff=5, color=(0,0,0)):
+    x, y = tina.position()
+    _draw_segments(*skewcolorbranch_segments(x, y, tina.heading(), d, a, s, cutoff=cutoff, color=color))
+    tina.pencolor(tuple(int(c) for c in _leaf_color([d], [color], s, cutoff)[0]))
+
+
+if __name__ == "__main__":
+    if "--headless" in sys.argv:
+        framebuffer = Framebuffer(800, 800)
+        segments, colors = skewcolorbranch_segments(0, -100, 90, 80, 30, .8, cutoff=5)
+        framebuffer.lines(segments, colors)
+        framebuffer.lines([(0, -200, 0, -100)], tuple(int(c) for c in _leaf_color([80], [(0, 0, 0)], .8, 5)[0]))
+        framebuffer.save("tree_fully.png")
+        print("Saved tree_fully.png")
+    else:
+        tina = turtle.Turtle()
+        tina.shape('turtle')
+        tina.speed(0)  # Reduced speed to see the drawing process (1-10, where 1 is slowest)
+        tina.setheading(90)
         tina.penup()
-        tina.backward(d)
+        tina.backward(200)
         tina.pendown()
-        tina.right(a/1.5)
-
+        tina.getscreen().colormode(255)
+        tina.hideturtle()
+        tina.getscreen().tracer(0) #to enable animation - this was making it draw instantly
 
-tina.forward(100)
-skewcolorbranch(80, 30, .8, cutoff=5)
-tina.backward(100)
-# Removed getscreen().update() since we're not using tracer(0) anymore
+        tina.forward(100)
+        skewcolorbranch(80, 30, .8, cutoff=5)
+        tina.backward(100)
+        tina.getscreen().update()
 
-tina.getscreen().exitonclick()
\ No newline at end of file
+        tina.getscreen().exitonclick()
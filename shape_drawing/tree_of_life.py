@@ -2,260 +2,67 @@
 
 
 import turtle as tu
-
-
-roo = tu.Turtle() #Turtle object
-wn = tu.Screen() #Screen Object
-wn.bgcolor("black") #Screen Bg color
-wn.title("Fractal Tree Pattern")
-roo.left(90) #moving the turtle 90 degrees towards left
-roo.speed(20)#setting the speed of the turtle
-
-
-def  draw(l): #recursive function taking length 'l' as argument
-    if(l<10):
-        return
-    else:
-
-        roo.pensize(2) #Setting Pensize
-        roo.pencolor("yellow") #Setting Pencolor as yellow
-        roo.forward(l) #moving turtle forward by 'l'
-        roo.left(30) #moving the turtle 30 degrees towards left
-        draw(3*l/4) #drawing a fractal on the left of the turtle object 'roo' with 3/4th of its length
-        roo.right(60) #moving the turtle 60 degrees towards right
-        draw(3*l/4) #drawing a fractal on the right of the turtle object 'roo' with 3/4th of its length
-        roo.left(30) #moving the turtle 30 degrees towards left
-        roo.pensize(2)
-        roo.backward(l) #returning the turtle back to its original psition
-
-draw (20) # drawing 20 times 
-
-roo.right(90)
-roo.speed(2000)
-
-#recursion
-def  draw(l):
-    if(l<10):
-        return
-    else:
-        roo.pensize(2)
-        roo.pencolor("magenta") #magenta
-        roo.forward(l)
-        roo.left(30)
-        draw(3*l/4)
-        roo.right(60)
-        draw(3*l/4)
-        roo.left(30)
-        roo.pensize(2)
-        roo.backward(l)
-
-draw (20)
-
-
-roo.left(270)
-roo.speed(2000)
-
-#recursion
-def  draw(l):
-    if(l<10):
-        return
-    else:
-        roo.pensize(2)
-        roo.pencolor("red") #red
-        roo.forward(l)
-        roo.left(30)
-        draw(3*l/4)
-        roo.right(60)
-        draw(3*l/4)
-        roo.left(30)
-        roo.pensize(2)
-        roo.backward(l)
-
-draw (20)
-
-roo.right(90)
-roo.speed(2000)
-
-#recursion
-def  draw(l):
-    if(l<10):
-        return
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from rendering.fractal_tree import fractal_tree
+from rendering.framebuffer import Framebuffer
+
+#(pen color, pen size, trunk length, length factor, heading) of every tree, drawn in this order
+trees = [
+    ("yellow", 2, 20, 3/4, 90),
+    ("magenta", 2, 20, 3/4, 0),
+    ("red", 2, 20, 3/4, 270),
+    ('#FFF8DC', 2, 20, 3/4, 180), #white
+    ("lightgreen", 3, 40, 4/5, 180),
+    ("red", 3, 40, 4/5, 90),
+    ("yellow", 3, 40, 4/5, 0),
+    ('#FFF8DC', 3, 40, 4/5, 270), #white
+    ("cyan", 2, 60, 6/7, 270),
+    ("yellow", 2, 60, 6/7, 180),
+    ("magenta", 2, 60, 6/7, 90),
+    ('#FFF8DC', 2, 60, 6/7, 0), #white
+]
+
+
+def tree_segments(length, factor, heading):
+    """
+    Branches of one tree as an (N, 4) array. Every branch splits 30 degrees left and right
+    into branches factor times as long, and branches shorter than 10 are not drawn.
+    """
+    segments, _ = fractal_tree(0, 0, heading, length, factor, 30, min_length=10)
+    return segments
+
+
+def draw(turtle_object, segments):
+    """Draw all segments with the turtle's current pen"""
+    for x1, y1, x2, y2 in segments:
+        turtle_object.penup()
+        turtle_object.goto(x1, y1)
+        turtle_object.pendown()
+        turtle_object.goto(x2, y2)
+    turtle_object.penup()
+
+
+if __name__ == "__main__":
+    if "--headless" in sys.argv:
+        framebuffer = Framebuffer(600, 600, background="black")
+        for color, _, length, factor, heading in trees:
+            framebuffer.lines(tree_segments(length, factor, heading), color)
+        framebuffer.save("tree_of_life.png")
+        print("Saved tree_of_life.png")
     else:
-        roo.pensize(2)
-        roo.pencolor('#FFF8DC') #white
-        roo.forward(l)
-        roo.left(30)
-        draw(3*l/4)
-        roo.right(60)
-        draw(3*l/4)
-        roo.left(30)
-        roo.pensize(2)
-        roo.backward(l)
-
-draw(20)
-########################################################
-
-def  draw(l):
-    if(l<10):
-        return
-    else:
-
-        roo.pensize(3)
-        roo.pencolor("lightgreen") #lightgreen
-        roo.forward(l)
-        roo.left(30)
-        draw(4*l/5)
-        roo.right(60)
-        draw(4*l/5)
-        roo.left(30)
-        roo.pensize(3)
-        roo.backward(l)
-
-draw (40)
-
-roo.right(90)
-roo.speed(2000)
-
-#recursion
-def  draw(l):
-    if(l<10):
-        return
-    else:
-        roo.pensize(3)
-        roo.pencolor("red") #red
-        roo.forward(l)
-        roo.left(30)
-        draw(4*l/5)
-        roo.right(60)
-        draw(4*l/5)
-        roo.left(30)
-        roo.pensize(3)
-        roo.backward(l)
-
-draw (40)
-
-
-roo.left(270)
-roo.speed(2000)
-
-#recursion
-def  draw(l):
-    if(l<10):
-        return
-    else:
-        roo.pensize(3)
-        roo.pencolor("yellow") #yellow
-        roo.forward(l)
-        roo.left(30)
-        draw(4*l/5)
-        roo.right(60)
-        draw(4*l/5)
-        roo.left(30)
-        roo.pensize(3)
-        roo.backward(l)
-
-draw (40)
-
-roo.right(90)
-roo.speed(2000)
-
-#recursion
-def  draw(l):
-    if(l<10):
-        return
-    else:
-        roo.pensize(3)
-        roo.pencolor('#FFF8DC') #white
-        roo.forward(l)
-        roo.left(30)
-        draw(4*l/5)
-        roo.right(60)
-        draw(4*l/5)
-        roo.left(30)
-        roo.pensize(3)
-        roo.backward(l)
-
-draw (40)
-
-########################################################
-def  draw(l):
-    if(l<10):
-        return
-    else:
-        
-        roo.pensize(2)
-        roo.pencolor("cyan") #cyan
-        roo.forward(l)
-        roo.left(30)
-        draw(6*l/7)
-        roo.right(60)
-        draw(6*l/7)
-        roo.left(30)
-        roo.pensize(2)
-        roo.backward(l)
-        
-draw (60)
-
-roo.right(90)
-roo.speed(2000)
-
-#recursion
-def  draw(l):
-    if(l<10):
-        return
-    else:
-        roo.pensize(2)
-        roo.pencolor("yellow") #yellow
-        roo.forward(l)
-        roo.left(30)
-        draw(6*l/7)
-        roo.right(60)
-        draw(6*l/7)
-        roo.left(30)
-        roo.pensize(2)
-        roo.backward(l)
-        
-draw (60)
-
-
-roo.left(270)
-roo.speed(2000)
-
-#recursion
-def  draw(l):
-    if(l<10):
-        return
-    else:
-        roo.pensize(2)
-        roo.pencolor("magenta") #magenta
-        roo.forward(l)
-        roo.left(30)
-        draw(6*l/7)
-        roo.right(60)
-        draw(6*l/7)
-        roo.left(30)
-        roo.pensize(2)
-        roo.backward(l)
-        
-draw (60)
-
-roo.right(90)
-roo.speed(2000)
-
-#recursion
-def  draw(l):
-    if(l<10):
-        return
-    else:   
-        roo.pensize(2)
-        roo.pencolor('#FFF8DC') #white
-        roo.forward(l)
-        roo.left(30)
-        draw(6*l/7)
-        roo.right(60)
-        draw(6*l/7)
-        roo.left(30)
-        roo.pensize(2)
-        roo.backward(l)
-draw(60)
-wn.exitonclick()
\ No newline at end of file
+        roo = tu.Turtle() #Turtle object
+        wn = tu.Screen() #Screen Object
+        wn.bgcolor("black") #Screen Bg color
+        wn.title("Fractal Tree Pattern")
+        wn.tracer(0) #draw every tree at once
+        roo.hideturtle()
+
+        for color, pensize, length, factor, heading in trees:
+            roo.pensize(pensize)
+            roo.pencolor(color)
+            draw(roo, tree_segments(length, factor, heading))
+        wn.update()
+        wn.exitonclick()